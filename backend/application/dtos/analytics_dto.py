@@ -0,0 +1,44 @@
+from typing import Any, Dict, List, Optional
+from ...domain.entities.analytics import CreatorAnalytics, VideoAnalytics
+from .base import ResponseStruct
+
+
+class TrackViewResult(ResponseStruct):
+    success: bool = True
+    analytics: Optional[VideoAnalytics] = None
+    queued: bool = False
+
+
+class TrackEngagementResult(ResponseStruct):
+    analytics: VideoAnalytics
+    success: bool = True
+
+
+class DashboardKeyMetrics(ResponseStruct):
+    total_views: int = 0
+    total_revenue: float = 0.0
+    follower_growth: int = 0
+    engagement_rate: float = 0.0
+
+
+class DashboardResult(ResponseStruct):
+    current_month: Optional[CreatorAnalytics]
+    last_month: Optional[CreatorAnalytics]
+    monthly_growth_rate: float
+    trending_videos: List[VideoAnalytics]
+    views_time_series: List[Dict[str, Any]]
+    key_metrics: DashboardKeyMetrics
+    success: bool = True
+
+
+class TrendingContentResult(ResponseStruct):
+    trending_content: List[Dict[str, Any]]
+    content_type: str
+    time_period: str
+    success: bool = True
+
+
+class TrendingCreatorsResult(ResponseStruct):
+    trending_creators: List[CreatorAnalytics]
+    time_period: str
+    success: bool = True
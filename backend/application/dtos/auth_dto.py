@@ -1,8 +1,9 @@
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import EmailStr, field_validator
 from ..utils.sanitization import sanitize_input, MAX_USERNAME_LENGTH
+from .base import RequestModel, ResponseStruct
 
 
-class RegisterRequestDTO(BaseModel):
+class RegisterRequestDTO(RequestModel):
     username: str
     email: EmailStr
     password: str
@@ -19,33 +20,33 @@ class RegisterRequestDTO(BaseModel):
         return sanitize_input(v.strip())
 
 
-class LoginRequestDTO(BaseModel):
+class LoginRequestDTO(RequestModel):
     email: EmailStr
     password: str
 
 
-class TokenResponseDTO(BaseModel):
+class TokenResponseDTO(ResponseStruct):
     access_token: str
     token_type: str = "bearer"
 
 
-class UserResponseDTO(BaseModel):
+class UserResponseDTO(ResponseStruct):
     id: str
     username: str
     email: str
     is_active: bool
 
 
-class LoginResponseDTO(BaseModel):
+class LoginResponseDTO(ResponseStruct):
     access_token: str
-    token_type: str = "bearer"
     user: UserResponseDTO
+    token_type: str = "bearer"
 
 
-class PasswordResetRequestDTO(BaseModel):
+class PasswordResetRequestDTO(RequestModel):
     email: EmailStr
 
 
-class PasswordResetConfirmDTO(BaseModel):
+class PasswordResetConfirmDTO(RequestModel):
     token: str
     new_password: str
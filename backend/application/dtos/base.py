@@ -0,0 +1,32 @@
+import msgspec
+from pydantic import BaseModel, ConfigDict
+
+
+class ResponseStruct(msgspec.Struct, frozen=True, gc=False):
+    """Base class for response-only DTOs.
+
+    Response DTOs are built from trusted internal data (DB rows, service
+    outputs), so they skip Pydantic validation and are encoded straight to
+    JSON with msgspec. Request DTOs stay on Pydantic for input validation.
+
+    Values derived from other fields should be a functools.cached_property
+    on a subclass declared with ``dict=True`` (slotted structs have no
+    ``__dict__`` to cache into), so they are computed once per instance.
+    """
+
+
+class RequestModel(BaseModel):
+    """Base class for request DTOs.
+
+    Request bodies are validated once on the way in and never mutated, so
+    instances are frozen and skip re-validation when passed between layers.
+    Field-name strings are cached by pydantic-core.
+    """
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
+        revalidate_instances="never",
+        cache_strings="keys",
+    )
@@ -1,7 +1,6 @@
-from pydantic import BaseModel
-from typing import List
+from .base import ResponseStruct
 
-class CaptionResponseDTO(BaseModel):
+class CaptionResponseDTO(ResponseStruct):
     id: str
     video_id: str
     text: str
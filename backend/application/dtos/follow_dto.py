@@ -1,10 +1,10 @@
-from pydantic import BaseModel
 from datetime import datetime
+from .base import ResponseStruct
 
-class FollowResponseDTO(BaseModel):
+class FollowResponseDTO(ResponseStruct):
     follower_id: str
     followed_id: str
     created_at: datetime
 
-class FollowStatusDTO(BaseModel):
+class FollowStatusDTO(ResponseStruct):
     is_following: bool
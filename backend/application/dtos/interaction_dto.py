@@ -1,9 +1,10 @@
-from pydantic import BaseModel, field_validator
+from pydantic import field_validator
 from datetime import datetime
 from ..utils.sanitization import sanitize_input, MAX_COMMENT_LENGTH
+from .base import RequestModel, ResponseStruct
 
 
-class CommentRequestDTO(BaseModel):
+class CommentRequestDTO(RequestModel):
     content: str
 
     @field_validator("content")
@@ -16,7 +17,7 @@ class CommentRequestDTO(BaseModel):
         return sanitize_input(v.strip())
 
 
-class CommentResponseDTO(BaseModel):
+class CommentResponseDTO(ResponseStruct):
     id: str
     video_id: str
     username: str
@@ -1,12 +1,12 @@
-from pydantic import BaseModel
 from typing import List
+from .base import ResponseStruct
 from .video_dto import VideoResponseDTO
 
-class PublicProfileDTO(BaseModel):
+class PublicProfileDTO(ResponseStruct):
     id: str
     username: str
     # We can add bio, avatar_url, etc. later
 
-class ProfileResponseDTO(BaseModel):
+class ProfileResponseDTO(ResponseStruct):
     user: PublicProfileDTO
     videos: List[VideoResponseDTO]
@@ -1,13 +1,13 @@
-from pydantic import BaseModel
 from datetime import datetime
+from .base import RequestModel, ResponseStruct
 
-class TipCreateDTO(BaseModel):
+class TipCreateDTO(RequestModel):
     receiver_id: str
     video_id: str | None = None
     amount: float
     currency: str = "USD"
 
-class TipResponseDTO(BaseModel):
+class TipResponseDTO(ResponseStruct):
     id: str
     sender_id: str
     receiver_id: str
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, field_validator
+from pydantic import field_validator
 from typing import Optional
 from enum import Enum
+from .base import RequestModel, ResponseStruct
 
 
 class TwoFactorMethod(str, Enum):
@@ -8,25 +9,25 @@ class TwoFactorMethod(str, Enum):
     EMAIL = "email"
 
 
-class TwoFactorSetupRequestDTO(BaseModel):
+class TwoFactorSetupRequestDTO(RequestModel):
     method: TwoFactorMethod
 
 
-class TwoFactorSetupResponseDTO(BaseModel):
+class TwoFactorSetupResponseDTO(ResponseStruct):
     secret: str
     qr_code: str
     backup_codes: list[str]
 
 
-class TwoFactorVerifyRequestDTO(BaseModel):
+class TwoFactorVerifyRequestDTO(RequestModel):
     code: str
     method: TwoFactorMethod
 
 
-class TwoFactorDisableRequestDTO(BaseModel):
+class TwoFactorDisableRequestDTO(RequestModel):
     password: str
 
 
-class TwoFactorStatusResponseDTO(BaseModel):
+class TwoFactorStatusResponseDTO(ResponseStruct):
     enabled: bool
     method: Optional[TwoFactorMethod] = None
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, field_validator
+from pydantic import field_validator
+from datetime import datetime
 from typing import List, Generic, TypeVar
 from ...domain.entities.video import VideoStatus
 from ..utils.sanitization import (
@@ -6,9 +7,10 @@ from ..utils.sanitization import (
     MAX_TITLE_LENGTH,
     MAX_DESCRIPTION_LENGTH,
 )
+from .base import RequestModel, ResponseStruct
 
 
-class VideoCreateDTO(BaseModel):
+class VideoCreateDTO(RequestModel):
     title: str
     description: str
     creator_id: str
@@ -32,7 +34,7 @@ class VideoCreateDTO(BaseModel):
         return sanitize_input(v.strip())
 
 
-class VideoResponseDTO(BaseModel):
+class VideoResponseDTO(ResponseStruct):
     id: str
     title: str
     description: str
@@ -43,12 +45,27 @@ class VideoResponseDTO(BaseModel):
     views: int
     likes: int
     duration: float
-    created_at: str | None = None
+    created_at: datetime | None = None
 
 
-class PaginatedVideoResponseDTO(BaseModel):
+class PaginatedVideoResponseDTO(ResponseStruct):
     items: List[VideoResponseDTO]
     total: int
     page: int
     page_size: int
     total_pages: int
+
+
+class PageVideoResponseDTO(ResponseStruct):
+    """Offset page that reports whether another page exists instead of totals."""
+
+    items: List[VideoResponseDTO]
+    page: int
+    page_size: int
+    has_more: bool
+
+
+class CursorPaginatedVideoResponseDTO(ResponseStruct):
+    items: List[VideoResponseDTO]
+    next_cursor: str | None
+    has_more: bool
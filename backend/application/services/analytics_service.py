@@ -1,6 +1,11 @@
-from typing import List, Optional, Dict, Any
+import asyncio
+import logging
+from typing import Callable, ContextManager, List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime, timedelta
+from bisect import bisect_right
 from dataclasses import replace
+from functools import lru_cache
+from operator import attrgetter
 from ...domain.entities.analytics import (
     VideoAnalytics,
     CreatorAnalytics,
@@ -12,13 +17,221 @@ from ...domain.entities.analytics import (
     ContentType,
 )
 from ...domain.ports.analytics_repository_port import AnalyticsRepositoryPort
+from ..dtos.analytics_dto import (
+    DashboardKeyMetrics,
+    DashboardResult,
+    TrackEngagementResult,
+    TrackViewResult,
+    TrendingContentResult,
+    TrendingCreatorsResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fields exposed for each trending video, projected with a single reusable
+# C-level getter instead of building each dict by hand per request.
+_TRENDING_VIDEO_FIELDS = (
+    "video_id",
+    "views",
+    "likes",
+    "comments",
+    "shares",
+    "engagement_rate",
+    "user_id",
+)
+_trending_video_values = attrgetter(*_TRENDING_VIDEO_FIELDS)
+
+
+# Period boundaries only change once per day/week/month, so they are built
+# once and shared by every request that falls in the same period.
+@lru_cache(maxsize=64)
+def _day_bounds(ordinal: int) -> Tuple[datetime, datetime]:
+    """Midnight-to-midnight bounds for the day with the given ordinal."""
+    start = datetime.fromordinal(ordinal)
+    return start, start + timedelta(days=1)
+
+
+@lru_cache(maxsize=64)
+def _week_bounds(year: int, iso_week: int) -> Tuple[datetime, datetime]:
+    """Monday-midnight to next-Monday-midnight bounds for an ISO week."""
+    start = datetime.fromisocalendar(year, iso_week, 1)
+    return start, start + timedelta(days=7)
+
+
+@lru_cache(maxsize=64)
+def _month_bounds(year: int, month: int) -> Tuple[datetime, datetime]:
+    """First instant to last second of the given month."""
+    start = datetime(year, month, 1)
+    end = (start + timedelta(days=32)).replace(day=1) - timedelta(seconds=1)
+    return start, end
+
+
+def _current_week_bounds(now: datetime) -> Tuple[datetime, datetime]:
+    year, iso_week, _ = now.isocalendar()
+    return _week_bounds(year, iso_week)
+
+
+# Engagement events that map one-to-one onto a counter field
+_ENGAGEMENT_FIELDS: Dict[str, str] = {
+    "like": "likes",
+    "comment": "comments",
+    "share": "shares",
+}
+
+
+class VideoViewAggregator:
+    """Per-process buffer that coalesces video views into bulk writes.
+
+    View and watch-time deltas are accumulated per (video_id, day) and
+    written with a single repository call, either ``flush_interval`` seconds
+    after the first buffered view or as soon as ``max_pending`` views have
+    accumulated.
+    """
+
+    def __init__(
+        self,
+        repository_scope: Callable[[], ContextManager[AnalyticsRepositoryPort]],
+        flush_interval: float = 2.0,
+        max_pending: int = 1000,
+    ):
+        self._repository_scope = repository_scope
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._buffer: Dict[Tuple[str, datetime], Dict[str, Any]] = {}
+        self._pending = 0
+        self._lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._background_flushes: Set[asyncio.Task] = set()
+
+    async def add_view(
+        self,
+        video_id: str,
+        user_id: Optional[str],
+        watch_time: float,
+        now: Optional[datetime] = None,
+    ) -> None:
+        now = now or datetime.utcnow()
+        start_of_day, end_of_day = _day_bounds(now.toordinal())
+        async with self._lock:
+            slot = self._buffer.get((video_id, start_of_day))
+            if slot is None:
+                slot = self._buffer[(video_id, start_of_day)] = {
+                    "user_id": user_id or "unknown",
+                    "period_end": end_of_day,
+                    "views": 0,
+                    "watch_time": 0.0,
+                }
+            slot["views"] += 1
+            slot["watch_time"] += watch_time
+            self._pending += 1
+            flush_now = self._pending >= self._max_pending
+
+        if flush_now:
+            # Flush in the background so a failing write never fails this view
+            task = asyncio.create_task(self._flush_logged())
+            self._background_flushes.add(task)
+            task.add_done_callback(self._background_flushes.discard)
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Write all buffered deltas to the repository.
+
+        The write runs in a worker thread. If it fails, the deltas are merged
+        back into the buffer for the next flush and the error is re-raised.
+        """
+        async with self._lock:
+            deltas, self._buffer = self._buffer, {}
+            self._pending = 0
+        if not deltas:
+            return
+        try:
+            await asyncio.to_thread(self._write, deltas)
+        except Exception:
+            await self._requeue(deltas)
+            raise
+
+    async def close(self) -> None:
+        """Cancel the pending timer and write whatever is still buffered."""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(
+                "Dropping %d buffered video views on shutdown: %s", self._pending, e
+            )
+
+    def _write(self, deltas: Dict[Tuple[str, datetime], Dict[str, Any]]) -> None:
+        with self._repository_scope() as repository:
+            repository.bulk_record_video_views(deltas)
+
+    async def _requeue(
+        self, deltas: Dict[Tuple[str, datetime], Dict[str, Any]]
+    ) -> None:
+        async with self._lock:
+            for key, delta in deltas.items():
+                slot = self._buffer.get(key)
+                if slot is None:
+                    self._buffer[key] = delta
+                else:
+                    slot["views"] += delta["views"]
+                    slot["watch_time"] += delta["watch_time"]
+                self._pending += delta["views"]
+
+    async def _flush_logged(self) -> bool:
+        try:
+            await self.flush()
+            return True
+        except Exception as e:
+            logger.error(
+                "Failed to flush buffered video views, %d kept for retry: %s",
+                self._pending,
+                e,
+            )
+            return False
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        if not await self._flush_logged():
+            # Retry on the next interval even if no new views arrive
+            self._flush_task = asyncio.create_task(self._flush_later())
 
 
 class AnalyticsService:
     """Service layer for analytics operations."""
 
-    def __init__(self, repository: AnalyticsRepositoryPort):
+    def __init__(
+        self,
+        repository: AnalyticsRepositoryPort,
+        view_aggregator: Optional[VideoViewAggregator] = None,
+        repository_scope: Optional[
+            Callable[[], ContextManager[AnalyticsRepositoryPort]]
+        ] = None,
+    ):
         self.repository = repository
+        self.view_aggregator = view_aggregator
+        self.repository_scope = repository_scope
+
+    async def _gather_reads(
+        self, *reads: Callable[[AnalyticsRepositoryPort], Any]
+    ) -> List[Any]:
+        """Run independent read-only repository calls.
+
+        With a repository_scope each read gets its own session and they run
+        concurrently in worker threads; otherwise they run one after another
+        on the request's repository.
+        """
+        if self.repository_scope is None:
+            return [read(self.repository) for read in reads]
+
+        def run(read: Callable[[AnalyticsRepositoryPort], Any]) -> Any:
+            with self.repository_scope() as repository:
+                return read(repository)
+
+        return list(
+            await asyncio.gather(*(asyncio.to_thread(run, read) for read in reads))
+        )
 
     # Video Analytics
     async def track_video_view(
@@ -27,12 +240,17 @@ class AnalyticsService:
         user_id: Optional[str] = None,
         viewer_id: Optional[str] = None,
         watch_time: float = 0.0,
-    ) -> Dict[str, Any]:
+        now: Optional[datetime] = None,
+    ) -> TrackViewResult:
         """Track a video view."""
+        now = now or datetime.utcnow()
+        if self.view_aggregator is not None:
+            # Buffered: the view is written with the next bulk flush
+            await self.view_aggregator.add_view(video_id, user_id, watch_time, now)
+            return TrackViewResult(queued=True)
+
         # Get existing analytics for today
-        today = datetime.utcnow()
-        start_of_day = today.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = start_of_day + timedelta(days=1)
+        start_of_day, end_of_day = _day_bounds(now.toordinal())
 
         existing_analytics = self.repository.get_video_analytics(
             video_id, start_of_day, end_of_day
@@ -58,17 +276,23 @@ class AnalyticsService:
             saved_analytics = self.repository.save_video_analytics(new_analytics)
 
         # Also track in content performance
-        await self._update_content_performance(video_id, user_id, "view", watch_time)
+        await self._update_content_performance(
+            video_id, user_id, "view", watch_time, now=now
+        )
 
-        return {"success": True, "analytics": saved_analytics}
+        return TrackViewResult(analytics=saved_analytics)
 
     async def track_video_engagement(
-        self, video_id: str, user_id: str, engagement_type: str, value: int = 1
-    ) -> Dict[str, Any]:
+        self,
+        video_id: str,
+        user_id: str,
+        engagement_type: str,
+        value: int = 1,
+        now: Optional[datetime] = None,
+    ) -> TrackEngagementResult:
         """Track video engagement (like, comment, share, tip)."""
-        today = datetime.utcnow()
-        start_of_day = today.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = start_of_day + timedelta(days=1)
+        now = now or datetime.utcnow()
+        start_of_day, end_of_day = _day_bounds(now.toordinal())
 
         existing_analytics = self.repository.get_video_analytics(
             video_id, start_of_day, end_of_day
@@ -77,12 +301,9 @@ class AnalyticsService:
         if existing_analytics:
             update_data = {}
 
-            if engagement_type == "like":
-                update_data["likes"] = existing_analytics.likes + value
-            elif engagement_type == "comment":
-                update_data["comments"] = existing_analytics.comments + value
-            elif engagement_type == "share":
-                update_data["shares"] = existing_analytics.shares + value
+            field = _ENGAGEMENT_FIELDS.get(engagement_type)
+            if field:
+                update_data[field] = getattr(existing_analytics, field) + value
             elif engagement_type == "tip":
                 update_data["tips_count"] = existing_analytics.tips_count + 1
                 update_data["tips_amount"] = existing_analytics.tips_amount + float(
@@ -101,12 +322,9 @@ class AnalyticsService:
                 "views": 0,
             }
 
-            if engagement_type == "like":
-                new_analytics_data["likes"] = value
-            elif engagement_type == "comment":
-                new_analytics_data["comments"] = value
-            elif engagement_type == "share":
-                new_analytics_data["shares"] = value
+            field = _ENGAGEMENT_FIELDS.get(engagement_type)
+            if field:
+                new_analytics_data[field] = value
             elif engagement_type == "tip":
                 new_analytics_data["tips_count"] = 1
                 new_analytics_data["tips_amount"] = float(value)
@@ -116,30 +334,35 @@ class AnalyticsService:
 
         # Track in content performance
         await self._update_content_performance(
-            video_id, user_id, engagement_type, value
+            video_id, user_id, engagement_type, value, now=now
         )
 
-        return {"success": True, "analytics": saved_analytics}
+        return TrackEngagementResult(analytics=saved_analytics)
 
     async def _update_content_performance(
-        self, video_id: str, user_id: str, action_type: str, value: Any = None
+        self,
+        video_id: str,
+        user_id: str,
+        action_type: str,
+        value: Any = None,
+        now: Optional[datetime] = None,
     ) -> None:
         """Update content performance metrics."""
+        now = now or datetime.utcnow()
         performance = self.repository.get_content_performance(video_id)
 
+        engagement_field = _ENGAGEMENT_FIELDS.get(action_type)
+
         if performance:
             update_data = {}
 
-            if action_type == "view":
+            if engagement_field:
+                update_data[engagement_field] = (
+                    getattr(performance, engagement_field) + 1
+                )
+            elif action_type == "view":
+                # Watch time is tracked on VideoAnalytics only
                 update_data["views"] = performance.views + 1
-                if isinstance(value, (int, float)):
-                    update_data["watch_time"] = performance.watch_time + value
-            elif action_type == "like":
-                update_data["likes"] = performance.likes + 1
-            elif action_type == "comment":
-                update_data["comments"] = performance.comments + 1
-            elif action_type == "share":
-                update_data["shares"] = performance.shares + 1
             elif action_type == "tip":
                 if isinstance(value, (int, float)):
                     update_data["tips_amount"] = performance.tips_amount + value
@@ -153,15 +376,13 @@ class AnalyticsService:
         else:
             # Create new content performance record
             # This would need video publish date
-            now = datetime.utcnow()
+            engagement_counts = {engagement_field: 1} if engagement_field else {}
             new_performance = ContentPerformance(
                 user_id=user_id,
                 video_id=video_id,
                 content_type=ContentType.VIDEO,
                 views=1 if action_type == "view" else 0,
-                likes=1 if action_type == "like" else 0,
-                comments=1 if action_type == "comment" else 0,
-                shares=1 if action_type == "share" else 0,
+                **engagement_counts,
                 tips_amount=float(value)
                 if action_type == "tip" and isinstance(value, (int, float))
                 else 0.0,
@@ -178,55 +399,54 @@ class AnalyticsService:
         # Calculate period boundaries
         now = datetime.utcnow()
         if period == TimePeriod.DAY:
-            period_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            period_end = period_start + timedelta(days=1)
+            period_start, period_end = _day_bounds(now.toordinal())
         elif period == TimePeriod.WEEK:
-            period_start = now - timedelta(days=now.weekday())
-            period_start = period_start.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            period_end = period_start + timedelta(days=7)
+            period_start, period_end = _current_week_bounds(now)
         elif period == TimePeriod.MONTH:
-            period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            period_end = period_start + timedelta(days=32)
-            period_end = period_end.replace(day=1) - timedelta(seconds=1)
+            period_start, period_end = _month_bounds(now.year, now.month)
         else:
             period_start = now - timedelta(days=30)
             period_end = now
 
-        # Check if analytics already exist for this period
-        existing_analytics = self.repository.get_creator_analytics(
-            user_id, period, period_start, period_end
-        )
-
-        # Calculate metrics
-        engagement_metrics = self.repository.calculate_engagement_metrics(
-            user_id, period_start, period_end
-        )
-        growth_metrics = self.repository.calculate_growth_metrics(
-            user_id, period_start, period_end
-        )
-        revenue_metrics = self.repository.calculate_revenue_metrics(
-            user_id, period_start, period_end
-        )
-
-        # Get top performing videos
-        top_videos = self.repository.get_top_performing_videos(
-            user_id, limit=5, metric="views"
+        # Existing record, metrics, top videos and video count are
+        # independent reads
+        (
+            existing_analytics,
+            engagement_metrics,
+            growth_metrics,
+            revenue_metrics,
+            top_videos,
+            total_videos,
+        ) = await self._gather_reads(
+            lambda repo: repo.get_creator_analytics(
+                user_id, period, period_start, period_end
+            ),
+            lambda repo: repo.calculate_engagement_metrics(
+                user_id, period_start, period_end
+            ),
+            lambda repo: repo.calculate_growth_metrics(
+                user_id, period_start, period_end
+            ),
+            lambda repo: repo.calculate_revenue_metrics(
+                user_id, period_start, period_end
+            ),
+            lambda repo: repo.get_top_performing_videos(
+                user_id, limit=5, metric="views"
+            ),
+            lambda repo: repo.count_distinct_videos(user_id, period_start, period_end),
         )
         top_video_ids = [video.video_id for video in top_videos]
 
-        # Get video count
-        video_analytics = self.repository.get_user_video_analytics(
-            user_id, limit=1000, period_start=period_start, period_end=period_end
-        )
-
+        # trusted: internal data -- build the entity once, reusing the
+        # existing record id instead of copying it afterwards
+        identity = {"id": existing_analytics.id} if existing_analytics else {}
         creator_analytics = CreatorAnalytics(
+            **identity,
             user_id=user_id,
             period=period,
             period_start=period_start,
             period_end=period_end,
-            total_videos=len(set([v.video_id for v in video_analytics])),
+            total_videos=total_videos,
             total_views=int(engagement_metrics.get("total_views", 0)),
             total_likes=int(engagement_metrics.get("total_likes", 0)),
             total_comments=int(engagement_metrics.get("total_comments", 0)),
@@ -242,10 +462,6 @@ class AnalyticsService:
             most_viewed_video=top_video_ids[0] if top_video_ids else None,
         )
 
-        if existing_analytics:
-            # Update existing
-            creator_analytics = replace(creator_analytics, id=existing_analytics.id)
-
         saved_analytics = self.repository.save_creator_analytics(creator_analytics)
 
         return {
@@ -256,41 +472,42 @@ class AnalyticsService:
             "revenue_metrics": revenue_metrics,
         }
 
-    async def get_creator_dashboard(self, user_id: str) -> Dict[str, Any]:
+    async def get_creator_dashboard(self, user_id: str) -> DashboardResult:
         """Get comprehensive dashboard data for creator."""
         # Get analytics for different periods
         now = datetime.utcnow()
 
         # Current month
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        month_end = month_start + timedelta(days=32)
-        month_end = month_end.replace(day=1) - timedelta(seconds=1)
+        month_start, month_end = _month_bounds(now.year, now.month)
 
         # Last month
-        last_month_start = month_start - timedelta(days=32)
-        last_month_end = month_start - timedelta(seconds=1)
+        if now.month == 1:
+            last_month_start, last_month_end = _month_bounds(now.year - 1, 12)
+        else:
+            last_month_start, last_month_end = _month_bounds(now.year, now.month - 1)
 
         # This week
-        week_start = now - timedelta(days=now.weekday())
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_end = week_start + timedelta(days=7)
-
-        # Get analytics
-        current_month_analytics = self.repository.get_creator_analytics(
-            user_id, TimePeriod.MONTH, month_start, month_end
-        )
-        last_month_analytics = self.repository.get_creator_analytics(
-            user_id, TimePeriod.MONTH, last_month_start, last_month_end
-        )
-
-        # Get trending videos
-        trending_videos = self.repository.get_top_performing_videos(
-            user_id, limit=5, metric="engagement_rate"
-        )
-
-        # Get recent time series data
-        views_series = self.repository.get_time_series_data(
-            user_id, MetricType.VIEWS, TimePeriod.WEEK, week_start, week_end
+        week_start, week_end = _current_week_bounds(now)
+
+        # Monthly analytics, trending videos and this week's views series
+        (
+            current_month_analytics,
+            last_month_analytics,
+            trending_videos,
+            views_series,
+        ) = await self._gather_reads(
+            lambda repo: repo.get_creator_analytics(
+                user_id, TimePeriod.MONTH, month_start, month_end
+            ),
+            lambda repo: repo.get_creator_analytics(
+                user_id, TimePeriod.MONTH, last_month_start, last_month_end
+            ),
+            lambda repo: repo.get_top_performing_videos(
+                user_id, limit=5, metric="engagement_rate"
+            ),
+            lambda repo: repo.get_time_series_data(
+                user_id, MetricType.VIEWS, TimePeriod.WEEK, week_start, week_end
+            ),
         )
 
         # Calculate growth rates
@@ -306,102 +523,61 @@ class AnalyticsService:
                     * 100
                 )
 
-        return {
-            "success": True,
-            "current_month": current_month_analytics.model_dump()
-            if current_month_analytics
-            else None,
-            "last_month": last_month_analytics.model_dump()
-            if last_month_analytics
-            else None,
-            "monthly_growth_rate": monthly_growth,
-            "trending_videos": [video.model_dump() for video in trending_videos],
-            "views_time_series": views_series.data_points if views_series else [],
-            "key_metrics": {
-                "total_views": current_month_analytics.total_views
-                if current_month_analytics
-                else 0,
-                "total_revenue": current_month_analytics.total_revenue
-                if current_month_analytics
-                else 0.0,
-                "follower_growth": current_month_analytics.new_followers
-                if current_month_analytics
-                else 0,
-                "engagement_rate": current_month_analytics.average_engagement_rate
-                if current_month_analytics
-                else 0.0,
-            },
-        }
+        if current_month_analytics:
+            key_metrics = DashboardKeyMetrics(
+                total_views=current_month_analytics.total_views,
+                total_revenue=current_month_analytics.total_revenue,
+                follower_growth=current_month_analytics.new_followers,
+                engagement_rate=current_month_analytics.average_engagement_rate,
+            )
+        else:
+            key_metrics = DashboardKeyMetrics()
+
+        # trusted: internal data -- repository entities are returned as-is
+        # rather than being re-materialized per request
+        return DashboardResult(
+            current_month=current_month_analytics,
+            last_month=last_month_analytics,
+            monthly_growth_rate=monthly_growth,
+            trending_videos=trending_videos,
+            views_time_series=views_series.data_points if views_series else [],
+            key_metrics=key_metrics,
+        )
 
     # Time Series
     async def generate_time_series_data(
-        self, user_id: str, metric_type: MetricType, time_period: TimePeriod
+        self,
+        user_id: str,
+        metric_type: MetricType,
+        time_period: TimePeriod,
+        now: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """Generate time series data for a specific metric."""
-        now = datetime.utcnow()
+        now = now or datetime.utcnow()
 
-        # Calculate period boundaries based on time_period
+        # Calculate period boundaries and bucket size based on time_period
         if time_period == TimePeriod.DAY:
-            period_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            period_end = period_start + timedelta(days=1)
-            data_points = []
-
-            # Generate hourly data points
-            for hour in range(24):
-                hour_start = period_start + timedelta(hours=hour)
-                hour_end = hour_start + timedelta(hours=1)
-
-                value = await self._get_metric_value(
-                    user_id, metric_type, hour_start, hour_end
-                )
-
-                data_points.append(
-                    {"timestamp": hour_start.isoformat(), "value": value}
-                )
-
+            # Hourly data points
+            period_start, period_end = _day_bounds(now.toordinal())
+            step, bucket_count = timedelta(hours=1), 24
         elif time_period == TimePeriod.WEEK:
-            period_start = now - timedelta(days=now.weekday())
-            period_start = period_start.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            period_end = period_start + timedelta(days=7)
-            data_points = []
-
-            # Generate daily data points
-            for day in range(7):
-                day_start = period_start + timedelta(days=day)
-                day_end = day_start + timedelta(days=1)
-
-                value = await self._get_metric_value(
-                    user_id, metric_type, day_start, day_end
-                )
-
-                data_points.append({"timestamp": day_start.isoformat(), "value": value})
-
+            # Daily data points
+            period_start, period_end = _current_week_bounds(now)
+            step, bucket_count = timedelta(days=1), 7
         elif time_period == TimePeriod.MONTH:
-            period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            period_end = period_start + timedelta(days=32)
-            period_end = period_end.replace(day=1) - timedelta(seconds=1)
-            data_points = []
-
-            # Generate daily data points
-            current_day = period_start
-            while current_day < period_end:
-                day_end = current_day + timedelta(days=1)
-
-                value = await self._get_metric_value(
-                    user_id, metric_type, current_day, day_end
-                )
-
-                data_points.append(
-                    {"timestamp": current_day.isoformat(), "value": value}
-                )
-
-                current_day = day_end
-
+            # Daily data points
+            period_start, period_end = _month_bounds(now.year, now.month)
+            step, bucket_count = timedelta(days=1), period_end.day
         else:
             return {"success": False, "error": "Unsupported time period"}
 
+        bucket_starts = [period_start + step * i for i in range(bucket_count)]
+        values = self._bucket_metric_values(user_id, metric_type, bucket_starts, step)
+        data_points = [
+            {"timestamp": bucket_start.isoformat(), "value": value}
+            for bucket_start, value in zip(bucket_starts, values)
+        ]
+
         # Save time series data
         time_series_data = TimeSeriesData(
             user_id=user_id,
@@ -416,36 +592,39 @@ class AnalyticsService:
 
         return {"success": True, "time_series": saved_data, "data_points": data_points}
 
-    async def _get_metric_value(
+    def _bucket_metric_values(
         self,
         user_id: str,
         metric_type: MetricType,
-        start_time: datetime,
-        end_time: datetime,
-    ) -> float:
-        """Get metric value for a specific time range."""
-        metrics_summary = self.repository.get_metrics_summary(
-            user_id, [metric_type], TimePeriod.DAY, start_time, end_time
+        bucket_starts: List[datetime],
+        step: timedelta,
+    ) -> List[float]:
+        """Sum a metric into fixed-width buckets using a single repository query.
+
+        A row counts towards a bucket when it falls entirely inside it.
+        """
+        events = self.repository.get_metric_events(
+            user_id, metric_type, bucket_starts[0], bucket_starts[-1] + step
         )
 
-        if metric_type == MetricType.VIEWS:
-            return metrics_summary.get("total_views", 0.0)
-        elif metric_type == MetricType.LIKES:
-            return metrics_summary.get("total_likes", 0.0)
-        elif metric_type == MetricType.TIPS:
-            return metrics_summary.get("total_tips", 0.0)
-        else:
-            return 0.0
+        zero = 0 if metric_type in (MetricType.VIEWS, MetricType.LIKES) else 0.0
+        values = [zero] * len(bucket_starts)
+        for event_start, event_end, value in events:
+            index = bisect_right(bucket_starts, event_start) - 1
+            if index >= 0 and event_end <= bucket_starts[index] + step:
+                values[index] += value
+        return values
 
     # Audience Demographics
     async def update_audience_demographics(
-        self, user_id: str, demographics_data: Dict[str, Any]
+        self,
+        user_id: str,
+        demographics_data: Dict[str, Any],
+        now: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """Update audience demographics for creator."""
-        now = datetime.utcnow()
-        period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        period_end = period_start + timedelta(days=32)
-        period_end = period_end.replace(day=1) - timedelta(seconds=1)
+        now = now or datetime.utcnow()
+        period_start, period_end = _month_bounds(now.year, now.month)
 
         # Check if demographics already exist for current month
         existing_demographics = self.repository.get_audience_demographics(
@@ -476,44 +655,29 @@ class AnalyticsService:
         content_type: str = "video",
         time_period: TimePeriod = TimePeriod.DAY,
         limit: int = 20,
-    ) -> Dict[str, Any]:
+    ) -> TrendingContentResult:
         """Get trending content."""
         trending_videos = self.repository.get_trending_videos(limit, time_period)
 
-        # Get creator information for each video
-        trending_with_creators = []
-        for video_analytics in trending_videos:
-            # This would typically fetch user info from user repository
-            trending_with_creators.append(
-                {
-                    "video_id": video_analytics.video_id,
-                    "views": video_analytics.views,
-                    "likes": video_analytics.likes,
-                    "comments": video_analytics.comments,
-                    "shares": video_analytics.shares,
-                    "engagement_rate": video_analytics.engagement_rate,
-                    "user_id": video_analytics.user_id,
-                    # Add user info as needed
-                }
-            )
+        # Creator info would typically be joined in from the user repository
+        trending_with_creators = [
+            dict(zip(_TRENDING_VIDEO_FIELDS, _trending_video_values(video_analytics)))
+            for video_analytics in trending_videos
+        ]
 
-        return {
-            "success": True,
-            "trending_content": trending_with_creators,
-            "content_type": content_type,
-            "time_period": time_period.value,
-        }
+        return TrendingContentResult(
+            trending_content=trending_with_creators,
+            content_type=content_type,
+            time_period=time_period.value,
+        )
 
     async def get_trending_creators(
         self, time_period: TimePeriod = TimePeriod.WEEK, limit: int = 20
-    ) -> Dict[str, Any]:
+    ) -> TrendingCreatorsResult:
         """Get trending creators."""
         trending_creators = self.repository.get_trending_creators(limit, time_period)
 
-        return {
-            "success": True,
-            "trending_creators": [
-                creator.model_dump() for creator in trending_creators
-            ],
-            "time_period": time_period.value,
-        }
+        # trusted: internal data
+        return TrendingCreatorsResult(
+            trending_creators=trending_creators, time_period=time_period.value
+        )
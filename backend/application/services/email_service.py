@@ -1,10 +1,15 @@
+import os
+import queue
 import secrets
 import logging
 from typing import Optional
 from datetime import datetime, timedelta
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from string import Template
+from email.message import EmailMessage
 from email.utils import formataddr
 
 from ...domain.entities.auth_security import EmailVerification
@@ -12,72 +17,22 @@ from ...domain.ports.repository_ports import UserRepositoryPort
 
 logger = logging.getLogger(__name__)
 
-class EmailService:
-    """Email service for sending verification and transactional emails."""
-    
-    def __init__(
-        self,
-        smtp_host: Optional[str] = None,
-        smtp_port: int = 587,
-        smtp_user: Optional[str] = None,
-        smtp_password: Optional[str] = None,
-        smtp_use_tls: bool = True,
-        from_email: Optional[str] = None,
-        from_name: str = "clipsmith"
-        user_repo: UserRepositoryPort = None
-    ):
-        self.smtp_host = smtp_host or os.getenv("SMTP_HOST")
-        self.smtp_port = smtp_port or int(os.getenv("SMTP_PORT", "587"))
-        self.smtp_user = smtp_user or os.getenv("SMTP_USER")
-        self.smtp_password = smtp_password or os.getenv("SMTP_PASSWORD")
-        self.smtp_use_tls = smtp_use_tls or os.getenv("SMTP_USE_TLS", "true").lower() == "true"
-        self.from_email = from_email or os.getenv("FROM_EMAIL", "noreply@clipsmith.com")
-        self.from_name = from_name
-        self.user_repo = user_repo
-        
-        # Initialize SMTP server
-        self._smtp_server = None
-        self._init_smtp_server()
-    
-    def _init_smtp_server(self):
-        """Initialize SMTP server connection."""
-        if not self.smtp_host or not self.smtp_user:
-            logger.info("SMTP not configured - emails will be logged to console")
-            return
-        
-        try:
-            self._smtp_server = smtplib.SMTP(
-                host=self.smtp_host,
-                port=self.smtp_port,
-                timeout=30
-            )
-            
-            if self.smtp_use_tls:
-                self._smtp_server.starttls()
-            
-            self._smtp_server.login(self.smtp_user, self.smtp_password)
-            logger.info(f"SMTP server connected to {self.smtp_host}")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize SMTP server: {e}")
-            self._smtp_server = None
-    
-    def send_verification_email(self, user_email: str, verification_token: str, user_name: str) -> bool:
-        """Send email verification email."""
-        subject = "Verify your clipsmith account"
-        
-        # Create verification link
-        verification_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/verify-email?token={verification_token}"
-        
-        html_body = f"""
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
+
+# Delivery attempts per email before it is dead-lettered to the log
+MAX_SEND_ATTEMPTS = 3
+SEND_RETRY_BACKOFF_SECONDS = 1.0
+
+# Static bodies are parsed once; sends only substitute the dynamic fields
+_VERIFY_HTML = Template("""
         <html>
             <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
                 <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                    <h2 style="color: #2c3e50;">Welcome to clipsmith, {user_name}!</h2>
+                    <h2 style="color: #2c3e50;">Welcome to clipsmith, $user_name!</h2>
                     <p style="font-size: 16px; margin-bottom: 20px;">Thank you for joining our community. To complete your registration, please verify your email address.</p>
                     
                     <div style="background-color: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; margin: 20px 0;">
-                        <a href="{verification_url}" 
+                        <a href="$verification_url" 
                            style="background-color: #2c3e50; color: white; padding: 12px 30px; text-decoration: none; border-radius: 6px; font-weight: bold; display: inline-block;">
                             Verify Email Address
                         </a>
@@ -93,41 +48,30 @@ class EmailService:
                 </div>
             </body>
         </html>
-        """
-        
-        text_body = f"""
-        Welcome to clipsmith, {user_name}!
+        """)
+
+_VERIFY_TEXT = Template("""
+        Welcome to clipsmith, $user_name!
         
         Please verify your email address by clicking this link:
-        {verification_url}
+        $verification_url
         
         This link will expire in 24 hours. If you didn't create an account, please ignore this email.
         
         clipsmith Team
-        """
-        
-        return self._send_email(
-            to_email=user_email,
-            subject=subject,
-            html_body=html_body,
-            text_body=text_body
-        )
-    
-    def send_2fa_code_email(self, user_email: str, code: str, method: str, user_name: str) -> bool:
-        """Send 2FA code email."""
-        subject = f"Your clipsmith verification code ({method.upper()})"
-        
-        html_body = f"""
+        """)
+
+_TWO_FACTOR_HTML = Template("""
         <html>
             <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
                 <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
                     <h2 style="color: #2c3e50;">clipsmith Security Code</h2>
-                    <p style="font-size: 16px; margin-bottom: 20px;">Hello {user_name},</p>
+                    <p style="font-size: 16px; margin-bottom: 20px;">Hello $user_name,</p>
                     <p style="font-size: 16px; margin-bottom: 20px;">Your verification code is:</p>
                     
                     <div style="background-color: #f8f9fa; padding: 30px; border-radius: 8px; text-align: center; margin: 20px 0; font-family: monospace;">
                         <span style="font-size: 32px; font-weight: bold; letter-spacing: 3px; color: #2c3e50;">
-                            {code}
+                            $code
                         </span>
                     </div>
                     
@@ -141,45 +85,32 @@ class EmailService:
                 </div>
             </body>
         </html>
-        """
-        
-        text_body = f"""
-        clipsmith Security Code ({method.upper()})
+        """)
+
+_TWO_FACTOR_TEXT = Template("""
+        clipsmith Security Code ($method)
         
-        Hello {user_name},
+        Hello $user_name,
         
-        Your verification code is: {code}
+        Your verification code is: $code
         
         This code will expire in 5 minutes.
         
         If you didn't request this code, please secure your account immediately.
         
         clipsmith Team
-        """
-        
-        return self._send_email(
-            to_email=user_email,
-            subject=subject,
-            html_body=html_body,
-            text_body=text_body
-        )
-    
-    def send_password_reset_email(self, user_email: str, reset_token: str, user_name: str) -> bool:
-        """Send password reset email."""
-        subject = "Reset your clipsmith password"
-        
-        reset_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/reset-password?token={reset_token}"
-        
-        html_body = f"""
+        """)
+
+_PASSWORD_RESET_HTML = Template("""
         <html>
             <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
                 <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
                     <h2 style="color: #2c3e50;">Password Reset Request</h2>
-                    <p style="font-size: 16px; margin-bottom: 20px;">Hello {user_name},</p>
+                    <p style="font-size: 16px; margin-bottom: 20px;">Hello $user_name,</p>
                     <p style="font-size: 16px; margin-bottom: 20px;">We received a request to reset your password. Click the button below to reset it:</p>
                     
                     <div style="background-color: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; margin: 20px 0;">
-                        <a href="{reset_url}" 
+                        <a href="$reset_url" 
                            style="background-color: #dc3545; color: white; padding: 12px 30px; text-decoration: none; border-radius: 6px; font-weight: bold; display: inline-block;">
                             Reset Password
                         </a>
@@ -195,47 +126,36 @@ class EmailService:
                 </div>
             </body>
         </html>
-        """
-        
-        text_body = f"""
+        """)
+
+_PASSWORD_RESET_TEXT = Template("""
         Password Reset Request
         
-        Hello {user_name},
+        Hello $user_name,
         
         We received a request to reset your password. Use this link to reset it:
-        {reset_url}
+        $reset_url
         
         This link will expire in 1 hour.
         
         If you didn't request this reset, please ignore this email.
         
         clipsmith Team
-        """
-        
-        return self._send_email(
-            to_email=user_email,
-            subject=subject,
-            html_body=html_body,
-            text_body=text_body
-        )
-    
-    def send_welcome_email(self, user_email: str, user_name: str) -> bool:
-        """Send welcome email after successful registration."""
-        subject = "Welcome to clipsmith!"
-        
-        html_body = f"""
+        """)
+
+_WELCOME_HTML = Template("""
         <html>
             <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
                 <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
                     <h1 style="color: #2c3e50; text-align: center;">🎉 Welcome to clipsmith!</h1>
                     
-                    <p style="font-size: 18px; margin: 30px 0;">Hello {user_name},</p>
+                    <p style="font-size: 18px; margin: 30px 0;">Hello $user_name,</p>
                     <p style="font-size: 16px; margin-bottom: 20px;">
                         Thank you for joining clipsmith! We're excited to have you as part of our creative community.
                     </p>
                     
                     <div style="background-color: #f8f9fa; padding: 30px; border-radius: 8px; text-align: center; margin: 30px 0;">
-                        <a href="{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/login" 
+                        <a href="$frontend_url/login" 
                            style="background-color: #2c3e50; color: white; padding: 15px 25px; text-decoration: none; border-radius: 6px; font-weight: bold; display: inline-block; font-size: 16px;">
                             Get Started
                         </a>
@@ -248,20 +168,196 @@ class EmailService:
                 </div>
             </body>
         </html>
-        """
-        
-        text_body = f"""
+        """)
+
+_WELCOME_TEXT = Template("""
         Welcome to clipsmith!
         
-        Hello {user_name},
+        Hello $user_name,
         
         Thank you for joining clipsmith! We're excited to have you as part of our creative community.
         
-        Get started here: {os.getenv('FRONTEND_URL', 'http://localhost:3000')}/login
+        Get started here: $frontend_url/login
         
         Best regards,
         The clipsmith Team
-        """
+        """)
+
+
+class EmailService:
+    """Email service for sending verification and transactional emails."""
+    
+    def __init__(
+        self,
+        smtp_host: Optional[str] = None,
+        smtp_port: int = 587,
+        smtp_user: Optional[str] = None,
+        smtp_password: Optional[str] = None,
+        smtp_use_tls: bool = True,
+        from_email: Optional[str] = None,
+        from_name: str = "clipsmith",
+        user_repo: UserRepositoryPort = None,
+        pool_size: int = 4,
+        send_workers: int = 4,
+    ):
+        self.smtp_host = smtp_host or os.getenv("SMTP_HOST")
+        self.smtp_port = smtp_port or int(os.getenv("SMTP_PORT", "587"))
+        self.smtp_user = smtp_user or os.getenv("SMTP_USER")
+        self.smtp_password = smtp_password or os.getenv("SMTP_PASSWORD")
+        self.smtp_use_tls = smtp_use_tls or os.getenv("SMTP_USE_TLS", "true").lower() == "true"
+        self.from_email = from_email or os.getenv("FROM_EMAIL", "noreply@clipsmith.com")
+        self.from_name = from_name
+        self.user_repo = user_repo
+        
+        # Idle authenticated connections, reused across sends. smtplib.SMTP
+        # is not thread-safe, so each connection is used by one sender at a time
+        self._pool: "queue.Queue[smtplib.SMTP]" = queue.Queue(maxsize=pool_size)
+        # Deliveries run off the request path; callers only pay for the enqueue
+        self._executor = ThreadPoolExecutor(
+            max_workers=send_workers, thread_name_prefix="email-sender"
+        )
+        self._init_smtp_server()
+
+    @property
+    def smtp_configured(self) -> bool:
+        return bool(self.smtp_host and self.smtp_user)
+
+    def _init_smtp_server(self):
+        """Warm the pool with one SMTP connection."""
+        if not self.smtp_configured:
+            logger.info("SMTP not configured - emails will be logged to console")
+            return
+
+        try:
+            self._pool.put_nowait(self._connect())
+            logger.info(f"SMTP server connected to {self.smtp_host}")
+        except Exception as e:
+            # Sends will retry the connection on demand
+            logger.error(f"Failed to initialize SMTP server: {e}")
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection."""
+        conn = smtplib.SMTP(host=self.smtp_host, port=self.smtp_port, timeout=30)
+        try:
+            if self.smtp_use_tls:
+                conn.starttls()
+            conn.login(self.smtp_user, self.smtp_password)
+        except Exception:
+            self._discard(conn)
+            raise
+        return conn
+
+    @staticmethod
+    def _discard(conn: smtplib.SMTP) -> None:
+        try:
+            conn.quit()
+        except Exception:
+            conn.close()
+
+    def _acquire(self) -> smtplib.SMTP:
+        """Take a live connection from the pool, reconnecting dropped ones."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+        try:
+            # Servers drop idle connections; a NOOP detects that before sending
+            conn.noop()
+        except (smtplib.SMTPException, OSError):
+            conn.close()
+            return self._connect()
+        return conn
+
+    def _release(self, conn: smtplib.SMTP) -> None:
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            self._discard(conn)
+
+    def close(self) -> None:
+        """Finish queued deliveries and close all pooled SMTP connections."""
+        self._executor.shutdown(wait=True)
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(conn)
+
+    def send_verification_email(self, user_email: str, verification_token: str, user_name: str) -> bool:
+        """Send email verification email."""
+        subject = "Verify your clipsmith account"
+        
+        # Create verification link
+        verification_url = f"{FRONTEND_URL}/verify-email?token={verification_token}"
+        
+        html_body = _VERIFY_HTML.substitute(
+            user_name=escape(user_name), verification_url=escape(verification_url)
+        )
+        
+        text_body = _VERIFY_TEXT.substitute(
+            user_name=user_name, verification_url=verification_url
+        )
+        
+        return self._send_email(
+            to_email=user_email,
+            subject=subject,
+            html_body=html_body,
+            text_body=text_body
+        )
+    
+    def send_2fa_code_email(self, user_email: str, code: str, method: str, user_name: str) -> bool:
+        """Send 2FA code email."""
+        subject = f"Your clipsmith verification code ({method.upper()})"
+        
+        html_body = _TWO_FACTOR_HTML.substitute(
+            user_name=escape(user_name), code=escape(code)
+        )
+        
+        text_body = _TWO_FACTOR_TEXT.substitute(
+            method=method.upper(), user_name=user_name, code=code
+        )
+        
+        return self._send_email(
+            to_email=user_email,
+            subject=subject,
+            html_body=html_body,
+            text_body=text_body
+        )
+    
+    def send_password_reset_email(self, user_email: str, reset_token: str, user_name: str) -> bool:
+        """Send password reset email."""
+        subject = "Reset your clipsmith password"
+        
+        reset_url = f"{FRONTEND_URL}/reset-password?token={reset_token}"
+        
+        html_body = _PASSWORD_RESET_HTML.substitute(
+            user_name=escape(user_name), reset_url=escape(reset_url)
+        )
+        
+        text_body = _PASSWORD_RESET_TEXT.substitute(
+            user_name=user_name, reset_url=reset_url
+        )
+        
+        return self._send_email(
+            to_email=user_email,
+            subject=subject,
+            html_body=html_body,
+            text_body=text_body
+        )
+    
+    def send_welcome_email(self, user_email: str, user_name: str) -> bool:
+        """Send welcome email after successful registration."""
+        subject = "Welcome to clipsmith!"
+        
+        html_body = _WELCOME_HTML.substitute(
+            user_name=escape(user_name), frontend_url=escape(FRONTEND_URL)
+        )
+        
+        text_body = _WELCOME_TEXT.substitute(
+            user_name=user_name, frontend_url=FRONTEND_URL
+        )
         
         return self._send_email(
             to_email=user_email,
@@ -271,31 +367,82 @@ class EmailService:
         )
     
     def _send_email(self, to_email: str, subject: str, html_body: str, text_body: str) -> bool:
-        """Send email using configured SMTP server."""
-        if not self._smtp_server:
+        """Queue an email for background delivery.
+
+        Returns True once the email is accepted; delivery failures are retried
+        and, if they persist, logged as dead letters.
+        """
+        if not self.smtp_configured:
             # Log email to console if SMTP not configured
             logger.info(f"Email would be sent to {to_email}")
             logger.info(f"Subject: {subject}")
             logger.info(f"HTML Body: {html_body[:200]}...")
             return True
-        
+
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg.attach(MIMEText(text_body, 'plain'))
-            msg.attach(MIMEText(html_body, 'html'))
-            
-            msg['Subject'] = subject
-            msg['From'] = formataddr((self.from_name, self.from_email))
-            msg['To'] = to_email
-            
-            # Send email
-            text = msg.as_string()
-            self._smtp_server.sendmail(self.from_email, [to_email], text)
-            
-            logger.info(f"Email sent successfully to {to_email}")
-            return True
-            
+            self._executor.submit(
+                self._deliver_with_retry, to_email, subject, html_body, text_body
+            )
+        except RuntimeError as e:
+            # Executor already shut down
+            logger.error(f"Failed to queue email to {to_email}: {e}")
+            return False
+        return True
+
+    def _deliver_with_retry(
+        self, to_email: str, subject: str, html_body: str, text_body: str
+    ) -> bool:
+        for attempt in range(MAX_SEND_ATTEMPTS):
+            if self._send_email_sync(to_email, subject, html_body, text_body):
+                return True
+            if attempt + 1 < MAX_SEND_ATTEMPTS:
+                time.sleep(SEND_RETRY_BACKOFF_SECONDS * 2**attempt)
+
+        logger.error(
+            f"Dead-lettered email to {to_email} after {MAX_SEND_ATTEMPTS} "
+            f"attempts (subject: {subject})"
+        )
+        return False
+
+    def _send_email_sync(
+        self, to_email: str, subject: str, html_body: str, text_body: str
+    ) -> bool:
+        """Deliver one email over a pooled SMTP connection."""
+        # Create message
+        msg = EmailMessage()
+        msg['Subject'] = subject
+        msg['From'] = formataddr((self.from_name, self.from_email))
+        msg['To'] = to_email
+        msg.set_content(text_body)
+        msg.add_alternative(html_body, subtype='html')
+
+        conn = None
+        try:
+            conn = self._acquire()
+            conn.send_message(msg, self.from_email, [to_email])
+        except smtplib.SMTPServerDisconnected:
+            # The connection dropped between the NOOP and the send; retry once
+            # on a fresh one
+            if conn is not None:
+                conn.close()
+                conn = None
+            try:
+                conn = self._connect()
+                conn.send_message(msg, self.from_email, [to_email])
+            except Exception as e:
+                return self._send_failed(conn, to_email, e)
         except Exception as e:
-            logger.error(f"Failed to send email to {to_email}: {e}")
-            return False
\ No newline at end of file
+            return self._send_failed(conn, to_email, e)
+
+        self._release(conn)
+        logger.info(f"Email sent successfully to {to_email}")
+        return True
+
+    def _send_failed(
+        self, conn: Optional[smtplib.SMTP], to_email: str, error: Exception
+    ) -> bool:
+        # A connection in an unknown state is not returned to the pool
+        if conn is not None:
+            conn.close()
+        logger.error(f"Failed to send email to {to_email}: {error}")
+        return False
@@ -1,8 +1,81 @@
 import re
-from typing import List, Set
+import string
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Set
 from ...domain.entities.hashtag import Hashtag
 from ...domain.ports.repository_ports import HashtagRepositoryPort
 
+# Matches # followed by letters, digits or underscores
+_HASHTAG_RE = re.compile(r"#([A-Za-z0-9_]+)")
+_ASCII_UPPERCASE = frozenset(string.ascii_uppercase)
+
+
+def _camel_split(text: str) -> str:
+    """Insert a space before every ASCII capital except a leading one."""
+    rest = text[1:]
+    # Most tags arrive lowercased, so skip the rebuild when nothing splits
+    if _ASCII_UPPERCASE.isdisjoint(rest):
+        return text
+    return text[0] + "".join(
+        [" " + char if char in _ASCII_UPPERCASE else char for char in rest]
+    )
+
+
+# Pure functions of the tag; tags repeat heavily across videos, so the
+# caches stay hot
+@lru_cache(maxsize=4096)
+def _normalize_hashtag(hashtag: str) -> str:
+    """
+    Convert hashtag to various display formats.
+    - original: #video
+    - camel case: #VideoEditing
+    - readable: #video_editing
+    """
+    # Choose format based on length and complexity
+    if len(hashtag) <= 6:
+        # Short hashtags use original
+        return f"#{hashtag}"
+    elif "_" in hashtag:
+        # Snake case to title case
+        words = hashtag.split("_")
+        title_case = "".join(word.capitalize() for word in words)
+        return f"#{title_case}"
+    elif hashtag.isalnum():
+        # Camel case to readable (underscored tags took the branch above)
+        readable = _camel_split(hashtag).strip()
+        return f"#{readable.lower()}"
+    else:
+        # Default to original
+        return f"#{hashtag}"
+
+
+@lru_cache(maxsize=4096)
+def _to_camel_case(text: str) -> str:
+    """Convert text to camel case."""
+    if "_" in text:
+        words = text.split("_")
+        return "".join(word.capitalize() for word in words)
+    return text.capitalize()
+
+
+@lru_cache(maxsize=8192)
+def _format_for_display(base_hashtag: str) -> Mapping[str, str]:
+    """Display variants of a hashtag, shared read-only across calls."""
+    return MappingProxyType(
+        {
+            "original": f"#{base_hashtag}",
+            "camel_case": _to_camel_case(base_hashtag),
+            "readable": _camel_split(base_hashtag).lower(),
+            "title_case": " ".join(
+                word.capitalize() for word in base_hashtag.split("_")
+            ),
+            "short": base_hashtag
+            if len(base_hashtag) <= 8
+            else base_hashtag[:8] + "...",
+        }
+    )
+
 
 class HashtagService:
     """Service for extracting and managing hashtags."""
@@ -20,17 +93,18 @@ class HashtagService:
         - #snake_case
         - Multiple per text: "Check out #video and #editing"
         """
-        if not text:
+        # Most titles and descriptions have no hashtags; the substring check
+        # is far cheaper than running the regex
+        if not text or "#" not in text:
             return []
 
-        # Regex pattern to match hashtags
-        # Matches # followed by word characters, spaces, or underscores
-        hashtag_pattern = r"#([A-Za-z0-9_]+)"
-        matches = re.findall(hashtag_pattern, text)
+        matches = _HASHTAG_RE.findall(text)
 
-        # Normalize and deduplicate
+        # Normalize and deduplicate; distinct raw tags can normalize to the
+        # same display form, so both are tracked
         hashtags = []
         seen = set()
+        seen_normalized = set()
 
         for match in matches:
             hashtag = match.lower()
@@ -38,51 +112,25 @@ class HashtagService:
                 seen.add(hashtag)
 
                 # Convert to different formats
-                normalized = self._normalize_hashtag(hashtag)
-                hashtags.append(normalized)
+                normalized = _normalize_hashtag(hashtag)
+                if normalized not in seen_normalized:
+                    seen_normalized.add(normalized)
+                    hashtags.append(normalized)
 
         return hashtags
 
-    def _normalize_hashtag(self, hashtag: str) -> str:
-        """
-        Convert hashtag to various display formats.
-        - original: #video
-        - camel case: #VideoEditing
-        - readable: #video_editing
-        """
-        # Choose format based on length and complexity
-        if len(hashtag) <= 6:
-            # Short hashtags use original
-            return f"#{hashtag}"
-        elif "_" in hashtag:
-            # Snake case to title case
-            words = hashtag.split("_")
-            title_case = "".join(word.capitalize() for word in words)
-            return f"#{title_case}"
-        elif hashtag.replace("_", "").isalnum():
-            # Camel case to readable
-            readable = re.sub(r"(?<!^)([A-Z])", r" \1", hashtag).strip()
-            return f"#{readable.lower()}"
-        else:
-            # Default to original
-            return f"#{hashtag}"
-
     def process_video_hashtags(
         self, video_id: str, title: str, description: str
     ) -> List[str]:
         """
         Extract and store hashtags from video metadata.
         """
-        # Extract from title and description
-        title_hashtags = self.extract_hashtags(title)
-        description_hashtags = self.extract_hashtags(description)
-
-        # Combine and deduplicate
-        all_hashtags = list(set(title_hashtags + description_hashtags))
+        # Scan title and description in one pass; the newline separator cannot
+        # be part of a hashtag, so no match spans the two fields
+        all_hashtags = self.extract_hashtags(f"{title or ''}\n{description or ''}")
 
         # Update hashtag usage counts
-        for hashtag_name in all_hashtags:
-            self.hashtag_repo.update_hashtag_usage(hashtag_name)
+        self.hashtag_repo.update_hashtag_usage_batch(all_hashtags)
 
         return all_hashtags
 
@@ -90,43 +138,13 @@ class HashtagService:
         """
         Calculate trending hashtags based on recent usage.
         """
-        trending_hashtags = self.hashtag_repo.get_trending_hashtags(limit=20)
-
-        # Calculate trending scores based on:
+        # Scores are boosted for:
         # 1. Recent usage (last N hours)
-        # 2. Growth rate (increase in usage)
-        # 3. Diversity (used across multiple videos)
-
-        recent_hashtags = self.hashtag_repo.get_recent_hashtags(hours=hours, limit=50)
-
-        # Update trending scores
-        hashtag_scores = {}
-
-        for hashtag in trending_hashtags:
-            # Base score from current trending score
-            score = hashtag.trending_score
-
-            # Boost for recent usage
-            recent_usage = any(h.name == hashtag.name for h in recent_hashtags)
-            if recent_usage:
-                score *= 1.5
-
-            # Boost for high usage count
-            if hashtag.count > 10:
-                score *= 1.2
-
-            # Boost for consistent usage
-            if hashtag.count > 5:
-                score *= 1.1
-
-            hashtag_scores[hashtag.name] = score
-
-        # Update scores in database
-        if hashtag_scores:
-            self.hashtag_repo.update_trending_scores(hashtag_scores)
-
-        # Return updated trending list
-        return self.hashtag_repo.get_trending_hashtags(limit=20)
+        # 2. High usage count
+        # 3. Consistent usage
+        # The repository applies the boosts and returns the new ranking in one
+        # statement.
+        return self.hashtag_repo.recalculate_and_fetch_trending(hours=hours, limit=20)
 
     def get_hashtag_suggestions(self, query: str, limit: int = 10) -> List[str]:
         """
@@ -148,30 +166,5 @@ class HashtagService:
         """
         Format hashtags for UI display with various styles.
         """
-        formatted = []
-
-        for hashtag in hashtags:
-            base_hashtag = hashtag.lstrip("#")
-
-            formatted_hashtag = {
-                "original": f"#{base_hashtag}",
-                "camel_case": self._to_camel_case(base_hashtag),
-                "readable": re.sub(r"(?<!^)([A-Z])", r" \1", base_hashtag).lower(),
-                "title_case": " ".join(
-                    word.capitalize() for word in base_hashtag.split("_")
-                ),
-                "short": base_hashtag
-                if len(base_hashtag) <= 8
-                else base_hashtag[:8] + "...",
-            }
-
-            formatted.append(formatted_hashtag)
-
-        return formatted
-
-    def _to_camel_case(self, text: str) -> str:
-        """Convert text to camel case."""
-        if "_" in text:
-            words = text.split("_")
-            return "".join(word.capitalize() for word in words)
-        return text.capitalize()
+        # Copies keep callers from mutating the cached formats
+        return [dict(_format_for_display(hashtag.lstrip("#"))) for hashtag in hashtags]
@@ -2,13 +2,35 @@ import logging
 import json
 import os
 import sys
+import time
+from collections import Counter, deque
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional
 from contextlib import contextmanager
 
+import psutil
 import structlog
 from pythonjsonlogger import jsonlogger
 
+# (epoch second, its ISO string); swapped as one tuple so readers never see a
+# mismatched pair
+_iso_second_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO format at one-second resolution.
+
+    Log lines are stamped far more often than once a second, so the string is
+    formatted once per second and reused.
+    """
+    global _iso_second_cache
+    now = int(time.time())
+    cached_second, cached_iso = _iso_second_cache
+    if cached_second != now:
+        cached_iso = datetime.utcfromtimestamp(now).isoformat()
+        _iso_second_cache = (now, cached_iso)
+    return cached_iso
+
 # Configure structured logging
 class ClipsmithLogger:
     """Enhanced logging system for clipsmith with structured output."""
@@ -57,7 +79,7 @@ class ClipsmithLogger:
             f"User Action: {action}",
             user_id=user_id,
             action_type="user_action",
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=_now_iso(),
             **kwargs
         )
     
@@ -67,7 +89,7 @@ class ClipsmithLogger:
             f"Security Event: {event_type}",
             user_id=user_id,
             event_type="security",
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=_now_iso(),
             severity=kwargs.get("severity", "medium"),
             **kwargs
         )
@@ -79,64 +101,115 @@ class ClipsmithLogger:
             metric_name=metric_name,
             value=value,
             metric_type="performance",
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=_now_iso(),
             **kwargs
         )
     
     def log_api_request(self, method: str, endpoint: str,
                     status_code: int, response_time: float, user_id: Optional[str] = None, **kwargs):
         """Log API requests for monitoring and analytics."""
-        self.info(
-            f"API Request: {method} {endpoint} -> {status_code} ({response_time:.2f}s)",
+        # Fields go straight to structlog as key/value pairs; no preformatted
+        # message or extra= wrapper to build per request
+        self.logger.info(
+            "api_request",
             method=method,
             endpoint=endpoint,
             user_id=user_id,
             status_code=status_code,
             response_time=response_time,
             request_type="api_request",
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=_now_iso(),
             **kwargs
         )
 
 # Global logger instance
 logger = ClipsmithLogger()
 
+# Request history kept in memory, and how many of the newest requests the
+# summary covers
+MAX_TRACKED_API_REQUESTS = 1000
+RECENT_API_REQUEST_WINDOW = 100
+# Error keys include request paths, so distinct keys are capped; once the cap
+# is doubled, only the most frequent MAX_TRACKED_ERROR_KEYS are kept
+MAX_TRACKED_ERROR_KEYS = 1000
+
+
+class ApiRequestRecord(NamedTuple):
+    """One buffered API request; a tuple keeps the 1000-entry window compact."""
+    timestamp: float  # Epoch seconds
+    method: str
+    endpoint: str
+    user_id: Optional[str]
+    status_code: int
+    response_time: float
+
 class MonitoringService:
     """Service for application monitoring and health checks."""
     
     def __init__(self):
         self.metrics = {
-            'api_requests': [],
-            'error_counts': {},
+            'api_requests': deque(maxlen=MAX_TRACKED_API_REQUESTS),
+            'error_counts': Counter(),
             'performance_metrics': [],
             'active_users': set(),
             'system_health': {}
         }
+        # Running totals over the newest RECENT_API_REQUEST_WINDOW requests,
+        # kept in step with the deque so the summary never rescans it
+        self._recent_response_time_sum = 0.0
+        self._recent_error_count = 0
+        # Exact total, unaffected by trimming rare error keys
+        self._total_errors = 0
     
     def record_api_request(self, method: str, endpoint: str, user_id: Optional[str], 
                         status_code: int, response_time: float):
         """Record API request metrics."""
-        logger.log_api_request(method, endpoint, user_id, status_code, response_time)
+        logger.log_api_request(
+            method=method,
+            endpoint=endpoint,
+            status_code=status_code,
+            response_time=response_time,
+            user_id=user_id,
+        )
         
-        self.metrics['api_requests'].append({
-            'timestamp': datetime.utcnow(),
-            'method': method,
-            'endpoint': endpoint,
-            'user_id': user_id,
-            'status_code': status_code,
-            'response_time': response_time
-        })
+        api_requests = self.metrics['api_requests']
+        api_requests.append(ApiRequestRecord(
+            timestamp=time.time(),
+            method=method,
+            endpoint=endpoint,
+            user_id=user_id,
+            status_code=status_code,
+            response_time=response_time,
+        ))
+
+        self._recent_response_time_sum += response_time
+        self._recent_error_count += status_code >= 400
+        if len(api_requests) > RECENT_API_REQUEST_WINDOW:
+            # The request that just slid out of the window
+            expired = api_requests[-RECENT_API_REQUEST_WINDOW - 1]
+            self._recent_response_time_sum -= expired.response_time
+            self._recent_error_count -= expired.status_code >= 400
         
         # Track error rates
         if status_code >= 400:
             error_key = f"{endpoint}_{method}"
-            self.metrics['error_counts'][error_key] = self.metrics['error_counts'].get(error_key, 0) + 1
+            self._count_error(error_key)
     
     def record_error(self, error_type: str, error_message: str, context: Dict[str, Any] = None):
         """Record application errors."""
         logger.error(f"Application Error: {error_type} - {error_message}", extra=context or {})
         
-        self.metrics['error_counts'][error_type] = self.metrics['error_counts'].get(error_type, 0) + 1
+        self._count_error(error_type)
+
+    def _count_error(self, error_key: str):
+        error_counts = self.metrics['error_counts']
+        error_counts[error_key] += 1
+        self._total_errors += 1
+
+        if len(error_counts) > 2 * MAX_TRACKED_ERROR_KEYS:
+            self.metrics['error_counts'] = Counter(
+                dict(error_counts.most_common(MAX_TRACKED_ERROR_KEYS))
+            )
     
     def record_user_activity(self, user_id: str, activity_type: str, **kwargs):
         """Record user activity for analytics."""
@@ -145,9 +218,6 @@ class MonitoringService:
     
     def get_health_status(self) -> Dict[str, Any]:
         """Get system health status."""
-        import psutil
-        import os
-        
         try:
             # CPU usage
             cpu_percent = psutil.cpu_percent(interval=1)
@@ -164,7 +234,7 @@ class MonitoringService:
             db_accessible = os.path.exists('database.db')
             
             health_status = {
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': _now_iso(),
                 'status': 'healthy' if all([
                     cpu_percent < 90,  # CPU less than 90%
                     memory_percent < 90,  # Memory less than 90%
@@ -187,38 +257,31 @@ class MonitoringService:
         except Exception as e:
             logger.error(f"Health check failed: {e}")
             return {
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': _now_iso(),
                 'status': 'error',
                 'error': str(e)
             }
     
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get summary of collected metrics."""
-        recent_requests = [
-            req for req in self.metrics['api_requests'][-100:]  # Last 100 requests
-        ]
+        recent_count = min(len(self.metrics['api_requests']), RECENT_API_REQUEST_WINDOW)
         
-        if recent_requests:
-            avg_response_time = sum(req['response_time'] for req in recent_requests) / len(recent_requests)
-            error_rate = sum(1 for req in recent_requests if req['status_code'] >= 400) / len(recent_requests)
+        if recent_count:
+            avg_response_time = self._recent_response_time_sum / recent_count
+            error_rate = self._recent_error_count / recent_count
         else:
             avg_response_time = 0
             error_rate = 0
         
-        total_errors = sum(self.metrics['error_counts'].values())
-        
         return {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _now_iso(),
             'active_users': len(self.metrics['active_users']),
-            'recent_api_requests': len(recent_requests),
+            'recent_api_requests': recent_count,
             'average_response_time': round(avg_response_time, 3),
             'error_rate': round(error_rate * 100, 2),
-            'total_errors': total_errors,
-            'top_errors': sorted(
-                self.metrics['error_counts'].items(), 
-                key=lambda x: x[1], 
-                reverse=True
-            )[:10]
+            'total_errors': self._total_errors,
+            # most_common(n) selects with heapq.nlargest instead of a full sort
+            'top_errors': self.metrics['error_counts'].most_common(10)
         }
 
 class ErrorReportingService:
@@ -230,11 +293,15 @@ class ErrorReportingService:
         if self.dsn:
             try:
                 import sentry_sdk
-                self.sentry_client = sentry_sdk.init(
+                sentry_sdk.init(
                     dsn=self.dsn,
                     traces_sample_rate=float(os.getenv('SENTRY_TRACES_SAMPLE_RATE', '0.1')),
                     environment=os.getenv('ENVIRONMENT', 'development')
                 )
+                # Static tag lives on the global scope, so captures only need a
+                # scope of their own when they carry context
+                sentry_sdk.set_tag("clipsmith", "production")
+                self.sentry_client = sentry_sdk
                 logger.info("Sentry error reporting initialized")
             except Exception as e:
                 logger.error(f"Failed to initialize Sentry: {e}")
@@ -246,9 +313,12 @@ class ErrorReportingService:
     def capture_exception(self, exception: Exception, context: Optional[Dict[str, Any]] = None):
         """Capture exception to external error reporting service."""
         if self.sentry_client:
-            with self.sentry_client.push_scope() as scope:
-                scope.set_tag("clipsmith", "production")
-                scope.set_extra(context or {})
+            if context:
+                with self.sentry_client.new_scope() as scope:
+                    for key, value in context.items():
+                        scope.set_extra(key, value)
+                    self.sentry_client.capture_exception(exception)
+            else:
                 self.sentry_client.capture_exception(exception)
         
         # Also log locally
@@ -257,16 +327,14 @@ class ErrorReportingService:
     def capture_message(self, message: str, level: str = "error", context: Optional[Dict[str, Any]] = None):
         """Capture message to external error reporting service."""
         if self.sentry_client:
-            with self.sentry_client.push_scope() as scope:
-                scope.set_tag("clipsmith", "production")
-                scope.set_extra(context or {})
-                
-                if level == "error":
-                    self.sentry_client.capture_message(message, level="error")
-                elif level == "warning":
-                    self.sentry_client.capture_message(message, level="warning")
-                else:
-                    self.sentry_client.capture_message(message, level="info")
+            sentry_level = level if level in ("error", "warning") else "info"
+            if context:
+                with self.sentry_client.new_scope() as scope:
+                    for key, value in context.items():
+                        scope.set_extra(key, value)
+                    self.sentry_client.capture_message(message, level=sentry_level)
+            else:
+                self.sentry_client.capture_message(message, level=sentry_level)
         
         # Also log locally
         log_method = getattr(logger, level.lower(), logger.info)
@@ -220,11 +220,18 @@ class NotificationService:
 
     def send_bulk_notifications(self, notifications: list[Notification]) -> int:
         """Send multiple notifications efficiently."""
-        success_count = 0
-        for notification in notifications:
-            if self.send_notification(notification):
-                success_count += 1
-        return success_count
+        if not notifications:
+            return 0
+
+        try:
+            # One bulk insert instead of a save and commit per notification
+            saved_count = self.notification_repo.save_many(notifications)
+        except Exception as e:
+            logger.error(f"Error sending bulk notifications: {e}")
+            return 0
+
+        logger.info(f"{saved_count} notifications created in bulk")
+        return saved_count
 
     def mark_notifications_read(
         self, user_id: str, notification_ids: Optional[list[str]] = None
@@ -232,11 +239,7 @@ class NotificationService:
         """Mark notifications as read."""
         if notification_ids:
             # Mark specific notifications as read
-            count = 0
-            for notification_id in notification_ids:
-                if self.notification_repo.mark_as_read(notification_id):
-                    count += 1
-            return count
+            return self.notification_repo.mark_as_read_batch(user_id, notification_ids)
         else:
             # Mark all as read
             return self.notification_repo.mark_all_as_read(user_id)
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from ...domain.entities.payment import (
@@ -127,6 +128,8 @@ class PaymentService:
 
         for transaction in transactions:
             if transaction.transaction_type == TransactionType.TIP:
+                # Stage the writes below and commit them together
+                self.repository.begin()
                 try:
                     # Update sender transaction
                     completed_transaction = transaction.complete()
@@ -165,6 +168,8 @@ class PaymentService:
                             "transaction_id": transaction.id,
                             "receiver_transaction_id": saved_receiver.id,
                         }
+
+                    self.repository.commit()
                 except Exception:
                     self.repository.rollback()
                     raise
@@ -196,10 +201,13 @@ class PaymentService:
         if not wallet.stripe_account_id:
             return {"success": False, "error": "Stripe Connect account not setup"}
 
-        # Calculate payout amount with fees (PRD: 70% creator, 30% platform)
+        # Calculate payout amount with fees (PRD: 70% creator, 30% platform).
+        # Split in integer cents so fee + net always add up to the balance
         platform_fee_rate = 0.30  # 30% platform fee per PRD Creator Fund 2.0
-        fee_amount = wallet.balance * platform_fee_rate
-        net_amount = wallet.balance - fee_amount
+        balance_cents = round(wallet.balance * 100)
+        fee_cents = round(balance_cents * platform_fee_rate)
+        fee_amount = fee_cents / 100
+        net_amount = (balance_cents - fee_cents) / 100
 
         # Create payout record
         payout = Payout(
@@ -259,21 +267,19 @@ class PaymentService:
         interval: str = "month",
     ) -> Dict[str, Any]:
         """Create a subscription to a creator."""
-        # Create or get customer for subscriber
-        # This would typically get user email from user service
-        customer_result = await self.stripe_service.create_customer(
-            email=f"user_{subscriber_id}@example.com",
-            metadata={"user_id": subscriber_id},
+        # Customer and price are independent, so create them concurrently.
+        # The customer email would typically come from the user service
+        customer_result, price_result = await asyncio.gather(
+            self.stripe_service.create_customer(
+                email=f"user_{subscriber_id}@example.com",
+                metadata={"user_id": subscriber_id},
+            ),
+            self.stripe_service.create_price(amount=amount, interval=interval),
         )
 
         if not customer_result["success"]:
             return {"success": False, "error": customer_result["error"]}
 
-        # Create price for subscription
-        price_result = await self.stripe_service.create_price(
-            amount=amount, interval=interval
-        )
-
         if not price_result["success"]:
             return {"success": False, "error": price_result["error"]}
 
@@ -381,37 +387,36 @@ class PaymentService:
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
         # Get subscribers count
-        subscribers = self.repository.get_creator_subscribers(creator_id)
+        subscriber_count = self.repository.count_creator_subscribers(creator_id)
 
         # Get transaction summary
         transaction_summary = self.repository.get_transaction_summary(creator_id, days)
 
         # Get payout summary
-        payouts = self.repository.get_user_payouts(creator_id)
-        recent_payouts = [p for p in payouts if p.created_at >= cutoff_date]
+        recent_payouts = self.repository.count_payouts_since(creator_id, cutoff_date)
 
         return {
             "period_days": days,
-            "active_subscribers": len(subscribers),
+            "active_subscribers": subscriber_count,
             "monthly_revenue": transaction_summary["total_earnings"],
             "total_tips": transaction_summary["tips_count"],
             "total_subscriptions": transaction_summary["subscriptions_count"],
-            "recent_payouts": len(recent_payouts),
+            "recent_payouts": recent_payouts,
             "average_tip_amount": (
                 transaction_summary["total_earnings"]
                 / transaction_summary["tips_count"]
                 if transaction_summary["tips_count"] > 0
                 else 0
             ),
-            "subscriber_growth": self._calculate_subscriber_growth(creator_id, days),
+            "subscriber_growth": self._calculate_subscriber_growth(
+                subscriber_count, days
+            ),
         }
 
-    def _calculate_subscriber_growth(self, creator_id: str, days: int) -> float:
+    def _calculate_subscriber_growth(self, current_subscribers: int, days: int) -> float:
         """Calculate subscriber growth rate."""
         # This would typically compare current period with previous period
         # For now, return placeholder value
-        current_subscribers = len(self.repository.get_creator_subscribers(creator_id))
-
         if days <= 0:
             return 0.0
 
@@ -1,8 +1,12 @@
 import logging
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict
+from functools import lru_cache
+import heapq
 import math
+import threading
+import time
 
 from ...domain.entities.video import Video
 from ...domain.entities.user import User
@@ -10,6 +14,30 @@ from ...domain.entities.interaction import InteractionType
 
 logger = logging.getLogger(__name__)
 
+# Interest profiles are reused across requests while a user's interactions are
+# unchanged; the TTL bounds how stale their time decay can get
+INTEREST_CACHE_SIZE = 10000
+INTEREST_CACHE_TTL_SECONDS = 60
+
+# (source, user_id, interaction count, newest created_at) -> (computed at,
+# interests); the source keeps a user's full history and their rows sampled
+# from all_interactions apart even when count and watermark coincide
+_interest_cache: OrderedDict = OrderedDict()
+_interest_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=8192)
+def _tokenize_video_text(title: str, description: str) -> Tuple[str, ...]:
+    """Title and description words longer than two characters, lowercased.
+
+    Candidate videos are scored on every feed request, so their tokens are
+    memoized by text rather than re-split each time.
+    """
+    # For now, basic tokenization. Later can add hashtags, categories, etc.
+    words = title.lower().split() + description.lower().split()
+    return tuple(word for word in words if len(word) > 2)
+
+
 class RecommendationEngine:
     """Advanced recommendation engine for personalized video feeds."""
     
@@ -24,53 +52,93 @@ class RecommendationEngine:
 
         self.time_decay_hours = 24  # Content freshness window
         self.max_recommendations = 100
+        self.candidate_window_days = 30  # Recency pre-filter for scoring
         
     def calculate_user_interests(self, user_interactions: List[Dict]) -> Dict[str, float]:
         """Calculate user interest scores based on interaction history."""
-        interests = defaultdict(float)
         current_time = datetime.utcnow()
-        
+        decay_per_second = 1.0 / (3600 * self.time_decay_hours)
+        decay_factors = self.decay_factors
+        exp = math.exp
+
+        # Sum weighted, time-decayed scores per video first: a video usually
+        # has several interactions (view, like, comment), and its features
+        # then only need extracting and spreading over tags once
+        video_scores = defaultdict(float)
+        videos = {}
         for interaction in user_interactions:
-            # Calculate time decay
-            hours_ago = (current_time - interaction['created_at']).total_seconds() / 3600
-            time_decay = math.exp(-hours_ago / self.time_decay_hours)
-            
+            seconds_ago = (current_time - interaction['created_at']).total_seconds()
+            interaction_weight = decay_factors.get(interaction['interaction_type'], 1.0)
+            video_id = interaction['video_id']
+            video_scores[video_id] += interaction_weight * exp(-seconds_ago * decay_per_second)
+            videos.setdefault(video_id, interaction['video'])
+
+        interests = defaultdict(float)
+        for video_id, score in video_scores.items():
             # Extract content features (hashtags, categories, etc.)
-            video_tags = self._extract_video_features(interaction['video'])
-            
-            # Apply interaction weight and time decay
-            interaction_weight = self.decay_factors.get(interaction['interaction_type'], 1.0)
-            score = interaction_weight * time_decay
-            
-            for tag in video_tags:
+            for tag in self._extract_video_features(videos[video_id]):
                 interests[tag] += score
-        
+
         return dict(interests)
+
+    def _cached_user_interests(
+        self, source: str, user_id: str, user_interactions: List[Dict]
+    ) -> Dict[str, float]:
+        """calculate_user_interests, memoized per source, user and interaction watermark.
+
+        The returned dict may be shared with other callers and must not be
+        modified.
+        """
+        if not user_interactions:
+            return {}
+
+        key = (
+            source,
+            user_id,
+            len(user_interactions),
+            max(interaction['created_at'] for interaction in user_interactions),
+        )
+        now = time.monotonic()
+        with _interest_cache_lock:
+            entry = _interest_cache.get(key)
+            if entry is not None and now - entry[0] < INTEREST_CACHE_TTL_SECONDS:
+                _interest_cache.move_to_end(key)
+                return entry[1]
+
+        interests = self.calculate_user_interests(user_interactions)
+        with _interest_cache_lock:
+            _interest_cache[key] = (now, interests)
+            _interest_cache.move_to_end(key)
+            while len(_interest_cache) > INTEREST_CACHE_SIZE:
+                _interest_cache.popitem(last=False)
+        return interests
     
     def find_similar_users(self, user_id: str, all_interactions: List[Dict]) -> List[tuple]:
         """Find users with similar interaction patterns."""
-        user_interactions = [i for i in all_interactions if i['user_id'] == user_id]
-        user_interests = self.calculate_user_interests(user_interactions)
-        
-        similarities = []
-        
-        # Group interactions by user
+        # Group interactions by user in a single pass, target user included
         user_groups = defaultdict(list)
         for interaction in all_interactions:
-            if interaction['user_id'] != user_id:
-                user_groups[interaction['user_id']].append(interaction)
-        
+            user_groups[interaction['user_id']].append(interaction)
+
+        user_interests = self._cached_user_interests(
+            "sampled", user_id, user_groups.pop(user_id, [])
+        )
+        if not user_interests:
+            return []
+
+        similarities = []
         for other_user_id, other_interactions in user_groups.items():
-            other_interests = self.calculate_user_interests(other_interactions)
-            
+            other_interests = self._cached_user_interests(
+                "sampled", other_user_id, other_interactions
+            )
+
             # Calculate cosine similarity
             similarity = self._cosine_similarity(user_interests, other_interests)
             if similarity > 0.1:  # Minimum similarity threshold
                 similarities.append((other_user_id, similarity))
-        
-        # Sort by similarity and return top users
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:20]  # Top 20 similar users
+
+        # Top 20 similar users, without sorting every candidate
+        return heapq.nlargest(20, similarities, key=lambda x: x[1])
     
     def recommend_videos(
         self, 
@@ -88,55 +156,87 @@ class RecommendationEngine:
         user_following = user_following or set()
         
         # Get user's interest profile
-        user_interests = self.calculate_user_interests(user_interactions)
+        user_interests = self._cached_user_interests(
+            "history", user_id, user_interactions
+        )
         
         # Find similar users
         similar_users = self.find_similar_users(user_id, all_interactions)
         similar_user_ids = [user_id for user_id, _ in similar_users]
+
+        # Videos the user already interacted with, for O(1) skip checks
+        seen_video_ids = self._interacted_video_ids(user_id, user_interactions)
+
+        # Similar users' weighted engagement per video, from one pass over
+        # all_interactions instead of a rescan per video and similar user
+        similarity_by_user = dict(similar_users)
+        similar_scores = defaultdict(float)
+        if similarity_by_user:
+            for interaction in all_interactions:
+                similarity = similarity_by_user.get(interaction['user_id'])
+                if similarity is not None:
+                    weight = self.decay_factors.get(interaction['interaction_type'], 1.0)
+                    similar_scores[interaction['video_id']] += weight * similarity
+
+        # Creators followed by the top similar users, from one pass over
+        # all_interactions; each candidate then needs only set lookups
+        top_similar_user_ids = set(similar_user_ids[:10])
+        follows_by_user = defaultdict(set)
+        if top_similar_user_ids:
+            follow_type = InteractionType.FOLLOW.value
+            for interaction in all_interactions:
+                if (
+                    interaction['interaction_type'] == follow_type
+                    and interaction['user_id'] in top_similar_user_ids
+                ):
+                    follows_by_user[interaction['user_id']].add(interaction['target_user_id'])
+        followed_creator_counts = Counter(
+            creator_id for creators in follows_by_user.values() for creator_id in creators
+        )
         
+        # Freshness has decayed to ~0 after a few weeks, so large catalogs
+        # only score recent videos plus those from followed creators
+        candidate_cutoff = current_time - timedelta(days=self.candidate_window_days)
+        candidates = [
+            video for video in all_videos
+            if video.created_at > candidate_cutoff or video.creator_id in user_following
+        ]
+        if len(candidates) < self.max_recommendations * 3:
+            candidates = all_videos
+
         # Score videos
         video_scores = []
+        freshness_decay_seconds = 3600 * 24 * 7  # 7-day decay
+        exp = math.exp
         
-        for video in all_videos:
+        for video in candidates:
             # Skip if user already interacted with this video
-            if self._user_interacted_with_video(user_id, video.id, user_interactions):
+            if video.id in seen_video_ids:
                 continue
             
             score = 0.0
             
-            # 1. Interest relevance score
-            video_tags = self._extract_video_features_from_entity(video)
-            interest_score = sum(
-                user_interests.get(tag, 0) for tag in video_tags
-            )
-            score += interest_score * 0.4  # 40% weight
+            # 1. Interest relevance score (no tokenizing without a profile)
+            if user_interests:
+                video_tags = self._extract_video_features_from_entity(video)
+                interest_score = sum(
+                    user_interests.get(tag, 0) for tag in video_tags
+                )
+                score += interest_score * 0.4  # 40% weight
             
             # 2. Similar users' preferences
-            similar_score = 0.0
-            for similar_user_id, similarity in similar_users:
-                user_interactions_for_video = [
-                    i for i in all_interactions 
-                    if i['user_id'] == similar_user_id and i['video_id'] == video.id
-                ]
-                for interaction in user_interactions_for_video:
-                    weight = self.decay_factors.get(interaction['interaction_type'], 1.0)
-                    similar_score += weight * similarity
-            score += similar_score * 0.3  # 30% weight
+            score += similar_scores.get(video.id, 0.0) * 0.3  # 30% weight
             
             # 3. Following creator boost
             if video.creator_id in user_following:
                 score += 50.0  # Following boost
-            elif similar_user_ids:
-                # Check if similar users follow this creator
-                similar_followers = sum(
-                    1 for user_id in similar_user_ids[:10]
-                    if self._user_follows_creator(user_id, video.creator_id, all_interactions)
-                )
-                score += similar_followers * 10.0
+            else:
+                # Similar users who follow this creator
+                score += followed_creator_counts[video.creator_id] * 10.0
             
             # 4. Freshness score
-            hours_since_upload = (current_time - video.created_at).total_seconds() / 3600
-            freshness_score = math.exp(-hours_since_upload / (24 * 7))  # 7-day decay
+            seconds_since_upload = (current_time - video.created_at).total_seconds()
+            freshness_score = exp(-seconds_since_upload / freshness_decay_seconds)
             score += freshness_score * 20.0  # 20% weight
             
             # 5. Quality score (based on engagement)
@@ -147,9 +247,9 @@ class RecommendationEngine:
             
             video_scores.append((video, score))
         
-        # Sort by score and return top recommendations
-        video_scores.sort(key=lambda x: x[1], reverse=True)
-        return [video for video, _ in video_scores[:self.max_recommendations]]
+        # Top recommendations by score, without sorting every candidate
+        top_scores = heapq.nlargest(self.max_recommendations, video_scores, key=lambda x: x[1])
+        return [video for video, _ in top_scores]
     
     def get_trending_videos(
         self, 
@@ -161,33 +261,31 @@ class RecommendationEngine:
         current_time = datetime.utcnow()
         cutoff_time = current_time - timedelta(hours=hours)
         
-        # Filter recent interactions
-        recent_interactions = [
-            i for i in all_interactions 
-            if i['created_at'] > cutoff_time
-        ]
-        
-        # Calculate trending scores
+        # Calculate trending scores over recent interactions in one pass
         video_scores = defaultdict(float)
+        decay_per_second = 1.0 / (3600 * hours)
+        decay_factors = self.decay_factors
+        exp = math.exp
         
-        for interaction in recent_interactions:
-            video_id = interaction['video_id']
-            weight = self.decay_factors.get(interaction['interaction_type'], 1.0)
+        for interaction in all_interactions:
+            created_at = interaction['created_at']
+            if created_at <= cutoff_time:
+                continue
+            weight = decay_factors.get(interaction['interaction_type'], 1.0)
             
             # Apply time decay (more recent = higher score)
-            hours_ago = (current_time - interaction['created_at']).total_seconds() / 3600
-            time_multiplier = math.exp(-hours_ago / hours)
-            
-            video_scores[video_id] += weight * time_multiplier
-        
-        # Find corresponding videos and sort
-        trending_videos = []
-        for video in all_videos:
-            if video.id in video_scores:
-                trending_videos.append((video, video_scores[video.id]))
+            seconds_ago = (current_time - created_at).total_seconds()
+            video_scores[interaction['video_id']] += weight * exp(-seconds_ago * decay_per_second)
+        
+        # Find corresponding videos and keep the top 50
+        trending_videos = [
+            (video, video_scores[video.id])
+            for video in all_videos
+            if video.id in video_scores
+        ]
         
-        trending_videos.sort(key=lambda x: x[1], reverse=True)
-        return [video for video, _ in trending_videos[:50]]
+        top_trending = heapq.nlargest(50, trending_videos, key=lambda x: x[1])
+        return [video for video, _ in top_trending]
     
     def get_for_you_feed(
         self,
@@ -255,53 +353,36 @@ class RecommendationEngine:
         
         return features
     
-    def _extract_video_features_from_entity(self, video: Video) -> List[str]:
+    def _extract_video_features_from_entity(self, video: Video) -> Tuple[str, ...]:
         """Extract features from Video entity."""
-        features = []
-        
-        # Title words
-        features.extend(video.title.lower().split())
-        
-        # Description words
-        features.extend(video.description.lower().split())
-        
-        # For now, basic tokenization. Later can add hashtags, categories, etc.
-        return [f.strip() for f in features if len(f.strip()) > 2]
+        return _tokenize_video_text(video.title, video.description)
     
     def _cosine_similarity(self, dict1: Dict[str, float], dict2: Dict[str, float]) -> float:
         """Calculate cosine similarity between two dictionaries."""
         if not dict1 or not dict2:
             return 0.0
         
-        # Get common keys
-        common_keys = set(dict1.keys()) & set(dict2.keys())
-        if not common_keys:
+        # Dot product over the smaller dict's keys, without building key sets
+        small, large = (dict1, dict2) if len(dict1) <= len(dict2) else (dict2, dict1)
+        dot_product = sum(
+            value * large[key] for key, value in small.items() if key in large
+        )
+        if not dot_product:
             return 0.0
-        
-        # Calculate dot product
-        dot_product = sum(dict1[key] * dict2[key] for key in common_keys)
-        
+
         # Calculate magnitudes
-        mag1 = math.sqrt(sum(val ** 2 for val in dict1.values()))
-        mag2 = math.sqrt(sum(val ** 2 for val in dict2.values()))
+        mag1 = math.hypot(*dict1.values())
+        mag2 = math.hypot(*dict2.values())
         
         if mag1 == 0 or mag2 == 0:
             return 0.0
         
         return dot_product / (mag1 * mag2)
     
-    def _user_interacted_with_video(self, user_id: str, video_id: str, interactions: List[Dict]) -> bool:
-        """Check if user has already interacted with a video."""
-        return any(
-            interaction['user_id'] == user_id and interaction['video_id'] == video_id
+    def _interacted_video_ids(self, user_id: str, interactions: List[Dict]) -> Set[str]:
+        """Get IDs of the videos a user has already interacted with."""
+        return {
+            interaction['video_id']
             for interaction in interactions
-        )
-    
-    def _user_follows_creator(self, user_id: str, creator_id: str, interactions: List[Dict]) -> bool:
-        """Check if user follows a creator."""
-        return any(
-            interaction['user_id'] == user_id and 
-            interaction['target_user_id'] == creator_id and 
-            interaction['interaction_type'] == InteractionType.FOLLOW.value
-            for interaction in interactions
-        )
\ No newline at end of file
+            if interaction['user_id'] == user_id
+        }
@@ -1,13 +1,82 @@
 import secrets
 import pyotp
 import qrcode
-import io
 import base64
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from ...domain.entities.auth_security import TwoFactorMethod
 
 
+# QR rendering is ~10ms of CPU; it runs here so setup can persist the secret
+# meanwhile instead of holding the request thread for both in sequence
+_qr_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="qr-code")
+
+
+TOTP_CACHE_SIZE = 4096
+_totp_cache: "OrderedDict[str, pyotp.TOTP]" = OrderedDict()
+_totp_cache_lock = threading.Lock()
+
+
+def _totp_for(secret: str) -> pyotp.TOTP:
+    """Shared TOTP instance per secret, reused across verifications."""
+    with _totp_cache_lock:
+        totp = _totp_cache.get(secret)
+        if totp is not None:
+            _totp_cache.move_to_end(secret)
+            return totp
+
+    totp = pyotp.TOTP(secret)
+    with _totp_cache_lock:
+        _totp_cache[secret] = totp
+        if len(_totp_cache) > TOTP_CACHE_SIZE:
+            _totp_cache.popitem(last=False)
+    return totp
+
+
+def _evict_totp(secret: str) -> None:
+    with _totp_cache_lock:
+        _totp_cache.pop(secret, None)
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(data))
+        + chunk_type
+        + data
+        + struct.pack(">I", zlib.crc32(chunk_type + data))
+    )
+
+
+def _encode_qr_png(matrix: list[list[bool]], scale: int) -> bytes:
+    """Encode a QR module matrix (True = dark) as a 1-bit grayscale PNG.
+
+    QR codes are strictly black and white, so each pixel is one bit and the
+    whole image is a handful of bytes per row. The image is shown once during
+    setup and never stored, so it is deflated at the fastest level.
+    """
+    size = len(matrix) * scale
+    pad = -size % 8
+    scanlines = []
+    for row in matrix:
+        # 0 = black, 1 = white at bit depth 1; pad bits are white
+        bits = "".join(("0" if dark else "1") * scale for dark in row) + "1" * pad
+        line = b"\x00" + int(bits, 2).to_bytes((size + pad) // 8, "big")
+        scanlines.append(line * scale)
+
+    header = struct.pack(">IIBBBBB", size, size, 1, 0, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", header)
+        + _png_chunk(b"IDAT", zlib.compress(b"".join(scanlines), 1))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
 class TwoFactorService:
     def __init__(self, user_repo, two_factor_repo=None):
         self.user_repo = user_repo
@@ -19,7 +88,7 @@ class TwoFactorService:
 
     def get_totp_uri(self, secret: str, email: str) -> str:
         """Get the TOTP provisioning URI for QR code generation."""
-        totp = pyotp.TOTP(secret)
+        totp = _totp_for(secret)
         return totp.provisioning_uri(name=email, issuer_name="Clipsmith")
 
     def generate_qr_code(self, uri: str) -> str:
@@ -27,29 +96,41 @@ class TwoFactorService:
         qr = qrcode.QRCode(version=1, box_size=10, border=5)
         qr.add_data(uri)
         qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
-
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        return base64.b64encode(buffer.getvalue()).decode()
+        # get_matrix() includes the border; encode it straight to a 1-bit
+        # PNG instead of rendering a PIL image and re-encoding it
+        png = _encode_qr_png(qr.get_matrix(), qr.box_size)
+        return base64.b64encode(png).decode()
 
     def generate_backup_codes(self, count: int = 10) -> list[str]:
         """Generate backup codes for 2FA recovery."""
-        return [secrets.token_hex(4) for _ in range(count)]
+        # One CSPRNG draw for all codes, split into 4-byte (8 hex char) codes
+        raw = secrets.token_bytes(count * 4)
+        return [raw[i:i + 4].hex() for i in range(0, count * 4, 4)]
 
     def verify_totp_code(self, secret: str, code: str) -> bool:
         """Verify a TOTP code."""
-        totp = pyotp.TOTP(secret)
+        totp = _totp_for(secret)
         return totp.verify(code)
 
     def setup_2fa(
         self, user_id: str, method: TwoFactorMethod, email: str
     ) -> tuple[str, str, list[str]]:
         """Setup 2FA for a user. Returns (secret, qr_code, backup_codes)."""
+        secret, qr_code, backup_codes = self.begin_setup_2fa(user_id, method, email)
+        return secret, qr_code.result(), backup_codes
+
+    def begin_setup_2fa(
+        self, user_id: str, method: TwoFactorMethod, email: str
+    ) -> tuple[str, Future[str], list[str]]:
+        """Setup 2FA with the QR code rendered in the background.
+
+        Returns (secret, qr_code_future, backup_codes) so callers can store the
+        secret while the QR code is generated.
+        """
         if method == TwoFactorMethod.TOTP:
             secret = self.generate_totp_secret()
             uri = self.get_totp_uri(secret, email)
-            qr_code = self.generate_qr_code(uri)
+            qr_code = _qr_pool.submit(self.generate_qr_code, uri)
             backup_codes = self.generate_backup_codes()
 
             return secret, qr_code, backup_codes
@@ -75,6 +156,11 @@ class TwoFactorService:
         if not self.two_factor_repo:
             return False
 
+        # Drop this user's cached TOTP object so a disabled secret is not
+        # kept in memory; other users' entries stay warm
+        secret_data = self.two_factor_repo.get_active_secret(user_id)
+        if secret_data:
+            _evict_totp(secret_data.secret)
         return self.two_factor_repo.deactivate_2fa(user_id)
 
     def get_2fa_status(self, user_id: str) -> dict:
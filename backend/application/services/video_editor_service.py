@@ -41,23 +41,13 @@ class VideoEditorService:
         self, project_id: str, title: str
     ) -> Optional[VideoProject]:
         """Update project title."""
-        project = self.repository.get_project_by_id(project_id)
-        if not project:
-            return None
-
-        updated_project = project.replace(title=title)
-        return self.repository.save_project(updated_project)
+        return self.repository.patch_project(project_id, {"title": title})
 
     def update_project_description(
         self, project_id: str, description: str
     ) -> Optional[VideoProject]:
         """Update project description."""
-        project = self.repository.get_project_by_id(project_id)
-        if not project:
-            return None
-
-        updated_project = project.replace(description=description)
-        return self.repository.save_project(updated_project)
+        return self.repository.patch_project(project_id, {"description": description})
 
     def delete_project(self, project_id: str) -> bool:
         """Delete a project."""
@@ -119,6 +109,27 @@ class VideoEditorService:
         )
         return self.repository.save_transition(transition)
 
+    def add_transitions(
+        self, project_id: str, transitions: List[dict]
+    ) -> List[VideoEditorTransition]:
+        """Add several transitions to a project in one repository write.
+
+        Each item takes the keyword arguments of add_transition.
+        """
+        return self.repository.save_transitions(
+            [
+                VideoEditorTransition(
+                    project_id=project_id,
+                    type=item["transition_type"],
+                    start_time=item["start_time"],
+                    end_time=item["end_time"],
+                    duration=item["duration"],
+                    parameters=item.get("parameters"),
+                )
+                for item in transitions
+            ]
+        )
+
     def get_project_transitions(
         self, project_id: str
     ) -> List[VideoEditorTransition]:
@@ -144,6 +155,26 @@ class VideoEditorService:
         )
         return self.repository.save_track(track)
 
+    def add_tracks(
+        self, project_id: str, tracks: List[dict]
+    ) -> List[VideoEditorTrack]:
+        """Add several tracks to a project in one repository write.
+
+        Each item takes the keyword arguments of add_track.
+        """
+        return self.repository.save_tracks(
+            [
+                VideoEditorTrack(
+                    project_id=project_id,
+                    asset_id=item["asset_id"],
+                    type=item["track_type"],
+                    start_time=item["start_time"],
+                    end_time=item["end_time"],
+                )
+                for item in tracks
+            ]
+        )
+
     def get_project_tracks(self, project_id: str) -> List[VideoEditorTrack]:
         """Get all tracks for a project."""
         return self.repository.get_project_tracks(project_id)
@@ -167,6 +198,26 @@ class VideoEditorService:
         )
         return self.repository.save_caption(caption)
 
+    def add_captions(
+        self, project_id: str, captions: List[dict]
+    ) -> List[VideoEditorCaption]:
+        """Add several captions to a project in one repository write.
+
+        Each item takes the keyword arguments of add_caption.
+        """
+        return self.repository.save_captions(
+            [
+                VideoEditorCaption(
+                    project_id=project_id,
+                    video_asset_id=item["video_asset_id"],
+                    text=item["text"],
+                    start_time=item["start_time"],
+                    end_time=item["end_time"],
+                )
+                for item in captions
+            ]
+        )
+
     def get_project_captions(
         self, project_id: str, video_asset_id: str
     ) -> List[VideoEditorCaption]:
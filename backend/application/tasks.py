@@ -2,9 +2,9 @@ import os
 import pathlib
 import ffmpeg
 from uuid import uuid4
-import requests
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
 from ..infrastructure.repositories.database import get_task_session
@@ -17,15 +17,13 @@ from ..domain.entities.video import VideoStatus, Video
 
 def _safe_parse_frame_rate(rate_str: str) -> float:
     """Safely parse ffprobe frame rate strings like '30/1' or '29.97'."""
+    num, sep, den = rate_str.partition("/")
     try:
-        if '/' in rate_str:
-            num, den = rate_str.split('/', 1)
+        if sep:
             denominator = float(den)
-            if denominator == 0:
-                return 0.0
-            return float(num) / denominator
+            return float(num) / denominator if denominator else 0.0
         return float(rate_str)
-    except (ValueError, ZeroDivisionError):
+    except ValueError:
         return 0.0
 
 
@@ -39,8 +37,8 @@ UPLOAD_DIR = pathlib.Path(__file__).parent.parent.parent / "uploads"
 THUMBNAIL_DIR = UPLOAD_DIR / "thumbnails"
 THUMBNAIL_DIR.mkdir(parents=True, exist_ok=True)
 
-# Get storage adapter for cloud storage operations
-storage_adapter = get_storage_adapter()
+# Concurrent uploads per processing job, overlapped with ffmpeg work
+UPLOAD_WORKERS = 4
 
 # Video processing configurations
 VIDEO_RESOLUTIONS = {
@@ -82,6 +80,10 @@ def get_video_metadata(file_path: str) -> Dict:
             "width": int(video_stream.get("width", 0)) if video_stream else 0,
             "height": int(video_stream.get("height", 0)) if video_stream else 0,
             "fps": _safe_parse_frame_rate(video_stream.get("r_frame_rate", "0/1")) if video_stream else 0,
+            "avg_fps": _safe_parse_frame_rate(video_stream.get("avg_frame_rate", "0/1")) if video_stream else 0,
+            "frame_count": int(video_stream["nb_frames"])
+            if video_stream and str(video_stream.get("nb_frames", "")).isdigit()
+            else 0,
             "bitrate": int(format_info.get("bit_rate", 0))
             if format_info.get("bit_rate")
             else 0,
@@ -110,22 +112,62 @@ def generate_thumbnail_at_time(
         return False
 
 
+def generate_thumbnails_at_frames(
+    input_path: str, output_pattern: str, frame_numbers: List[int]
+) -> bool:
+    """
+    Write one JPEG per frame number in a single ffmpeg pass.
+
+    A select filter keeps only the requested frames, so the source is read
+    once however many thumbnails are taken. Images are numbered from 0 in
+    ascending frame order via the %d in ``output_pattern``.
+    """
+    frames = sorted(set(frame_numbers))
+    try:
+        (
+            ffmpeg.input(input_path)
+            .filter("select", "+".join(f"eq(n,{n})" for n in frames))
+            .output(
+                output_pattern,
+                vsync="vfr",
+                vframes=len(frames),
+                start_number=0,
+                format="image2",
+                vcodec="mjpeg",
+            )
+            .overwrite_output()
+            .run(capture_stdout=True, capture_stderr=True)
+        )
+        return True
+    except ffmpeg.Error as e:
+        logger.error(f"Error generating thumbnails: {e.stderr.decode()}")
+        return False
+
+
+def _rendition_output_kwargs(resolution: Dict) -> Dict:
+    """ffmpeg output options shared by every H.264 rendition."""
+    bitrate_num = int(resolution["bitrate"][:-1])
+    return {
+        "vcodec": "libx264",
+        "acodec": "aac",
+        "preset": "veryfast",
+        "b_v": resolution["bitrate"],
+        "maxrate": f"{bitrate_num * 1.5}k",
+        "bufsize": f"{bitrate_num * 3}k",
+        "movflags": "faststart",
+        "threads": 0,
+    }
+
+
 def transcode_video(input_path: str, output_path: str, resolution: Dict) -> bool:
     """Transcode video to specific resolution."""
     try:
         input_stream = ffmpeg.input(input_path)
-        bitrate_num = int(resolution["bitrate"][:-1])
         output_stream = ffmpeg.output(
             input_stream,
             output_path,
-            vcodec="libx264",
-            acodec="aac",
-            preset="veryfast",
             vf=f"scale={resolution['width']}:{resolution['height']}",
-            b_v=resolution["bitrate"],
-            maxrate=f"{bitrate_num * 1.5}k",
-            bufsize=f"{bitrate_num * 3}k",
-            movflags="faststart",
+            **_rendition_output_kwargs(resolution),
         )
         ffmpeg.run(
             output_stream,
@@ -139,11 +181,42 @@ def transcode_video(input_path: str, output_path: str, resolution: Dict) -> bool
         return False
 
 
+def transcode_renditions(input_path: str, renditions: List[Tuple[str, Dict]]) -> bool:
+    """
+    Transcode several resolutions in one ffmpeg run.
+
+    The source is decoded once and fanned out through a split filter to one
+    scaled encoder per (output_path, resolution) pair, instead of re-decoding
+    it for every rendition.
+    """
+    try:
+        input_stream = ffmpeg.input(input_path)
+        split = input_stream.video.filter_multi_output("split", len(renditions))
+        outputs = [
+            ffmpeg.output(
+                split.stream(i).filter("scale", resolution["width"], resolution["height"]),
+                input_stream["a?"],
+                output_path,
+                **_rendition_output_kwargs(resolution),
+            )
+            for i, (output_path, resolution) in enumerate(renditions)
+        ]
+        ffmpeg.run(
+            ffmpeg.merge_outputs(*outputs),
+            overwrite_output=True,
+            capture_stdout=True,
+            capture_stderr=True,
+        )
+        return True
+    except ffmpeg.Error as e:
+        logger.error(f"Error transcoding video: {e.stderr.decode()}")
+        return False
+
+
 def upload_to_storage(local_path: str, remote_key: str) -> bool:
     """Upload processed file to cloud storage."""
     try:
-        with open(local_path, "rb") as file_data:
-            storage_adapter.save(remote_key, file_data)
+        get_storage_adapter().save_file(remote_key, local_path)
         logger.info(f"Successfully uploaded {remote_key} to cloud storage")
         return True
     except Exception as e:
@@ -151,6 +224,18 @@ def upload_to_storage(local_path: str, remote_key: str) -> bool:
         return False
 
 
+def _publish_file(local_path: pathlib.Path, remote_key: str, fallback_url: str) -> str:
+    """Upload a processed file, delete the local copy and return its URL."""
+    if upload_to_storage(str(local_path), remote_key):
+        url = get_storage_adapter().get_url(remote_key)
+    else:
+        url = fallback_url
+
+    # Clean up local file
+    local_path.unlink(missing_ok=True)
+    return url
+
+
 def process_video_task(video_id: str, uploaded_file_path: str):
     """
     Enhanced RQ task to process an uploaded video:
@@ -163,7 +248,9 @@ def process_video_task(video_id: str, uploaded_file_path: str):
         f"Starting enhanced video processing for video_id: {video_id} from {uploaded_file_path}"
     )
 
-    with get_task_session() as session:
+    with get_task_session() as session, ThreadPoolExecutor(
+        max_workers=UPLOAD_WORKERS
+    ) as upload_pool:
         video_repo = SQLiteVideoRepository(session)
         video = None
 
@@ -194,36 +281,48 @@ def process_video_task(video_id: str, uploaded_file_path: str):
 
             file_stem = input_path.stem
 
-            # Generate multiple thumbnails at different timestamps
-            thumbnail_timestamps = [
-                "00:00:01",
-                "00:00:05",
-                str(duration * 0.25),
-                str(duration * 0.5),
-            ]
-            thumbnail_urls = []
-
-            for i, timestamp in enumerate(thumbnail_timestamps):
-                if float(timestamp) <= duration:
-                    thumbnail_filename = f"{file_stem}_thumb_{i}.jpg"
-                    thumbnail_path = THUMBNAIL_DIR / thumbnail_filename
-
-                    if generate_thumbnail_at_time(
-                        str(input_path), str(thumbnail_path), timestamp
-                    ):
-                        # Upload to cloud storage
-                        remote_key = f"thumbnails/{thumbnail_filename}"
-                        if upload_to_storage(str(thumbnail_path), remote_key):
-                            thumbnail_url = storage_adapter.get_url(remote_key)
-                        else:
-                            thumbnail_url = (
-                                f"/uploads/thumbnails/{thumbnail_filename}"  # Fallback
-                            )
-
-                        thumbnail_urls.append(thumbnail_url)
-
-                        # Clean up local file
-                        os.remove(thumbnail_path)
+            # Generate multiple thumbnails at different timestamps (seconds)
+            thumbnail_timestamps = [1.0, 5.0, duration * 0.25, duration * 0.5]
+            thumbnail_futures = []
+
+            # avg_frame_rate tracks real frame timing; r_frame_rate can
+            # overstate it for variable frame rate footage
+            fps = metadata.get("avg_fps") or metadata.get("fps", 0)
+            last_frame = metadata.get("frame_count", 0) - 1
+            thumbnail_frames = list(
+                dict.fromkeys(
+                    min(int(timestamp * fps), last_frame)
+                    if last_frame >= 0
+                    else int(timestamp * fps)
+                    for timestamp in thumbnail_timestamps
+                    if timestamp < duration
+                )
+            )
+            if fps > 0 and thumbnail_frames:
+                thumbnail_pattern = THUMBNAIL_DIR / f"{file_stem}_thumb_%d.jpg"
+                if generate_thumbnails_at_frames(
+                    str(input_path), str(thumbnail_pattern), thumbnail_frames
+                ):
+                    frame_index = {
+                        frame: i for i, frame in enumerate(sorted(thumbnail_frames))
+                    }
+                    thumbnail_filenames = [
+                        f"{file_stem}_thumb_{frame_index[frame]}.jpg"
+                        for frame in thumbnail_frames
+                    ]
+                    # Uploads run on the pool while the renditions transcode.
+                    # The select filter silently skips frames past the end of
+                    # the stream, so only publish images that were written.
+                    thumbnail_futures = [
+                        upload_pool.submit(
+                            _publish_file,
+                            THUMBNAIL_DIR / thumbnail_filename,
+                            f"thumbnails/{thumbnail_filename}",
+                            f"/uploads/thumbnails/{thumbnail_filename}",  # Fallback
+                        )
+                        for thumbnail_filename in thumbnail_filenames
+                        if (THUMBNAIL_DIR / thumbnail_filename).exists()
+                    ]
 
             # Transcode to multiple resolutions for adaptive streaming
             resolution_urls = {}
@@ -240,23 +339,30 @@ def process_video_task(video_id: str, uploaded_file_path: str):
             else:
                 target_resolutions = ["360p"]
 
-            for res_name in target_resolutions:
-                res_config = VIDEO_RESOLUTIONS[res_name]
-                processed_filename = f"{file_stem}_{res_name}.mp4"
-                processed_path = UPLOAD_DIR / processed_filename
-
-                if transcode_video(str(input_path), str(processed_path), res_config):
-                    # Upload to cloud storage
-                    remote_key = processed_filename
-                    if upload_to_storage(str(processed_path), remote_key):
-                        resolution_urls[res_name] = storage_adapter.get_url(remote_key)
-                    else:
-                        resolution_urls[res_name] = (
-                            f"/uploads/{processed_filename}"  # Fallback
-                        )
+            processed_filenames = {
+                res_name: f"{file_stem}_{res_name}.mp4" for res_name in target_resolutions
+            }
+            renditions = [
+                (str(UPLOAD_DIR / processed_filenames[res_name]), VIDEO_RESOLUTIONS[res_name])
+                for res_name in target_resolutions
+            ]
 
-                    # Clean up local file
-                    os.remove(processed_path)
+            if transcode_renditions(str(input_path), renditions):
+                rendition_futures = {
+                    res_name: upload_pool.submit(
+                        _publish_file,
+                        UPLOAD_DIR / processed_filenames[res_name],
+                        processed_filenames[res_name],
+                        f"/uploads/{processed_filenames[res_name]}",  # Fallback
+                    )
+                    for res_name in target_resolutions
+                }
+                resolution_urls = {
+                    res_name: future.result()
+                    for res_name, future in rendition_futures.items()
+                }
+
+            thumbnail_urls = [future.result() for future in thumbnail_futures]
 
             # Use the highest quality as main video URL, others for adaptive streaming
             main_video_url = resolution_urls.get(target_resolutions[0], "")
@@ -288,11 +394,10 @@ def process_video_task(video_id: str, uploaded_file_path: str):
 def generate_captions_task(video_id: str):
     """
     Enhanced RQ task to generate captions for a given video.
-    Downloads the processed video, extracts audio, transcribes, and saves captions.
+    Streams the audio track of the processed video, transcribes, and saves captions.
     """
     logger.info(f"Starting caption generation for video_id: {video_id}")
 
-    downloaded_video_path = None
     audio_file_path = None
 
     with get_task_session() as session:
@@ -307,35 +412,25 @@ def generate_captions_task(video_id: str):
                 )
                 return
 
-            # 1. Download the processed video locally
             backend_url = os.getenv("BACKEND_URL", "http://localhost:8000")
             video_url_full = f"{backend_url}{video.url}"
-            downloaded_video_path = UPLOAD_DIR / f"{uuid4()}_downloaded_for_caption.mp4"
-            logger.info(
-                f"Downloading video from {video_url_full} to {downloaded_video_path}"
-            )
 
-            response = requests.get(video_url_full, stream=True, timeout=30)
-            response.raise_for_status()
-
-            with open(downloaded_video_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            logger.info(f"Video downloaded to {downloaded_video_path}")
-
-            # 2. Extract high-quality audio from the downloaded video
+            # 1. Extract audio straight from the processed video URL; ffmpeg
+            # reads it over HTTP, so the video is never downloaded to disk
             audio_file_path = UPLOAD_DIR / f"{uuid4()}_extracted_audio.wav"
-            logger.info(f"Extracting audio to {audio_file_path}")
+            logger.info(f"Extracting audio from {video_url_full} to {audio_file_path}")
 
             (
-                ffmpeg.input(str(downloaded_video_path))
-                .output(str(audio_file_path), acodec="pcm_s16le", ac=1, ar="16000")
+                ffmpeg.input(video_url_full, rw_timeout=30_000_000)  # 30s, in microseconds
+                .output(
+                    str(audio_file_path), vn=None, acodec="pcm_s16le", ac=1, ar="16000"
+                )
                 .overwrite_output()
                 .run(capture_stdout=True, capture_stderr=True)
             )
             logger.info(f"Audio extracted to {audio_file_path}")
 
-            # 3. Generate captions using the use case
+            # 2. Generate captions using the use case
             generate_captions_use_case = GenerateCaptionsUseCase(
                 video_repo, caption_repo
             )
@@ -351,9 +446,6 @@ def generate_captions_task(video_id: str):
             logger.error(f"Error during caption generation for {video_id}: {e}")
         finally:
             # Clean up temporary files
-            if downloaded_video_path and downloaded_video_path.exists():
-                os.remove(downloaded_video_path)
-                logger.debug(f"Cleaned up downloaded video: {downloaded_video_path}")
             if audio_file_path and audio_file_path.exists():
                 os.remove(audio_file_path)
                 logger.debug(f"Cleaned up extracted audio: {audio_file_path}")
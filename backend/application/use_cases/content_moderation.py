@@ -1,4 +1,5 @@
-from typing import List
+import logging
+from typing import List, Tuple
 from ...domain.ports.repository_ports import (
     ContentModerationRepositoryPort,
     VideoRepositoryPort,
@@ -8,6 +9,8 @@ from ...application.services.content_moderation_service import (
     HumanModerationService,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ContentModerationUseCase:
     """Use case for content moderation workflow."""
@@ -38,7 +41,9 @@ class ContentModerationUseCase:
         if moderation.status.value == "rejected":
             # In a real system, you'd update the video status to REJECTED
             # For now, we'll just log it
-            print(f"Video {video_id} automatically rejected due to policy violations")
+            logger.info(
+                "Video %s automatically rejected due to policy violations", video_id
+            )
 
         return saved_moderation
 
@@ -51,12 +56,26 @@ class ContentModerationUseCase:
 
         # If automatically rejected, comment would need to be hidden
         if moderation.status.value == "rejected":
-            print(
-                f"Comment {comment_id} automatically rejected due to policy violations"
+            logger.info(
+                "Comment %s automatically rejected due to policy violations", comment_id
             )
 
         return saved_moderation
 
+    def moderate_comments_on_create(self, comments: List[Tuple[str, str, str]]):
+        """Moderate a batch of (comment_id, content, user_id) and save once."""
+        moderations = self.ai_service.analyze_comments_batch(comments)
+        saved_moderations = self.moderation_repo.save_many(moderations)
+
+        for moderation in moderations:
+            if moderation.status.value == "rejected":
+                logger.info(
+                    "Comment %s automatically rejected due to policy violations",
+                    moderation.content_id,
+                )
+
+        return saved_moderations
+
     def get_pending_reviews(self, reviewer_id: str, limit: int = 50):
         """Get content pending human review for a moderator."""
         return self.human_service.review_pending_content(limit)
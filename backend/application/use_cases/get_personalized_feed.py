@@ -1,5 +1,5 @@
 from typing import List, Optional, Set
-from datetime import datetime
+from datetime import datetime, timedelta
 from ...domain.ports.repository_ports import (
     VideoRepositoryPort,
     InteractionRepositoryPort,
@@ -29,6 +29,7 @@ class GetPersonalizedFeedUseCase:
         feed_type: str = "foryou",  # "foryou", "following", "trending"
         page: int = 1,
         page_size: int = 20,
+        lookahead: bool = False,
     ) -> List[Video]:
         """
         Generate personalized feed based on feed type.
@@ -38,11 +39,15 @@ class GetPersonalizedFeedUseCase:
             feed_type: Type of feed ("foryou", "following", "trending")
             page: Page number for pagination
             page_size: Number of videos per page
+            lookahead: Also return the first video of the next page, so
+                callers can tell whether another page exists
 
         Returns:
             List of Video objects
         """
 
+        limit = page_size + 1 if lookahead else page_size
+
         # Get user's following list
         user_following = self._get_user_following(user_id)
 
@@ -51,22 +56,28 @@ class GetPersonalizedFeedUseCase:
             feed_videos = self.video_repo.get_videos_from_creators(
                 creator_ids=list(user_following),
                 offset=(page - 1) * page_size,
-                limit=page_size,
+                limit=limit,
             )
         else:
-            # Load shared data once for recommendation-based feeds
-            user_interactions = self.interaction_repo.get_user_interactions(user_id)
             all_videos = self.video_repo.find_all(offset=0, limit=500)
-            all_interactions = self.interaction_repo.get_all_interactions(limit=5000)
 
             if feed_type == "trending":
+                # Trending only scores the window, so load just that slice
+                # and skip the user's own history
+                trending_hours = 24
+                recent_interactions = self.interaction_repo.get_recent_interactions(
+                    since=datetime.utcnow() - timedelta(hours=trending_hours),
+                    limit=5000,
+                )
                 feed_videos = self.recommendation_engine.get_trending_videos(
                     all_videos=all_videos,
-                    all_interactions=all_interactions,
-                    hours=24,
+                    all_interactions=recent_interactions,
+                    hours=trending_hours,
                 )
             else:
                 # "foryou" or unknown feed type
+                user_interactions = self.interaction_repo.get_user_interactions(user_id)
+                all_interactions = self.interaction_repo.get_all_interactions(limit=5000)
                 feed_videos = self.recommendation_engine.get_for_you_feed(
                     user_id=user_id,
                     user_interactions=user_interactions,
@@ -78,7 +89,7 @@ class GetPersonalizedFeedUseCase:
 
         # Apply pagination
         start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
+        end_idx = start_idx + limit
 
         return feed_videos[start_idx:end_idx]
 
@@ -1,7 +1,12 @@
-from typing import List
+from typing import List, Optional
 import math
 from ...domain.ports.repository_ports import VideoRepositoryPort
-from ..dtos.video_dto import VideoResponseDTO, PaginatedVideoResponseDTO
+from ..dtos.video_dto import (
+    VideoResponseDTO,
+    PaginatedVideoResponseDTO,
+    CursorPaginatedVideoResponseDTO,
+)
+from ..utils.pagination import encode_cursor, decode_cursor
 
 class ListVideosUseCase:
     def __init__(self, video_repo: VideoRepositoryPort):
@@ -41,3 +46,41 @@ class ListVideosUseCase:
             page_size=page_size,
             total_pages=total_pages
         )
+
+    def execute_cursor(
+        self, cursor: Optional[str] = None, limit: int = 20
+    ) -> CursorPaginatedVideoResponseDTO:
+        limit = min(max(1, limit), 100)
+        after = decode_cursor(cursor) if cursor else None
+
+        # Fetch one extra row to learn whether another page exists without
+        # running a COUNT(*) query.
+        videos = self._video_repo.find_after(after_cursor=after, limit=limit + 1)
+        has_more = len(videos) > limit
+        videos = videos[:limit]
+
+        items = [
+            VideoResponseDTO(
+                id=v.id,
+                title=v.title,
+                description=v.description,
+                creator_id=v.creator_id,
+                status=v.status,
+                url=v.url,
+                thumbnail_url=v.thumbnail_url,
+                views=v.views,
+                likes=v.likes,
+                duration=v.duration,
+                created_at=v.created_at,
+            )
+            for v in videos
+        ]
+
+        next_cursor = None
+        if has_more:
+            last = videos[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        return CursorPaginatedVideoResponseDTO(
+            items=items, next_cursor=next_cursor, has_more=has_more
+        )
@@ -0,0 +1,26 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple
+
+import orjson
+
+VideoCursor = Tuple[datetime, str]
+
+
+def encode_cursor(created_at: datetime, video_id: str) -> str:
+    """Encode the last-seen (created_at, id) key as an opaque cursor."""
+    payload = orjson.dumps([created_at.isoformat(), video_id])
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> VideoCursor:
+    """Decode a cursor produced by encode_cursor.
+
+    Raises ValueError for anything that was not produced by encode_cursor.
+    """
+    try:
+        created_at, video_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), str(video_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor") from None
@@ -1,10 +1,23 @@
 import bleach
+from functools import lru_cache
 from typing import Optional
 
+# Longer inputs are rarely repeated and would bloat the cache
+MAX_CACHED_INPUT_LENGTH = 1024
+
+
+def _sanitize_uncached(dirty: str) -> str:
+    return bleach.clean(dirty, tags=[], strip=True)
+
+
+_sanitize_cached = lru_cache(maxsize=16384)(_sanitize_uncached)
+
 
 def sanitize_input(dirty: str) -> str:
     """Sanitize user input by stripping HTML tags."""
-    return bleach.clean(dirty, tags=[], strip=True)
+    if len(dirty) > MAX_CACHED_INPUT_LENGTH:
+        return _sanitize_uncached(dirty)
+    return _sanitize_cached(dirty)
 
 
 def sanitize_html(dirty: str, allowed_tags: Optional[list] = None) -> str:
@@ -32,7 +32,7 @@ class ContentType(str, Enum):
     LIVESTREAM = "livestream"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VideoAnalytics:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     video_id: str
@@ -101,7 +101,7 @@ class VideoAnalytics:
         return replace(self, **updated_data)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CreatorAnalytics:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -153,7 +153,7 @@ class CreatorAnalytics:
         return self.total_revenue / self.total_followers
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TimeSeriesData:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -179,7 +179,7 @@ class TimeSeriesData:
         return replace(self, data_points=self.data_points + [data_point])
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AudienceDemographics:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -205,7 +205,7 @@ class AudienceDemographics:
         return max(self.device_distribution, key=self.device_distribution.get)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ContentPerformance:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
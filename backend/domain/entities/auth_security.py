@@ -12,7 +12,7 @@ class EmailVerificationStatus(str, Enum):
     USED = "used"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class EmailVerification:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -50,7 +50,7 @@ class TwoFactorMethod(str, Enum):
     SMS = "sms"  # SMS verification (not implemented yet)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TwoFactorSecret:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -66,7 +66,7 @@ class TwoFactorSecret:
         return replace(self, is_active=False, last_used_at=datetime.utcnow())
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TwoFactorVerification:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
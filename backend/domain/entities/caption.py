@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from ..base import Entity
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Caption(Entity):
     video_id: str
     text: str
@@ -4,7 +4,7 @@ from typing import Optional
 import uuid
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Circle:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str  # Owner of the circle
@@ -13,7 +13,7 @@ class Circle:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CircleMember:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     circle_id: str
@@ -21,7 +21,7 @@ class CircleMember:
     added_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CommunityGroup:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     creator_id: str
@@ -33,7 +33,7 @@ class CommunityGroup:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CommunityMember:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     group_id: str
@@ -42,7 +42,7 @@ class CommunityMember:
     joined_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiscussionPost:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     group_id: str
@@ -53,7 +53,7 @@ class DiscussionPost:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Event:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     creator_id: str
@@ -70,7 +70,7 @@ class Event:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class EventAttendee:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     event_id: str
@@ -45,7 +45,7 @@ class ModerationReason(str, Enum):
     DUPLICATE_CONTENT = "duplicate_content"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ContentModeration:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     content_type: str  # "video", "comment", "user_profile", etc.
@@ -4,7 +4,7 @@ from typing import Optional, List
 import uuid
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Course:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     creator_id: str
@@ -18,7 +18,7 @@ class Course:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CourseLesson:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     course_id: str
@@ -31,7 +31,7 @@ class CourseLesson:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CourseEnrollment:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     course_id: str
@@ -42,7 +42,7 @@ class CourseEnrollment:
     completed_at: Optional[datetime] = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SubscriptionTier:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     creator_id: str
@@ -56,7 +56,7 @@ class SubscriptionTier:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CreatorFundEligibility:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
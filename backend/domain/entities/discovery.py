@@ -4,7 +4,7 @@ from typing import Optional, List
 import uuid
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Playlist:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     creator_id: str
@@ -28,7 +28,7 @@ class Playlist:
         return self
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PlaylistItem:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     playlist_id: str
@@ -38,7 +38,7 @@ class PlaylistItem:
     added_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PlaylistCollaborator:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     playlist_id: str
@@ -46,7 +46,7 @@ class PlaylistCollaborator:
     added_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UserPreferences:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -61,7 +61,7 @@ class UserPreferences:
     updated_at: Optional[datetime] = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FavoriteCreator:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -70,7 +70,7 @@ class FavoriteCreator:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiscoveryScore:
     video_id: str
     interest_score: float = 0.0
@@ -81,7 +81,7 @@ class DiscoveryScore:
     reasons: List[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TrafficSource:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     video_id: str
@@ -91,7 +91,7 @@ class TrafficSource:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class RetentionData:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     video_id: str
@@ -101,7 +101,7 @@ class RetentionData:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PostingTimeRecommendation:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
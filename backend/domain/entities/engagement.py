@@ -4,7 +4,7 @@ from typing import Optional
 import uuid
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Poll:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     video_id: str
@@ -18,7 +18,7 @@ class Poll:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PollOption:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     poll_id: str
@@ -27,7 +27,7 @@ class PollOption:
     is_correct: bool = False
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PollVote:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     poll_id: str
@@ -36,7 +36,7 @@ class PollVote:
     voted_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ChapterMarker:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     video_id: str
@@ -47,7 +47,7 @@ class ChapterMarker:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProductTag:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     video_id: str
@@ -65,7 +65,7 @@ class ProductTag:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VideoLink:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     video_id: str
@@ -78,7 +78,7 @@ class VideoLink:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Challenge:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     hashtag_id: str
@@ -94,7 +94,7 @@ class Challenge:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ChallengeParticipant:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     challenge_id: str
@@ -103,7 +103,7 @@ class ChallengeParticipant:
     joined_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Badge:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     name: str
@@ -115,7 +115,7 @@ class Badge:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UserBadge:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
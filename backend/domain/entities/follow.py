@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from ..base import Entity
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Follow(Entity):
     follower_id: str
     followed_id: str
@@ -42,7 +42,7 @@ class RequestStatus(str, Enum):
     EXPIRED = "expired"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ConsentRecord:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -60,7 +60,7 @@ class ConsentRecord:
         return self.replace(granted=False, revoked_at=datetime.utcnow())
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class GDPRRequest:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -108,7 +108,7 @@ class GDPRRequest:
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataExport:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -129,7 +129,7 @@ class DataExport:
         return self.replace(expires_at=datetime.utcnow() + timedelta(days=days))
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataDeletion:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -160,7 +160,7 @@ class DataDeletion:
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CookieConsent:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -191,7 +191,7 @@ class CookieConsent:
         return self.replace(**current_consent, last_updated=datetime.utcnow())
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PrivacySettings:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -4,7 +4,7 @@ from typing import List, Optional
 import uuid
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Hashtag:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     name: str
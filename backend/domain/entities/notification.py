@@ -23,7 +23,7 @@ class NotificationStatus(str, Enum):
     ARCHIVED = "archived"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Notification:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
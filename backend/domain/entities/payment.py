@@ -39,7 +39,7 @@ class WalletStatus(str, Enum):
     CLOSED = "closed"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Transaction:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -75,7 +75,7 @@ class Transaction:
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CreatorWallet:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -126,7 +126,7 @@ class CreatorWallet:
         return replace(self,status=WalletStatus.ACTIVE, updated_at=datetime.utcnow())
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Payout:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     wallet_id: str
@@ -169,7 +169,7 @@ class Payout:
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Subscription:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
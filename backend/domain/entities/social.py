@@ -4,7 +4,7 @@ from typing import Optional
 import uuid
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Duet:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     original_video_id: str
@@ -14,7 +14,7 @@ class Duet:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CollaborativeVideo:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     video_id: str
@@ -23,7 +23,7 @@ class CollaborativeVideo:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VideoCollaborator:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     collaborative_video_id: str
@@ -32,7 +32,7 @@ class VideoCollaborator:
     joined_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LiveStream:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     creator_id: str
@@ -79,7 +79,7 @@ class LiveStream:
         return replace(self, viewer_count=new_count)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LiveStreamGuest:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     stream_id: str
@@ -88,7 +88,7 @@ class LiveStreamGuest:
     joined_at: Optional[datetime] = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class WatchParty:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     host_id: str
@@ -107,7 +107,7 @@ class WatchParty:
         return replace(self, status="ended")
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class WatchPartyParticipant:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     party_id: str
@@ -115,7 +115,7 @@ class WatchPartyParticipant:
     joined_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DirectMessage:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     sender_id: str
@@ -126,7 +126,7 @@ class DirectMessage:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Conversation:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     participant_1_id: str
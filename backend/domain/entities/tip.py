@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from ..base import Entity
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Tip(Entity):
     sender_id: str
     receiver_id: str
@@ -14,7 +14,7 @@ class VideoStatus(str, Enum):
     FAILED = "FAILED"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Video(Entity):
     title: str = ""
     description: str = ""
@@ -27,7 +27,7 @@ class Video(Entity):
     duration: float = 0.0
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VideoMetadata:
     """Enhanced metadata container for video processing and AI analysis."""
     
@@ -31,7 +31,7 @@ class VideoEditorTransitionType(str, Enum):
     AUDIO_ADJUST = "audio_adjust"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VideoProject:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
@@ -92,7 +92,7 @@ class VideoProject:
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VideoEditorAsset:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     project_id: str
@@ -109,7 +109,7 @@ class VideoEditorAsset:
         return replace(self, storage_url=storage_url)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VideoEditorEffect:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     name: str
@@ -120,10 +120,11 @@ class VideoEditorEffect:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VideoEditorTransition:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     project_id: str
-    asset_id: str
+    asset_id: str = ""  # Asset the transition is attached to, if any
     type: VideoEditorTransitionType
     parameters: Optional[Dict[str, Any]] = None
     start_time: float = 0.0
@@ -131,26 +132,8 @@ class VideoEditorTransition:
     duration: float = 0.0
     easing: str = "linear"  # "linear", "ease-in", "ease-out", "ease-in-out"
 
-    def __init__(
-        self,
-        type: VideoEditorTransitionType,
-        start_time: float,
-        end_time: float,
-        duration: float,
-        easing: str = "linear",
-        parameters: Optional[Dict[str, Any]] = None,
-    ):
-        return replace(
-            self,
-            type=type,
-            start_time=start_time,
-            end_time=end_time,
-            duration=duration,
-            easing=easing,
-            parameters=parameters,
-        )
-
 
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VideoEditorTrack:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     project_id: str
@@ -162,26 +145,8 @@ class VideoEditorTrack:
         None  # Track content (text, position, effects, etc.)
     )
 
-    def __init__(
-        self,
-        project_id: str,
-        asset_id: str,
-        type: str,
-        start_time: float,
-        end_time: float,
-        content: Optional[Dict[str, Any]] = None,
-    ):
-        return replace(
-            self,
-            project_id=project_id,
-            asset_id=asset_id,
-            type=type,
-            start_time=start_time,
-            end_time=end_time,
-            content=content,
-        )
-
 
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VideoEditorCaption:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     project_id: str
@@ -194,26 +159,3 @@ class VideoEditorCaption:
     )
     is_auto_generated: bool = False
     language: str = "en"  # ISO language code
-
-    def __init__(
-        self,
-        project_id: str,
-        video_asset_id: str,
-        start_time: float,
-        end_time: float,
-        text: str,
-        style: Optional[Dict[str, Any]] = None,
-        is_auto_generated: bool = False,
-        language: str = "en",
-    ):
-        return replace(
-            self,
-            project_id=project_id,
-            video_asset_id=video_asset_id,
-            start_time=start_time,
-            end_time=end_time,
-            text=text,
-            style=style,
-            is_auto_generated=is_auto_generated,
-            language=language,
-        )
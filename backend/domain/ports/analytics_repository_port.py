@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 from ..entities.analytics import (
     VideoAnalytics,
@@ -43,6 +43,13 @@ class AnalyticsRepositoryPort(ABC):
         """Get analytics for user's videos."""
         pass
 
+    @abstractmethod
+    def count_distinct_videos(
+        self, user_id: str, period_start: datetime, period_end: datetime
+    ) -> int:
+        """Count distinct videos with analytics in a period."""
+        pass
+
     @abstractmethod
     def get_top_performing_videos(
         self, user_id: str, limit: int = 10, metric: str = "views"
@@ -50,6 +57,13 @@ class AnalyticsRepositoryPort(ABC):
         """Get top performing videos by metric."""
         pass
 
+    @abstractmethod
+    def bulk_record_video_views(
+        self, deltas: Dict[Tuple[str, datetime], Dict[str, Any]]
+    ) -> None:
+        """Apply buffered view deltas keyed by (video_id, day start) in one transaction."""
+        pass
+
     # Creator Analytics
     @abstractmethod
     def save_creator_analytics(self, analytics: CreatorAnalytics) -> CreatorAnalytics:
@@ -92,6 +106,17 @@ class AnalyticsRepositoryPort(ABC):
         """Get time series data for specific metric."""
         pass
 
+    @abstractmethod
+    def get_metric_events(
+        self,
+        user_id: str,
+        metric_type: MetricType,
+        period_start: datetime,
+        period_end: datetime,
+    ) -> List[Tuple[datetime, datetime, float]]:
+        """Get (period_start, period_end, value) rows for a metric in a window."""
+        pass
+
     @abstractmethod
     def get_metrics_summary(
         self,
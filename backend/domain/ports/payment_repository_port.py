@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, List, Dict, Any
 from ..entities.payment import Transaction, CreatorWallet, Payout, Subscription, TransactionType, TransactionStatus, PayoutStatus
 
@@ -72,6 +73,11 @@ class PaymentRepositoryPort(ABC):
         """Get all pending payouts for processing."""
         pass
     
+    @abstractmethod
+    def count_payouts_since(self, user_id: str, cutoff: datetime) -> int:
+        """Count user's payouts created at or after cutoff."""
+        pass
+    
     # Subscription operations
     @abstractmethod
     def save_subscription(self, subscription: Subscription) -> Subscription:
@@ -93,6 +99,11 @@ class PaymentRepositoryPort(ABC):
         """Get all subscribers for a creator."""
         pass
     
+    @abstractmethod
+    def count_creator_subscribers(self, creator_id: str) -> int:
+        """Count a creator's active subscribers."""
+        pass
+    
     @abstractmethod
     def get_subscription_by_stripe_id(self, stripe_subscription_id: str) -> Optional[Subscription]:
         """Get subscription by Stripe subscription ID."""
@@ -113,6 +124,22 @@ class PaymentRepositoryPort(ABC):
     def get_transaction_summary(self, user_id: str, days: int = 30) -> Dict[str, Any]:
         """Get transaction summary for analytics."""
         pass
+    
+    # Unit of work
+    @abstractmethod
+    def begin(self) -> None:
+        """Defer commits from save operations until commit() is called."""
+        pass
+    
+    @abstractmethod
+    def commit(self) -> None:
+        """Commit all writes staged since begin()."""
+        pass
+    
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard all writes staged since begin()."""
+        pass
 
 
 class StripeServicePort(ABC):
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from ..entities.video import Video
 from ..entities.user import User
 from ..entities.caption import Caption  # Import Caption entity
@@ -89,6 +89,13 @@ class VideoRepositoryPort(ABC):
     def count_all(self) -> int:
         pass
 
+    @abstractmethod
+    def find_after(
+        self, after_cursor: Optional[Tuple[datetime, str]] = None, limit: int = 20
+    ) -> List[Video]:
+        """Newest-first videos strictly older than the (created_at, id) cursor."""
+        pass
+
     @abstractmethod
     def list_by_creator(self, creator_id: str) -> List[Video]:
         pass
@@ -133,6 +140,18 @@ class InteractionRepositoryPort(ABC):
     def get_all_interactions(self, limit: int = 5000) -> List:
         return []
 
+    def get_recent_interactions(self, since: datetime, limit: int = 5000) -> List:
+        """Interactions created after since.
+
+        This fallback filters get_all_interactions in Python; adapters should
+        override it with a query bounded by since.
+        """
+        return [
+            interaction
+            for interaction in self.get_all_interactions(limit=limit)
+            if interaction['created_at'] > since
+        ]
+
     def get_user_following(self, user_id: str) -> List:
         return []
 
@@ -196,12 +215,28 @@ class FollowRepositoryPort(ABC):
     def unfollow(self, follower_id: str, followed_id: str) -> bool:
         pass
 
+    @abstractmethod
+    def is_following(self, follower_id: str, followed_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def get_followers(self, user_id: str) -> List[Follow]:
+        pass
+
+    @abstractmethod
+    def get_following(self, user_id: str) -> List[Follow]:
+        pass
+
 
 class NotificationRepositoryPort(ABC):
     @abstractmethod
     def save(self, notification: "Notification") -> "Notification":
         pass
 
+    @abstractmethod
+    def save_many(self, notifications: List["Notification"]) -> int:
+        pass
+
     @abstractmethod
     def get_by_id(self, notification_id: str) -> Optional["Notification"]:
         pass
@@ -226,6 +261,11 @@ class NotificationRepositoryPort(ABC):
     def mark_as_read(self, notification_id: str) -> Optional["Notification"]:
         pass
 
+    @abstractmethod
+    def mark_as_read_batch(self, user_id: str, notification_ids: List[str]) -> int:
+        """Mark the user's unread notifications among the ids as read; return the count."""
+        pass
+
     @abstractmethod
     def mark_all_as_read(self, user_id: str) -> int:
         pass
@@ -264,6 +304,11 @@ class HashtagRepositoryPort(ABC):
     def update_hashtag_usage(self, hashtag_name: str) -> Optional["Hashtag"]:
         pass
 
+    @abstractmethod
+    def update_hashtag_usage_batch(self, hashtag_names: List[str]) -> None:
+        """Increment usage for many hashtags, creating missing ones."""
+        pass
+
     @abstractmethod
     def update_trending_scores(self, hashtag_scores: dict[str, float]) -> int:
         pass
@@ -272,12 +317,25 @@ class HashtagRepositoryPort(ABC):
     def get_recent_hashtags(self, hours: int = 24, limit: int = 20) -> List["Hashtag"]:
         pass
 
+    @abstractmethod
+    def recalculate_and_fetch_trending(
+        self, hours: int = 24, limit: int = 20
+    ) -> List["Hashtag"]:
+        """Boost the top trending scores and return them, highest first."""
+        pass
+
 
 class ContentModerationRepositoryPort(ABC):
     @abstractmethod
     def save(self, moderation: "ContentModeration") -> "ContentModeration":
         pass
 
+    @abstractmethod
+    def save_many(
+        self, moderations: List["ContentModeration"]
+    ) -> List["ContentModeration"]:
+        pass
+
     @abstractmethod
     def get_by_id(self, moderation_id: str) -> Optional["ContentModeration"]:
         pass
@@ -311,87 +369,18 @@ class ContentModerationRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def get_statistics(self, days: int = 30) -> Dict[str, int]:
-        pass
-
-    @abstractmethod
-    def delete_old_records(self, days: int = 90) -> int:
-        pass
-
-    @abstractmethod
-    def get_by_name(self, name: str) -> Optional["Hashtag"]:
-        pass
-
-    @abstractmethod
-    def get_trending_hashtags(self, limit: int = 50) -> List["Hashtag"]:
-        pass
-
-    @abstractmethod
-    def get_popular_hashtags(self, limit: int = 50) -> List["Hashtag"]:
-        pass
-
-    @abstractmethod
-    def search_hashtags(self, query: str, limit: int = 20) -> List["Hashtag"]:
-        pass
-
-    @abstractmethod
-    def update_hashtag_usage(self, hashtag_name: str) -> Optional["Hashtag"]:
-        pass
-
-    @abstractmethod
-    def update_trending_scores(self, hashtag_scores: dict[str, float]) -> int:
-        pass
-
-    @abstractmethod
-    def get_recent_hashtags(self, hours: int = 24, limit: int = 20) -> List["Hashtag"]:
-        pass
-
-    @abstractmethod
-    def get_by_id(self, notification_id: str) -> Optional["Notification"]:
-        pass
-
-    @abstractmethod
-    def get_user_notifications(
-        self,
-        user_id: str,
-        status: Optional["NotificationStatus"] = None,
-        offset: int = 0,
-        limit: int = 20,
-    ) -> List["Notification"]:
+    def get_reviewer_stats_since(
+        self, reviewer_id: str, cutoff: datetime
+    ) -> Dict[str, float]:
+        """Aggregate a reviewer's completed reviews since the cutoff."""
         pass
 
     @abstractmethod
-    def count_user_notifications(
-        self, user_id: str, status: Optional["NotificationStatus"] = None
-    ) -> int:
-        pass
-
-    @abstractmethod
-    def mark_as_read(self, notification_id: str) -> Optional["Notification"]:
-        pass
-
-    @abstractmethod
-    def mark_all_as_read(self, user_id: str) -> int:
-        pass
-
-    @abstractmethod
-    def delete_notification(self, notification_id: str) -> bool:
-        pass
-
-    @abstractmethod
-    def get_unread_count(self, user_id: str) -> int:
-        pass
-
-    @abstractmethod
-    def is_following(self, follower_id: str, followed_id: str) -> bool:
-        pass
-
-    @abstractmethod
-    def get_followers(self, user_id: str) -> List[Follow]:
+    def get_statistics(self, days: int = 30) -> Dict[str, int]:
         pass
 
     @abstractmethod
-    def get_following(self, user_id: str) -> List[Follow]:
+    def delete_old_records(self, days: int = 90) -> int:
         pass
 
 
@@ -9,6 +9,15 @@ class StoragePort(ABC):
         """
         pass
 
+    def save_file(self, file_name: str, local_path: str) -> str:
+        """
+        Saves a file from the local filesystem and returns the public URL or path.
+        Adapters override this when they can copy by path without reading the
+        file through Python.
+        """
+        with open(local_path, "rb") as file_data:
+            return self.save(file_name, file_data)
+
     @abstractmethod
     def get_url(self, file_name: str) -> str:
         """
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 from ..entities.video_editor import (
     VideoProject,
     VideoEditorAsset,
@@ -24,6 +24,13 @@ class VideoEditorRepositoryPort(ABC):
         """Get a specific project by ID."""
         pass
 
+    @abstractmethod
+    def patch_project(
+        self, project_id: str, fields: Dict[str, Any]
+    ) -> Optional[VideoProject]:
+        """Update the given project fields in place. Returns None if not found."""
+        pass
+
     @abstractmethod
     def get_user_projects(
         self, user_id: str, limit: int = 20, status: Optional[VideoProjectStatus] = None
@@ -72,6 +79,13 @@ class VideoEditorRepositoryPort(ABC):
         """Save or update a transition."""
         pass
 
+    @abstractmethod
+    def save_transitions(
+        self, transitions: List[VideoEditorTransition]
+    ) -> List[VideoEditorTransition]:
+        """Insert several new transitions in a single commit."""
+        pass
+
     @abstractmethod
     def get_project_transitions(self, project_id: str) -> List[VideoEditorTransition]:
         """Get all transitions for a project."""
@@ -83,6 +97,13 @@ class VideoEditorRepositoryPort(ABC):
         """Save or update a track."""
         pass
 
+    @abstractmethod
+    def save_tracks(
+        self, tracks: List[VideoEditorTrack]
+    ) -> List[VideoEditorTrack]:
+        """Insert several new tracks in a single commit."""
+        pass
+
     @abstractmethod
     def get_project_tracks(self, project_id: str) -> List[VideoEditorTrack]:
         """Get all tracks for a project."""
@@ -94,6 +115,13 @@ class VideoEditorRepositoryPort(ABC):
         """Save or update a caption."""
         pass
 
+    @abstractmethod
+    def save_captions(
+        self, captions: List[VideoEditorCaption]
+    ) -> List[VideoEditorCaption]:
+        """Insert several new captions in a single commit."""
+        pass
+
     @abstractmethod
     def get_project_captions(
         self, project_id: str, video_asset_id: str
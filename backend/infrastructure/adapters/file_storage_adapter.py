@@ -4,6 +4,7 @@ from typing import BinaryIO
 from ...domain.ports.storage_port import StoragePort
 
 UPLOAD_DIR = "backend/uploads"
+COPY_BUFFER_SIZE = 1024 * 1024
 
 class FileSystemStorageAdapter(StoragePort):
     def __init__(self, base_url: str = "http://localhost:8000/uploads"):
@@ -14,11 +15,16 @@ class FileSystemStorageAdapter(StoragePort):
     def save(self, file_name: str, file_data: BinaryIO) -> str:
         file_path = os.path.join(UPLOAD_DIR, file_name)
         with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file_data, buffer)
+            shutil.copyfileobj(file_data, buffer, COPY_BUFFER_SIZE)
 
         # The use case now expects a relative path, not a full URL
         return file_name
 
+    def save_file(self, file_name: str, local_path: str) -> str:
+        # copyfile uses the kernel's sendfile/fcopyfile where available
+        shutil.copyfile(local_path, os.path.join(UPLOAD_DIR, file_name))
+        return file_name
+
     def get_url(self, file_name: str) -> str:
         return f"{self.base_url}/{file_name}"
 
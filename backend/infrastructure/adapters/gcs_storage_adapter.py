@@ -80,6 +80,23 @@ class GCSStorageAdapter(StoragePort):
             logger.error(f"Error uploading {file_name} to GCS: {e}")
             raise
 
+    def save_file(self, file_name: str, local_path: str) -> str:
+        """Upload a local file to GCS by path and return the file key."""
+        try:
+            blob = self.bucket.blob(file_name)
+            content_type = self._get_content_type(file_name)
+            blob.upload_from_filename(local_path, content_type=content_type)
+
+            # Make publicly accessible
+            blob.make_public()
+
+            logger.info(f"Successfully uploaded {file_name} to GCS")
+            return file_name
+
+        except Exception as e:
+            logger.error(f"Error uploading {file_name} to GCS: {e}")
+            raise
+
     def get_url(self, file_name: str) -> str:
         """Get public URL for a file."""
         if self.cdn_domain:
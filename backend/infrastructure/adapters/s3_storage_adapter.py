@@ -4,10 +4,21 @@ from typing import BinaryIO, Optional
 from urllib.parse import quote
 from ...domain.ports.storage_port import StoragePort
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 
 logger = logging.getLogger(__name__)
 
+# Upload large renditions in 8MB parts on a few threads so a file is never
+# held in memory as a single PUT body.
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_CHUNK_SIZE,
+    multipart_chunksize=MULTIPART_CHUNK_SIZE,
+    use_threads=True,
+    max_concurrency=4,
+)
+
 
 class S3StorageAdapter(StoragePort):
     """AWS S3 storage adapter for production-ready file storage."""
@@ -66,14 +77,8 @@ class S3StorageAdapter(StoragePort):
                 file_data,
                 self.bucket_name,
                 file_name,
-                ExtraArgs={
-                    "ContentType": content_type,
-                    "ACL": "public-read",  # Make files publicly accessible
-                    "Metadata": {
-                        "original-name": file_name,
-                        "uploaded-by": "clipsmith",
-                    },
-                },
+                ExtraArgs=self._upload_extra_args(file_name, content_type),
+                Config=TRANSFER_CONFIG,
             )
 
             logger.info(f"Successfully uploaded {file_name} to S3")
@@ -83,6 +88,38 @@ class S3StorageAdapter(StoragePort):
             logger.error(f"Error uploading {file_name} to S3: {e}")
             raise
 
+    def save_file(self, file_name: str, local_path: str) -> str:
+        """Upload a local file to S3 by path and return the file key."""
+        try:
+            content_type = self._get_content_type(file_name)
+
+            # upload_file reads the parts straight from the path on the
+            # transfer threads instead of through one shared file object
+            self.s3_client.upload_file(
+                local_path,
+                self.bucket_name,
+                file_name,
+                ExtraArgs=self._upload_extra_args(file_name, content_type),
+                Config=TRANSFER_CONFIG,
+            )
+
+            logger.info(f"Successfully uploaded {file_name} to S3")
+            return file_name
+
+        except ClientError as e:
+            logger.error(f"Error uploading {file_name} to S3: {e}")
+            raise
+
+    def _upload_extra_args(self, file_name: str, content_type: str) -> dict:
+        return {
+            "ContentType": content_type,
+            "ACL": "public-read",  # Make files publicly accessible
+            "Metadata": {
+                "original-name": file_name,
+                "uploaded-by": "clipsmith",
+            },
+        }
+
     def get_url(self, file_name: str) -> str:
         """Get public URL for a file."""
         if self.cloudfront_domain:
@@ -1,8 +1,8 @@
 import os
 import logging
+import threading
 from typing import Union
 from .file_storage_adapter import FileSystemStorageAdapter
-from .s3_storage_adapter import S3StorageAdapter
 from ...domain.ports.storage_port import StoragePort
 
 logger = logging.getLogger(__name__)
@@ -21,6 +21,8 @@ def create_storage_adapter() -> StoragePort:
     if storage_type == "s3":
         logger.info("Initializing S3 storage adapter")
 
+        from .s3_storage_adapter import S3StorageAdapter
+
         required_env_vars = [
             "AWS_ACCESS_KEY_ID",
             "AWS_SECRET_ACCESS_KEY",
@@ -78,13 +80,16 @@ def create_storage_adapter() -> StoragePort:
         raise ValueError(f"Unsupported storage type: {storage_type}")
 
 
-# Singleton instance for the application
+# Singleton instance for the application, created on first use
 storage_adapter: Union[StoragePort, None] = None
+_storage_adapter_lock = threading.Lock()
 
 
 def get_storage_adapter() -> StoragePort:
     """Get the singleton storage adapter instance."""
     global storage_adapter
     if storage_adapter is None:
-        storage_adapter = create_storage_adapter()
+        with _storage_adapter_lock:
+            if storage_adapter is None:
+                storage_adapter = create_storage_adapter()
     return storage_adapter
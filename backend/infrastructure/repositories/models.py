@@ -1,4 +1,5 @@
 from typing import Optional, List, Dict, Any
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 from datetime import datetime
 import uuid
@@ -499,6 +500,8 @@ class CreatorWalletDB(SQLModel, table=True):
 
 class PayoutDB(SQLModel, table=True):
     __tablename__ = "payouts"
+    # Serves per-user payout counts over a date range
+    __table_args__ = (Index("ix_payouts_user_id_created_at", "user_id", "created_at"),)
 
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     wallet_id: str = Field(foreign_key="creator_wallets.id")
@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlmodel import Session, select, and_, desc, func
 from datetime import datetime, timedelta
 from ...domain.entities.analytics import (
@@ -76,6 +76,20 @@ class SQLiteAnalyticsRepository(AnalyticsRepositoryPort):
         results = self.session.exec(query).all()
         return [VideoAnalytics(**analytics.model_dump()) for analytics in results]
 
+    def count_distinct_videos(
+        self, user_id: str, period_start: datetime, period_end: datetime
+    ) -> int:
+        count = self.session.exec(
+            select(func.count(func.distinct(VideoAnalyticsDB.video_id))).where(
+                and_(
+                    VideoAnalyticsDB.user_id == user_id,
+                    VideoAnalyticsDB.period_start >= period_start,
+                    VideoAnalyticsDB.period_end <= period_end,
+                )
+            )
+        ).one()
+        return count or 0
+
     def get_top_performing_videos(
         self, user_id: str, limit: int = 10, metric: str = "views"
     ) -> List[VideoAnalytics]:
@@ -97,6 +111,89 @@ class SQLiteAnalyticsRepository(AnalyticsRepositoryPort):
         results = self.session.exec(query).all()
         return [VideoAnalytics(**analytics.model_dump()) for analytics in results]
 
+    def bulk_record_video_views(
+        self, deltas: Dict[Tuple[str, datetime], Dict[str, Any]]
+    ) -> None:
+        """Apply buffered view deltas in a single transaction.
+
+        ``deltas`` maps ``(video_id, period_start)`` of a day bucket to
+        ``{"user_id", "period_end", "views", "watch_time"}``.
+        """
+        if not deltas:
+            return
+
+        video_ids = {video_id for video_id, _ in deltas}
+        period_starts = {period_start for _, period_start in deltas}
+        rows = self.session.exec(
+            select(VideoAnalyticsDB)
+            .where(
+                VideoAnalyticsDB.video_id.in_(video_ids),
+                VideoAnalyticsDB.period_start.in_(period_starts),
+            )
+            .order_by(VideoAnalyticsDB.created_at)
+        ).all()
+        # Later rows win, matching get_video_analytics' newest-first lookup
+        analytics_by_key = {(row.video_id, row.period_start): row for row in rows}
+
+        views_by_video: Dict[str, Tuple[str, int]] = {}
+        for key, delta in deltas.items():
+            analytics_db = analytics_by_key.get(key)
+            if analytics_db is None:
+                analytics_db = VideoAnalyticsDB(
+                    video_id=key[0],
+                    user_id=delta["user_id"],
+                    period_start=key[1],
+                    period_end=delta["period_end"],
+                )
+                self.session.add(analytics_db)
+
+            analytics_db.views = (analytics_db.views or 0) + delta["views"]
+            analytics_db.watch_time = (analytics_db.watch_time or 0.0) + delta[
+                "watch_time"
+            ]
+            views = analytics_db.views
+            interactions = (
+                (analytics_db.likes or 0)
+                + (analytics_db.comments or 0)
+                + (analytics_db.shares or 0)
+            )
+            analytics_db.average_watch_time = (
+                analytics_db.watch_time / views if views > 0 else 0.0
+            )
+            analytics_db.engagement_rate = (
+                (interactions / views) * 100 if views > 0 else 0.0
+            )
+
+            user_id, total = views_by_video.get(key[0], (delta["user_id"], 0))
+            views_by_video[key[0]] = (user_id, total + delta["views"])
+
+        performance_by_video = {
+            row.video_id: row
+            for row in self.session.exec(
+                select(ContentPerformanceDB).where(
+                    ContentPerformanceDB.video_id.in_(views_by_video)
+                )
+            ).all()
+        }
+        now = datetime.utcnow()
+        for video_id, (user_id, views) in views_by_video.items():
+            performance_db = performance_by_video.get(video_id)
+            if performance_db is None:
+                self.session.add(
+                    ContentPerformanceDB(
+                        user_id=user_id,
+                        video_id=video_id,
+                        content_type=ContentType.VIDEO.value,
+                        views=views,
+                        publish_date=now,
+                        first_24h_views=views,
+                    )
+                )
+            else:
+                performance_db.views = (performance_db.views or 0) + views
+
+        self.session.commit()
+
     # Creator Analytics
     def save_creator_analytics(self, analytics: CreatorAnalytics) -> CreatorAnalytics:
         from dataclasses import asdict
@@ -218,6 +315,35 @@ class SQLiteAnalyticsRepository(AnalyticsRepositoryPort):
             return TimeSeriesData(**data_dict)
         return None
 
+    def get_metric_events(
+        self,
+        user_id: str,
+        metric_type: MetricType,
+        period_start: datetime,
+        period_end: datetime,
+    ) -> List[Tuple[datetime, datetime, float]]:
+        metric_columns = {
+            MetricType.VIEWS: VideoAnalyticsDB.views,
+            MetricType.LIKES: VideoAnalyticsDB.likes,
+            MetricType.TIPS: VideoAnalyticsDB.tips_amount,
+        }
+        column = metric_columns.get(metric_type)
+        if column is None:
+            return []
+
+        rows = self.session.exec(
+            select(
+                VideoAnalyticsDB.period_start, VideoAnalyticsDB.period_end, column
+            ).where(
+                and_(
+                    VideoAnalyticsDB.user_id == user_id,
+                    VideoAnalyticsDB.period_start >= period_start,
+                    VideoAnalyticsDB.period_end <= period_end,
+                )
+            )
+        ).all()
+        return [(start, end, value or 0) for start, end, value in rows]
+
     def get_metrics_summary(
         self,
         user_id: str,
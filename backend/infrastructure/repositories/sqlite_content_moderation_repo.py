@@ -1,4 +1,8 @@
+import json
+from dataclasses import asdict
+from datetime import datetime
 from typing import Dict, List, Optional
+from sqlalchemy import case
 from sqlmodel import Session, select, func, and_, desc
 from ...domain.entities.content_moderation import (
     ContentModeration,
@@ -15,17 +19,47 @@ class SQLiteContentModerationRepository(ContentModerationRepositoryPort):
     def __init__(self, session: Session):
         self.session = session
 
+    @staticmethod
+    def _to_db(moderation: ContentModeration) -> ContentModerationDB:
+        """Convert domain entity to DB model, storing ai_labels as JSON."""
+        data = asdict(moderation)
+        labels = data.pop("ai_labels")
+        data["ai_labels"] = json.dumps(labels) if labels is not None else None
+        return ContentModerationDB.model_validate(data)
+
+    @staticmethod
+    def _to_domain(moderation_db: ContentModerationDB) -> ContentModeration:
+        """Convert DB model to domain entity, decoding ai_labels."""
+        data = moderation_db.model_dump()
+        labels = data.pop("ai_labels", None)
+        data["ai_labels"] = json.loads(labels) if labels else None
+        return ContentModeration(**data)
+
     def save(self, moderation: ContentModeration) -> ContentModeration:
-        moderation_db = ContentModerationDB.model_validate(moderation)
+        moderation_db = self._to_db(moderation)
         moderation_db = self.session.merge(moderation_db)
         self.session.commit()
         self.session.refresh(moderation_db)
-        return ContentModeration(**moderation_db.model_dump())
+        return self._to_domain(moderation_db)
+
+    def save_many(
+        self, moderations: List[ContentModeration]
+    ) -> List[ContentModeration]:
+        moderation_dbs = [
+            self.session.merge(self._to_db(moderation))
+            for moderation in moderations
+        ]
+        # Flush before committing so the saved values can be read back without
+        # a refresh round-trip per record
+        self.session.flush()
+        saved = [self._to_domain(m) for m in moderation_dbs]
+        self.session.commit()
+        return saved
 
     def get_by_id(self, moderation_id: str) -> Optional[ContentModeration]:
         moderation_db = self.session.get(ContentModerationDB, moderation_id)
         if moderation_db:
-            return ContentModeration(**moderation_db.model_dump())
+            return self._to_domain(moderation_db)
         return None
 
     def get_pending_moderations(self, limit: int = 50) -> List[ContentModeration]:
@@ -37,7 +71,7 @@ class SQLiteContentModerationRepository(ContentModerationRepositoryPort):
             .limit(limit)
         )
         results = self.session.exec(statement).all()
-        return [ContentModeration(**m.model_dump()) for m in results]
+        return [self._to_domain(m) for m in results]
 
     def get_moderations_by_content_id(
         self, content_id: str, content_type: Optional[str] = None
@@ -53,7 +87,7 @@ class SQLiteContentModerationRepository(ContentModerationRepositoryPort):
         query = query.order_by(ContentModerationDB.created_at.desc())
 
         results = self.session.exec(query).all()
-        return [ContentModeration(**m.model_dump()) for m in results]
+        return [self._to_domain(m) for m in results]
 
     def get_moderations_by_status(
         self, status: ModerationStatus, limit: int = 100
@@ -66,7 +100,7 @@ class SQLiteContentModerationRepository(ContentModerationRepositoryPort):
             .limit(limit)
         )
         results = self.session.exec(statement).all()
-        return [ContentModeration(**m.model_dump()) for m in results]
+        return [self._to_domain(m) for m in results]
 
     def get_moderations_by_reviewer(
         self, reviewer_id: str, limit: int = 100
@@ -79,7 +113,7 @@ class SQLiteContentModerationRepository(ContentModerationRepositoryPort):
             .limit(limit)
         )
         results = self.session.exec(statement).all()
-        return [ContentModeration(**m.model_dump()) for m in results]
+        return [self._to_domain(m) for m in results]
 
     def get_flagged_content(
         self, severity: Optional[ModerationSeverity] = None, limit: int = 50
@@ -97,7 +131,33 @@ class SQLiteContentModerationRepository(ContentModerationRepositoryPort):
         ).limit(limit)
 
         results = self.session.exec(query).all()
-        return [ContentModeration(**m.model_dump()) for m in results]
+        return [self._to_domain(m) for m in results]
+
+    def get_reviewer_stats_since(
+        self, reviewer_id: str, cutoff: datetime
+    ) -> Dict[str, float]:
+        """Count and time a reviewer's completed reviews in one aggregate query."""
+        status = ContentModerationDB.status
+        review_hours = (
+            func.julianday(ContentModerationDB.completed_at)
+            - func.julianday(ContentModerationDB.created_at)
+        ) * 24
+        statement = select(
+            func.count(),
+            func.count(case((status == ModerationStatus.APPROVED.value, 1))),
+            func.count(case((status == ModerationStatus.REJECTED.value, 1))),
+            func.avg(review_hours),
+        ).where(
+            ContentModerationDB.human_reviewer_id == reviewer_id,
+            ContentModerationDB.completed_at >= cutoff,
+        )
+        total, approved, rejected, avg_hours = self.session.exec(statement).one()
+        return {
+            "total_reviews": total,
+            "approved": approved,
+            "rejected": rejected,
+            "average_review_time_hours": avg_hours or 0,
+        }
 
     def get_statistics(self, days: int = 30) -> Dict[str, int]:
         """Get moderation statistics for the last N days."""
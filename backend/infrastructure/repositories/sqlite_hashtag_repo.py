@@ -1,10 +1,19 @@
+import uuid
+from datetime import datetime, timedelta
 from typing import List, Optional
+from sqlalchemy import case, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, select, func, and_, desc
 from ...domain.entities.hashtag import Hashtag
 from ...domain.ports.repository_ports import HashtagRepositoryPort
 from .database import engine
 from .models import HashtagDB
 
+# ON CONFLICT upserts are dialect-specific constructs; SQLite is used locally
+# and PostgreSQL in production
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
 
 class SQLiteHashtagRepository(HashtagRepositoryPort):
     def __init__(self, session: Session):
@@ -71,6 +80,42 @@ class SQLiteHashtagRepository(HashtagRepositoryPort):
         self.session.refresh(hashtag_db)
         return Hashtag(**hashtag_db.model_dump())
 
+    def update_hashtag_usage_batch(self, hashtag_names: List[str]) -> None:
+        """Upsert usage for all hashtags in a single statement."""
+        if not hashtag_names:
+            return
+
+        statement = self._usage_upsert(
+            hashtag_names, self.session.get_bind().dialect.name
+        )
+        self.session.exec(statement)
+        self.session.commit()
+
+    def _usage_upsert(self, hashtag_names: List[str], dialect_name: str):
+        """Build the usage INSERT ... ON CONFLICT DO UPDATE for a dialect."""
+        insert = _UPSERT_INSERTS[dialect_name]
+        now = datetime.utcnow()
+        statement = insert(HashtagDB).values(
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "name": name,
+                    "count": 1,
+                    "trending_score": 0.0,
+                    "created_at": now,
+                    "last_used_at": now,
+                }
+                for name in dict.fromkeys(hashtag_names)
+            ]
+        )
+        return statement.on_conflict_do_update(
+            index_elements=[HashtagDB.name],
+            set_={
+                "count": HashtagDB.count + 1,
+                "last_used_at": statement.excluded.last_used_at,
+            },
+        )
+
     def update_trending_scores(self, hashtag_scores: dict[str, float]) -> int:
         """Update trending scores for multiple hashtags."""
         updated_count = 0
@@ -100,3 +145,46 @@ class SQLiteHashtagRepository(HashtagRepositoryPort):
         )
         results = self.session.exec(statement).all()
         return [Hashtag(**h.model_dump()) for h in results]
+
+    def recalculate_and_fetch_trending(
+        self, hours: int = 24, limit: int = 20
+    ) -> List[Hashtag]:
+        """Rescore the current top hashtags in a single UPDATE ... RETURNING.
+
+        Scores are boosted for use among the 50 most recent hashtags in the
+        window (x1.5), more than 10 uses (x1.2) and more than 5 uses (x1.1).
+        """
+        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        top_ids = (
+            select(HashtagDB.id)
+            .order_by(desc(HashtagDB.trending_score))
+            .limit(limit)
+            .scalar_subquery()
+        )
+        recent_ids = (
+            select(HashtagDB.id)
+            .where(HashtagDB.last_used_at >= cutoff_time)
+            .order_by(desc(HashtagDB.last_used_at))
+            .limit(50)
+            .scalar_subquery()
+        )
+        statement = (
+            update(HashtagDB)
+            .where(HashtagDB.id.in_(top_ids))
+            .values(
+                trending_score=HashtagDB.trending_score
+                * case((HashtagDB.id.in_(recent_ids), 1.5), else_=1.0)
+                * case((HashtagDB.count > 10, 1.2), else_=1.0)
+                * case((HashtagDB.count > 5, 1.1), else_=1.0)
+            )
+            .returning(*HashtagDB.__table__.columns)
+            .execution_options(synchronize_session=False)
+        )
+        rows = self.session.execute(statement).mappings().all()
+        self.session.commit()
+
+        # RETURNING order is unspecified; boosts never lower a score, so the
+        # rescored rows are still the top of the table
+        hashtags = [Hashtag(**row) for row in rows]
+        hashtags.sort(key=lambda h: h.trending_score, reverse=True)
+        return hashtags
@@ -1,10 +1,11 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlmodel import Session, select, col
+from ...domain.ports.repository_ports import InteractionRepositoryPort
 from .database import engine # Keep for now
 from .models import LikeDB, CommentDB, VideoDB
 from datetime import datetime
 
-class SQLiteInteractionRepository:
+class SQLiteInteractionRepository(InteractionRepositoryPort):
     def __init__(self, session: Session):
         self.session = session
 
@@ -64,3 +65,26 @@ class SQLiteInteractionRepository:
     def list_comments(self, video_id: str) -> List[CommentDB]:
         statement = select(CommentDB).where(CommentDB.video_id == video_id).order_by(col(CommentDB.created_at).desc())
         return list(self.session.exec(statement).all())
+
+    # FEED SIGNALS
+    def get_recent_interactions(self, since: datetime, limit: int = 5000) -> List[Dict]:
+        """Likes and comments created after since, newest first."""
+        interactions = []
+        for model, interaction_type in ((LikeDB, "like"), (CommentDB, "comment")):
+            statement = (
+                select(model.user_id, model.video_id, model.created_at)
+                .where(model.created_at > since)
+                .order_by(col(model.created_at).desc())
+                .limit(limit)
+            )
+            interactions.extend(
+                {
+                    "user_id": user_id,
+                    "video_id": video_id,
+                    "interaction_type": interaction_type,
+                    "created_at": created_at,
+                }
+                for user_id, video_id, created_at in self.session.exec(statement)
+            )
+        interactions.sort(key=lambda interaction: interaction["created_at"], reverse=True)
+        return interactions[:limit]
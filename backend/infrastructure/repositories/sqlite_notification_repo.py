@@ -1,4 +1,8 @@
+import json
+from dataclasses import asdict
+from datetime import datetime
 from typing import List, Optional
+from sqlalchemy import update
 from sqlmodel import Session, select, func, and_
 from ...domain.entities.notification import Notification, NotificationStatus
 from ...domain.ports.repository_ports import NotificationRepositoryPort
@@ -10,17 +14,44 @@ class SQLiteNotificationRepository(NotificationRepositoryPort):
     def __init__(self, session: Session):
         self.session = session
 
+    @staticmethod
+    def _to_db(notification: Notification) -> NotificationDB:
+        """Convert domain entity to DB model, storing data as JSON."""
+        fields = asdict(notification)
+        data = fields.pop("data")
+        fields["data"] = json.dumps(data) if data is not None else None
+        return NotificationDB.model_validate(fields)
+
+    @staticmethod
+    def _to_domain(notification_db: NotificationDB) -> Notification:
+        """Convert DB model to domain entity, decoding data."""
+        fields = notification_db.model_dump()
+        data = fields.pop("data", None)
+        fields["data"] = json.loads(data) if data else None
+        return Notification(**fields)
+
     def save(self, notification: Notification) -> Notification:
-        notification_db = NotificationDB.model_validate(notification)
+        notification_db = self._to_db(notification)
         notification_db = self.session.merge(notification_db)
         self.session.commit()
         self.session.refresh(notification_db)
-        return Notification(**notification_db.model_dump())
+        return self._to_domain(notification_db)
+
+    def save_many(self, notifications: List[Notification]) -> int:
+        """Insert new notifications in one flush and commit."""
+        self.session.add_all([self._to_db(n) for n in notifications])
+        try:
+            self.session.commit()
+        except Exception:
+            # Leave the request-scoped session usable for the caller
+            self.session.rollback()
+            raise
+        return len(notifications)
 
     def get_by_id(self, notification_id: str) -> Optional[Notification]:
         notification_db = self.session.get(NotificationDB, notification_id)
         if notification_db:
-            return Notification(**notification_db.model_dump())
+            return self._to_domain(notification_db)
         return None
 
     def get_user_notifications(
@@ -40,7 +71,7 @@ class SQLiteNotificationRepository(NotificationRepositoryPort):
         )
 
         results = self.session.exec(query).all()
-        return [Notification(**n.model_dump()) for n in results]
+        return [self._to_domain(n) for n in results]
 
     def count_user_notifications(
         self, user_id: str, status: Optional[NotificationStatus] = None
@@ -64,13 +95,32 @@ class SQLiteNotificationRepository(NotificationRepositoryPort):
             self.session.add(notification_db)
             self.session.commit()
             self.session.refresh(notification_db)
-            return Notification(**notification_db.model_dump())
+            return self._to_domain(notification_db)
         return None
 
+    def mark_as_read_batch(self, user_id: str, notification_ids: List[str]) -> int:
+        """Mark the user's given unread notifications as read in one UPDATE."""
+        if not notification_ids:
+            return 0
+
+        statement = (
+            update(NotificationDB)
+            .where(
+                and_(
+                    NotificationDB.id.in_(notification_ids),
+                    NotificationDB.user_id == user_id,
+                    NotificationDB.status == NotificationStatus.UNREAD.value,
+                )
+            )
+            .values(status=NotificationStatus.READ.value, read_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        result = self.session.execute(statement)
+        self.session.commit()
+        return result.rowcount
+
     def mark_all_as_read(self, user_id: str) -> int:
         """Mark all unread notifications for a user as read."""
-        from datetime import datetime
-
         # Get all unread notifications
         query = select(NotificationDB).where(
             and_(
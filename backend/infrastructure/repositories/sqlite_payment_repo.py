@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 from sqlmodel import Session, select, and_, desc, func
 from ...domain.entities.payment import (
@@ -18,22 +19,52 @@ import json
 class SQLitePaymentRepository(PaymentRepositoryPort):
     def __init__(self, session: Session):
         self.session = session
+        self._in_unit_of_work = False
+        # Wallets looked up by user for the life of this repository (one
+        # request), including misses; kept current by the wallet writes
+        self._wallets_by_user: Dict[str, Optional[CreatorWallet]] = {}
+
+    def _commit_or_flush(self) -> None:
+        """Commit now, or only flush while a unit of work is open."""
+        if self._in_unit_of_work:
+            self.session.flush()
+        else:
+            self.session.commit()
+
+    # Unit of work
+    def begin(self) -> None:
+        self._in_unit_of_work = True
+
+    def commit(self) -> None:
+        self._in_unit_of_work = False
+        self.session.commit()
+
+    def rollback(self) -> None:
+        self._in_unit_of_work = False
+        self.session.rollback()
+        # Cached wallets may reflect writes that were just discarded
+        self._wallets_by_user.clear()
 
     # Wallet operations
     def save_wallet(self, wallet: CreatorWallet) -> CreatorWallet:
         wallet_db = CreatorWalletDB.model_validate(wallet)
         wallet_db = self.session.merge(wallet_db)
-        self.session.commit()
+        self._commit_or_flush()
         self.session.refresh(wallet_db)
-        return CreatorWallet(**wallet_db.model_dump())
+        saved = CreatorWallet(**wallet_db.model_dump())
+        self._wallets_by_user[saved.user_id] = saved
+        return saved
 
     def get_wallet_by_user_id(self, user_id: str) -> Optional[CreatorWallet]:
+        if user_id in self._wallets_by_user:
+            return self._wallets_by_user[user_id]
+
         wallet_db = self.session.exec(
             select(CreatorWalletDB).where(CreatorWalletDB.user_id == user_id)
         ).first()
-        if wallet_db:
-            return CreatorWallet(**wallet_db.model_dump())
-        return None
+        wallet = CreatorWallet(**wallet_db.model_dump()) if wallet_db else None
+        self._wallets_by_user[user_id] = wallet
+        return wallet
 
     def get_wallet_by_id(self, wallet_id: str) -> Optional[CreatorWallet]:
         wallet_db = self.session.get(CreatorWalletDB, wallet_id)
@@ -49,9 +80,11 @@ class SQLitePaymentRepository(PaymentRepositoryPort):
             raise ValueError("Wallet not found")
 
         wallet_db.stripe_account_id = stripe_account_id
-        self.session.commit()
+        self._commit_or_flush()
         self.session.refresh(wallet_db)
-        return CreatorWallet(**wallet_db.model_dump())
+        wallet = CreatorWallet(**wallet_db.model_dump())
+        self._wallets_by_user[wallet.user_id] = wallet
+        return wallet
 
     # Transaction operations
     def save_transaction(self, transaction: Transaction) -> Transaction:
@@ -62,7 +95,7 @@ class SQLitePaymentRepository(PaymentRepositoryPort):
         transaction_db = TransactionDB(**data)
 
         transaction_db = self.session.merge(transaction_db)
-        self.session.commit()
+        self._commit_or_flush()
         self.session.refresh(transaction_db)
         return self._to_domain(transaction_db)
 
@@ -147,6 +180,14 @@ class SQLitePaymentRepository(PaymentRepositoryPort):
         results = self.session.exec(query).all()
         return [Payout(**payout.model_dump()) for payout in results]
 
+    def count_payouts_since(self, user_id: str, cutoff: datetime) -> int:
+        query = (
+            select(func.count())
+            .select_from(PayoutDB)
+            .where(and_(PayoutDB.user_id == user_id, PayoutDB.created_at >= cutoff))
+        )
+        return self.session.exec(query).one()
+
     # Subscription operations
     def save_subscription(self, subscription: Subscription) -> Subscription:
         subscription_db = SubscriptionDB.model_validate(subscription)
@@ -187,6 +228,19 @@ class SQLitePaymentRepository(PaymentRepositoryPort):
         results = self.session.exec(query).all()
         return [Subscription(**subscription.model_dump()) for subscription in results]
 
+    def count_creator_subscribers(self, creator_id: str) -> int:
+        query = (
+            select(func.count())
+            .select_from(SubscriptionDB)
+            .where(
+                and_(
+                    SubscriptionDB.creator_id == creator_id,
+                    SubscriptionDB.status == "active",
+                )
+            )
+        )
+        return self.session.exec(query).one()
+
     def get_subscription_by_stripe_id(
         self, stripe_subscription_id: str
     ) -> Optional[Subscription]:
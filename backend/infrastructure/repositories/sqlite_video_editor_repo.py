@@ -1,4 +1,7 @@
-from typing import List, Optional
+import json
+from dataclasses import asdict, fields as dataclass_fields
+from typing import Any, Dict, List, Optional
+from sqlalchemy import update
 from sqlmodel import Session, select, func, and_, desc
 from ...domain.entities.video_editor import (
     VideoProject,
@@ -23,17 +26,54 @@ class SQLiteVideoEditorRepository(VideoEditorRepositoryPort):
     def __init__(self, session: Session):
         self.session = session
 
+    @staticmethod
+    def _project_to_domain(project_db: VideoProjectDB) -> VideoProject:
+        fields = project_db.model_dump()
+        fields["metadata"] = fields.pop("extra_metadata")
+        return VideoProject(**fields)
+
+    @staticmethod
+    def _to_db(entity, db_model, json_field: str):
+        """Convert a timeline entity to its DB model, storing json_field as JSON."""
+        fields = asdict(entity)
+        value = fields.pop(json_field)
+        fields[json_field] = json.dumps(value) if value is not None else None
+        return db_model.model_validate(fields)
+
+    @staticmethod
+    def _to_domain(row, entity_cls, json_field: str):
+        """Convert a DB row to a timeline entity, decoding json_field."""
+        fields = row.model_dump(include={f.name for f in dataclass_fields(entity_cls)})
+        value = fields.pop(json_field, None)
+        fields[json_field] = json.loads(value) if value else None
+        return entity_cls(**fields)
+
     def save_project(self, project: VideoProject) -> VideoProject:
         project_db = VideoProjectDB.model_validate(project)
         project_db = self.session.merge(project_db)
         self.session.commit()
         self.session.refresh(project_db)
-        return VideoProject(**project_db.model_dump())
+        return self._project_to_domain(project_db)
+
+    def patch_project(
+        self, project_id: str, fields: Dict[str, Any]
+    ) -> Optional[VideoProject]:
+        """Update the given project fields with a single UPDATE ... RETURNING."""
+        project_db = self.session.execute(
+            update(VideoProjectDB)
+            .where(VideoProjectDB.id == project_id)
+            .values(**fields)
+            .returning(VideoProjectDB)
+        ).scalar_one_or_none()
+        # Convert before committing; the commit expires the returned row
+        project = self._project_to_domain(project_db) if project_db else None
+        self.session.commit()
+        return project
 
     def get_project_by_id(self, project_id: str) -> Optional[VideoProject]:
         project_db = self.session.get(VideoProjectDB, project_id)
         if project_db:
-            return VideoProject(**project_db.model_dump())
+            return self._project_to_domain(project_db)
         return None
 
     def get_user_projects(
@@ -49,7 +89,7 @@ class SQLiteVideoEditorRepository(VideoEditorRepositoryPort):
         query = query.order_by(VideoProjectDB.updated_at.desc()).limit(limit)
 
         results = self.session.exec(query).all()
-        return [VideoProject(**project.model_dump()) for project in results]
+        return [self._project_to_domain(project) for project in results]
 
     def get_all_projects(self, limit: int = 50) -> List[VideoProject]:
         """Get all video editor projects."""
@@ -60,7 +100,7 @@ class SQLiteVideoEditorRepository(VideoEditorRepositoryPort):
         )
 
         results = self.session.exec(query).all()
-        return [VideoProject(**project.model_dump()) for project in results]
+        return [self._project_to_domain(project) for project in results]
 
     def delete_project(self, project_id: str) -> bool:
         """Delete a video editor project."""
@@ -113,11 +153,24 @@ class SQLiteVideoEditorRepository(VideoEditorRepositoryPort):
     def save_transition(
         self, transition: VideoEditorTransition
     ) -> VideoEditorTransition:
-        transition_db = VideoEditorTransitionDB.model_validate(transition)
+        transition_db = self._to_db(transition, VideoEditorTransitionDB, "parameters")
         transition_db = self.session.merge(transition_db)
         self.session.commit()
         self.session.refresh(transition_db)
-        return VideoEditorTransition(**transition_db.model_dump())
+        return self._to_domain(transition_db, VideoEditorTransition, "parameters")
+
+    def save_transitions(
+        self, transitions: List[VideoEditorTransition]
+    ) -> List[VideoEditorTransition]:
+        """Insert several new transitions in a single flush and commit."""
+        self.session.add_all(
+            [
+                self._to_db(transition, VideoEditorTransitionDB, "parameters")
+                for transition in transitions
+            ]
+        )
+        self.session.commit()
+        return list(transitions)
 
     def get_project_transitions(self, project_id: str) -> List[VideoEditorTransition]:
         """Get all transitions for a project."""
@@ -128,15 +181,26 @@ class SQLiteVideoEditorRepository(VideoEditorRepositoryPort):
 
         results = self.session.exec(query).all()
         return [
-            VideoEditorTransition(**transition.model_dump()) for transition in results
+            self._to_domain(transition, VideoEditorTransition, "parameters")
+            for transition in results
         ]
 
     def save_track(self, track: VideoEditorTrack) -> VideoEditorTrack:
-        track_db = VideoEditorTrackDB.model_validate(track)
+        track_db = self._to_db(track, VideoEditorTrackDB, "content")
         track_db = self.session.merge(track_db)
         self.session.commit()
         self.session.refresh(track_db)
-        return VideoEditorTrack(**track.model_dump())
+        return self._to_domain(track_db, VideoEditorTrack, "content")
+
+    def save_tracks(
+        self, tracks: List[VideoEditorTrack]
+    ) -> List[VideoEditorTrack]:
+        """Insert several new tracks in a single flush and commit."""
+        self.session.add_all(
+            [self._to_db(track, VideoEditorTrackDB, "content") for track in tracks]
+        )
+        self.session.commit()
+        return list(tracks)
 
     def get_project_tracks(self, project_id: str) -> List[VideoEditorTrack]:
         """Get all tracks for a project."""
@@ -146,14 +210,26 @@ class SQLiteVideoEditorRepository(VideoEditorRepositoryPort):
         query = query.order_by(VideoEditorTrackDB.start_time.asc())
 
         results = self.session.exec(query).all()
-        return [VideoEditorTrack(**track.model_dump()) for track in results]
+        return [
+            self._to_domain(track, VideoEditorTrack, "content") for track in results
+        ]
 
     def save_caption(self, caption: VideoEditorCaption) -> VideoEditorCaption:
-        caption_db = VideoEditorCaptionDB.model_validate(caption)
+        caption_db = self._to_db(caption, VideoEditorCaptionDB, "style")
         caption_db = self.session.merge(caption_db)
         self.session.commit()
         self.session.refresh(caption_db)
-        return VideoEditorCaption(**caption_db.model_dump())
+        return self._to_domain(caption_db, VideoEditorCaption, "style")
+
+    def save_captions(
+        self, captions: List[VideoEditorCaption]
+    ) -> List[VideoEditorCaption]:
+        """Insert several new captions in a single flush and commit."""
+        self.session.add_all(
+            [self._to_db(caption, VideoEditorCaptionDB, "style") for caption in captions]
+        )
+        self.session.commit()
+        return list(captions)
 
     def get_project_captions(
         self, project_id: str, video_asset_id: str
@@ -168,7 +244,9 @@ class SQLiteVideoEditorRepository(VideoEditorRepositoryPort):
         query = query.order_by(VideoEditorCaptionDB.start_time.asc())
 
         results = self.session.exec(query).all()
-        return [VideoEditorCaption(**caption.model_dump()) for caption in results]
+        return [
+            self._to_domain(caption, VideoEditorCaption, "style") for caption in results
+        ]
 
     def delete_caption(self, caption_id: str) -> bool:
         """Delete a caption."""
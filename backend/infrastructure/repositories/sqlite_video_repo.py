@@ -1,5 +1,6 @@
-from typing import List, Optional
-from sqlmodel import Session, select, func
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlmodel import Session, select, func, and_, or_
 from ...domain.entities.video import Video
 from ...domain.ports.repository_ports import VideoRepositoryPort
 from .database import engine
@@ -37,6 +38,26 @@ class SQLiteVideoRepository(VideoRepositoryPort):
         statement = select(func.count()).select_from(VideoDB)
         return self.session.exec(statement).one()
 
+    def find_after(
+        self, after_cursor: Optional[Tuple[datetime, str]] = None, limit: int = 20
+    ) -> List[Video]:
+        # Keyset pagination: seek past the last-seen key instead of OFFSET,
+        # so deep pages cost the same as the first one.
+        statement = select(VideoDB)
+        if after_cursor:
+            created_at, video_id = after_cursor
+            statement = statement.where(
+                or_(
+                    VideoDB.created_at < created_at,
+                    and_(VideoDB.created_at == created_at, VideoDB.id < video_id),
+                )
+            )
+        statement = statement.order_by(
+            VideoDB.created_at.desc(), VideoDB.id.desc()
+        ).limit(limit)
+        results = self.session.exec(statement).all()
+        return [Video(**v.model_dump()) for v in results]
+
     def list_by_creator(self, creator_id: str) -> List[Video]:
         statement = (
             select(VideoDB)
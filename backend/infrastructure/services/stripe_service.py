@@ -1,3 +1,4 @@
+import asyncio
 import os
 import stripe
 from typing import Dict, Any, Optional
@@ -15,7 +16,7 @@ class StripeService(StripeServicePort):
         """Create a Stripe payment intent."""
         try:
             # Convert amount to cents
-            amount_cents = int(amount * 100)
+            amount_cents = round(amount * 100)
             
             intent = stripe.PaymentIntent.create(
                 amount=amount_cents,
@@ -69,7 +70,7 @@ class StripeService(StripeServicePort):
             refund_params = {"charge": charge_id}
             
             if amount:
-                refund_params["amount"] = int(amount * 100)
+                refund_params["amount"] = round(amount * 100)
             
             refund = stripe.Refund.create(**refund_params)
             
@@ -180,7 +181,7 @@ class StripeService(StripeServicePort):
                           currency: str = "USD", metadata: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Create a payout to a bank account."""
         try:
-            amount_cents = int(amount * 100)
+            amount_cents = round(amount * 100)
             
             payout = stripe.Payout.create(
                 amount=amount_cents,
@@ -274,7 +275,7 @@ class StripeService(StripeServicePort):
                          interval: str = "month", product_id: Optional[str] = None) -> Dict[str, Any]:
         """Create a price for subscriptions."""
         try:
-            amount_cents = int(amount * 100)
+            amount_cents = round(amount * 100)
             
             price_params = {
                 "unit_amount": amount_cents,
@@ -291,7 +292,8 @@ class StripeService(StripeServicePort):
                     "description": "Monthly subscription to creator content"
                 }
             
-            price = stripe.Price.create(**price_params)
+            # Off the event loop, so callers can overlap it with other Stripe calls
+            price = await asyncio.to_thread(stripe.Price.create, **price_params)
             
             return {
                 "success": True,
@@ -311,7 +313,8 @@ class StripeService(StripeServicePort):
     async def create_customer(self, email: str, metadata: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Create a Stripe customer."""
         try:
-            customer = stripe.Customer.create(
+            customer = await asyncio.to_thread(
+                stripe.Customer.create,
                 email=email,
                 metadata=metadata or {}
             )
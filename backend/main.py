@@ -1,5 +1,5 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 from starlette.middleware.base import BaseHTTPMiddleware
 from .presentation.api.video_router import router as video_router
@@ -12,7 +12,10 @@ from .presentation.api.moderation_router import router as moderation_router
 from .presentation.api.monitoring_router import router as monitoring_router
 from .presentation.api.video_editor_router import router as video_editor_router
 from .presentation.api.payment_router import router as payment_router
-from .presentation.api.analytics_router import router as analytics_router
+from .presentation.api.analytics_router import (
+    router as analytics_router,
+    view_aggregator,
+)
 from .presentation.api.ai_router import router as ai_router
 from .presentation.api.community_router import router as community_router
 from .presentation.api.social_router import router as social_router
@@ -43,9 +46,14 @@ limiter = Limiter(key_func=get_remote_address, default_limits=["100/minute"])
 async def lifespan(app: FastAPI):
     create_db_and_tables()
     yield
+    await view_aggregator.close()
 
 
-app = FastAPI(title="clipsmith API", lifespan=lifespan)
+app = FastAPI(
+    title="clipsmith API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -1,11 +1,16 @@
+from contextlib import contextmanager
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
-from ...application.services.analytics_service import AnalyticsService
+from ...application.services.analytics_service import (
+    AnalyticsService,
+    VideoViewAggregator,
+)
 from ...infrastructure.repositories.sqlite_analytics_repo import (
     SQLiteAnalyticsRepository,
 )
-from ...infrastructure.repositories.database import get_session
+from ...infrastructure.repositories.database import get_session, engine
 from .auth_router import get_current_user
+from .responses import orjson_response, struct_response
 from ...domain.entities.analytics import MetricType, TimePeriod, ContentType
 from sqlmodel import Session
 from datetime import datetime, timedelta
@@ -13,10 +18,24 @@ from datetime import datetime, timedelta
 router = APIRouter(prefix="/api/analytics", tags=["analytics"])
 
 
+@contextmanager
+def _analytics_repository_scope():
+    with Session(engine) as session:
+        yield SQLiteAnalyticsRepository(session)
+
+
+# Shared by every request in this process so view writes can be batched
+view_aggregator = VideoViewAggregator(_analytics_repository_scope)
+
+
 def get_analytics_service(session: Session = Depends(get_session)) -> AnalyticsService:
     """Dependency injection for analytics service."""
     repository = SQLiteAnalyticsRepository(session)
-    return AnalyticsService(repository)
+    return AnalyticsService(
+        repository,
+        view_aggregator=view_aggregator,
+        repository_scope=_analytics_repository_scope,
+    )
 
 
 # Video Analytics endpoints
@@ -51,10 +70,8 @@ async def track_video_event(
     else:
         raise HTTPException(status_code=400, detail="Invalid event type")
 
-    if not result["success"]:
-        raise HTTPException(
-            status_code=400, detail=result.get("error", "Tracking failed")
-        )
+    if not result.success:
+        raise HTTPException(status_code=400, detail="Tracking failed")
 
     return {"success": True, "tracked": True}
 
@@ -73,7 +90,7 @@ async def get_video_analytics(
         analytics = service.repository.get_video_analytics(
             video_id, period_start, period_end
         )
-        return {"success": True, "analytics": analytics}
+        return orjson_response({"success": True, "analytics": analytics})
     else:
         raise HTTPException(status_code=403, detail="Access denied")
 
@@ -90,7 +107,7 @@ async def get_user_video_analytics(
     analytics = service.repository.get_user_video_analytics(
         current_user["id"], limit, period_start, period_end
     )
-    return {"success": True, "analytics": analytics}
+    return orjson_response({"success": True, "analytics": analytics})
 
 
 @router.get("/videos/top-performing")
@@ -107,7 +124,7 @@ async def get_top_performing_videos(
     top_videos = service.repository.get_top_performing_videos(
         current_user["id"], limit, metric
     )
-    return {"success": True, "top_videos": top_videos}
+    return orjson_response({"success": True, "top_videos": top_videos})
 
 
 # Creator Analytics endpoints
@@ -118,14 +135,7 @@ async def get_creator_dashboard(
 ):
     """Get comprehensive creator dashboard."""
     dashboard = await service.get_creator_dashboard(current_user["id"])
-
-    if not dashboard["success"]:
-        raise HTTPException(
-            status_code=400,
-            detail=dashboard.get("error", "Dashboard generation failed"),
-        )
-
-    return dashboard
+    return struct_response(dashboard)
 
 
 @router.get("/creator/analytics")
@@ -150,7 +160,7 @@ async def get_creator_analytics(
             detail=analytics.get("error", "Analytics generation failed"),
         )
 
-    return analytics
+    return orjson_response(analytics)
 
 
 @router.get("/creator/history")
@@ -163,7 +173,7 @@ async def get_analytics_history(
     history = service.repository.get_creator_analytics_history(
         current_user["id"], limit
     )
-    return {"success": True, "history": history}
+    return orjson_response({"success": True, "history": history})
 
 
 # Time Series endpoints
@@ -191,7 +201,7 @@ async def get_time_series_data(
             detail=time_series.get("error", "Time series generation failed"),
         )
 
-    return time_series
+    return orjson_response(time_series)
 
 
 # Audience Demographics endpoints
@@ -206,7 +216,7 @@ async def get_audience_demographics(
     demographics = service.repository.get_audience_demographics(
         current_user["id"], period_start, period_end
     )
-    return {"success": True, "demographics": demographics}
+    return orjson_response({"success": True, "demographics": demographics})
 
 
 @router.post("/audience/demographics")
@@ -225,7 +235,7 @@ async def update_audience_demographics(
             status_code=400, detail=result.get("error", "Demographics update failed")
         )
 
-    return result
+    return orjson_response(result)
 
 
 # Content Performance endpoints
@@ -237,7 +247,7 @@ async def get_content_performance(
 ):
     """Get performance metrics for specific content."""
     performance = service.repository.get_content_performance(video_id)
-    return {"success": True, "performance": performance}
+    return orjson_response({"success": True, "performance": performance})
 
 
 @router.get("/content/performance")
@@ -253,7 +263,7 @@ async def get_user_content_performance(
     performance = service.repository.get_user_content_performance(
         current_user["id"], limit, content_type_enum
     )
-    return {"success": True, "performance": performance}
+    return orjson_response({"success": True, "performance": performance})
 
 
 # Trending and Discovery endpoints
@@ -271,14 +281,7 @@ async def get_trending_content(
         raise HTTPException(status_code=400, detail="Invalid time period")
 
     trending = await service.get_trending_content(content_type, period, limit)
-
-    if not trending["success"]:
-        raise HTTPException(
-            status_code=400,
-            detail=trending.get("error", "Trending content fetch failed"),
-        )
-
-    return trending
+    return struct_response(trending)
 
 
 @router.get("/trending/creators")
@@ -294,14 +297,7 @@ async def get_trending_creators(
         raise HTTPException(status_code=400, detail="Invalid time period")
 
     trending = await service.get_trending_creators(period, limit)
-
-    if not trending["success"]:
-        raise HTTPException(
-            status_code=400,
-            detail=trending.get("error", "Trending creators fetch failed"),
-        )
-
-    return trending
+    return struct_response(trending)
 
 
 # Aggregation endpoints
@@ -313,7 +309,7 @@ async def get_daily_analytics(
 ):
     """Get daily aggregated analytics."""
     daily_data = service.repository.aggregate_daily_analytics(current_user["id"], date)
-    return {"success": True, "daily_analytics": daily_data}
+    return orjson_response({"success": True, "daily_analytics": daily_data})
 
 
 @router.get("/aggregates/weekly")
@@ -326,7 +322,7 @@ async def get_weekly_analytics(
     weekly_data = service.repository.aggregate_weekly_analytics(
         current_user["id"], week_start
     )
-    return {"success": True, "weekly_analytics": weekly_data}
+    return orjson_response({"success": True, "weekly_analytics": weekly_data})
 
 
 @router.get("/aggregates/monthly")
@@ -339,7 +335,7 @@ async def get_monthly_analytics(
     monthly_data = service.repository.aggregate_monthly_analytics(
         current_user["id"], month
     )
-    return {"success": True, "monthly_analytics": monthly_data}
+    return orjson_response({"success": True, "monthly_analytics": monthly_data})
 
 
 # Metrics Summary endpoints
@@ -375,4 +371,4 @@ async def get_metrics_summary(
         current_user["id"], metric_list, period, period_start, period_end
     )
 
-    return {"success": True, "metrics": summary}
+    return orjson_response({"success": True, "metrics": summary})
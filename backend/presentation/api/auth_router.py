@@ -26,6 +26,7 @@ from ...infrastructure.security.security_adapter import SecurityAdapter
 from ...infrastructure.repositories.models import PasswordResetDB
 from sqlmodel import Session, select
 from ...domain.ports.repository_ports import UserRepositoryPort
+from .responses import struct_response
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -78,9 +79,7 @@ def get_current_user(
     return user
 
 
-@router.post(
-    "/register", response_model=UserResponseDTO, status_code=status.HTTP_201_CREATED
-)
+@router.post("/register", status_code=status.HTTP_201_CREATED)
 @limiter.limit("5/minute")
 def register(
     request: Request,
@@ -89,16 +88,17 @@ def register(
 ):
     try:
         use_case = RegisterUserUseCase(repo)
-        return use_case.execute(dto)
+        return struct_response(
+            use_case.execute(dto), status_code=status.HTTP_201_CREATED
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/login", response_model=LoginResponseDTO)
+@router.post("/login")
 @limiter.limit("10/minute")
 def login(
     request: Request,
-    response: Response,
     dto: LoginRequestDTO,
     repo: UserRepositoryPort = Depends(get_user_repo),
 ):
@@ -111,6 +111,7 @@ def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    response = struct_response(result)
     response.set_cookie(
         key="access_token",
         value=result.access_token,
@@ -120,7 +121,7 @@ def login(
         max_age=30 * 60,
     )
 
-    return result
+    return response
 
 
 @router.post("/logout")
@@ -129,13 +130,15 @@ def logout(response: Response):
     return {"message": "Successfully logged out"}
 
 
-@router.get("/me", response_model=UserResponseDTO)
+@router.get("/me")
 def get_me(current_user=Depends(get_current_user)):
-    return UserResponseDTO(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        is_active=current_user.is_active,
+    return struct_response(
+        UserResponseDTO(
+            id=current_user.id,
+            username=current_user.username,
+            email=current_user.email,
+            is_active=current_user.is_active,
+        )
     )
 
 
@@ -300,7 +303,7 @@ def setup_2fa(
     two_factor_service = TwoFactorService(user_repo=None)
 
     try:
-        secret, qr_code, backup_codes = two_factor_service.setup_2fa(
+        secret, qr_code, backup_codes = two_factor_service.begin_setup_2fa(
             user_id=current_user.id, method=method, email=current_user.email
         )
 
@@ -316,7 +319,7 @@ def setup_2fa(
 
         return {
             "secret": secret,
-            "qr_code": f"data:image/png;base64,{qr_code}",
+            "qr_code": f"data:image/png;base64,{qr_code.result()}",
             "backup_codes": backup_codes,
             "message": "Save these backup codes! They won't be shown again.",
         }
@@ -13,8 +13,13 @@ from ...infrastructure.repositories.sqlite_interaction_repo import (
 )
 from ...infrastructure.repositories.sqlite_user_repo import SQLiteUserRepository
 from ...application.use_cases.get_personalized_feed import GetPersonalizedFeedUseCase
-from ...application.dtos.video_dto import VideoResponseDTO, PaginatedVideoResponseDTO
+from ...application.dtos.video_dto import (
+    VideoResponseDTO,
+    PaginatedVideoResponseDTO,
+    PageVideoResponseDTO,
+)
 from ...infrastructure.security.jwt_adapter import JWTAdapter
+from .responses import struct_response
 
 router = APIRouter(prefix="/feed", tags=["feed"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -58,7 +63,7 @@ def get_current_user(
     return user
 
 
-@router.get("/", response_model=PaginatedVideoResponseDTO)
+@router.get("/")
 def get_feed(
     feed_type: Annotated[
         str, Query(description="Feed type: foryou, following, trending")
@@ -93,14 +98,20 @@ def get_feed(
     # Get personalized feed
     feed_use_case = GetPersonalizedFeedUseCase(video_repo, interaction_repo, user_repo)
 
+    # Fetch one extra video to know whether a next page exists without
+    # counting the whole feed
     if current_user:
-        user_id = current_user.id
-        videos = feed_use_case.execute(user_id, feed_type, page, page_size)
-        total_count = feed_use_case.get_feed_count(user_id, feed_type)
+        videos = feed_use_case.execute(
+            current_user.id, feed_type, page, page_size, lookahead=True
+        )
     else:
         # For anonymous users, just return recent videos
-        videos = video_repo.find_all(offset=(page - 1) * page_size, limit=page_size)
-        total_count = video_repo.count_all()
+        videos = video_repo.find_all(
+            offset=(page - 1) * page_size, limit=page_size + 1
+        )
+
+    has_more = len(videos) > page_size
+    videos = videos[:page_size]
 
     # Convert to response DTOs
     video_responses = [
@@ -120,19 +131,17 @@ def get_feed(
         for v in videos
     ]
 
-    # Calculate pagination
-    total_pages = (total_count + page_size - 1) // page_size
-
-    return PaginatedVideoResponseDTO(
-        items=video_responses,
-        total=total_count,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
+    return struct_response(
+        PageVideoResponseDTO(
+            items=video_responses,
+            page=page,
+            page_size=page_size,
+            has_more=has_more,
+        )
     )
 
 
-@router.get("/trending", response_model=PaginatedVideoResponseDTO)
+@router.get("/trending")
 def get_trending_feed(
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=100, description="Videos per page")] = 20,
@@ -177,12 +186,14 @@ def get_trending_feed(
     total_count = len(trending_videos)
     total_pages = (total_count + page_size - 1) // page_size
 
-    return PaginatedVideoResponseDTO(
-        items=video_responses,
-        total=total_count,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
+    return struct_response(
+        PaginatedVideoResponseDTO(
+            items=video_responses,
+            total=total_count,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+        )
     )
 
 
@@ -208,7 +219,7 @@ def get_categories(
     return {"categories": categories}
 
 
-@router.get("/recommended", response_model=PaginatedVideoResponseDTO)
+@router.get("/recommended")
 def get_recommended_for_you(
     page: int = 1,
     page_size: int = 20,
@@ -240,12 +251,14 @@ def get_recommended_for_you(
         for v in recommended
     ]
 
-    return PaginatedVideoResponseDTO(
-        items=video_responses,
-        total=total_count,
-        page=page,
-        page_size=page_size,
-        total_pages=(total_count + page_size - 1) // page_size,
+    return struct_response(
+        PaginatedVideoResponseDTO(
+            items=video_responses,
+            total=total_count,
+            page=page,
+            page_size=page_size,
+            total_pages=(total_count + page_size - 1) // page_size,
+        )
     )
 
 
@@ -311,10 +324,12 @@ def get_category_feed(
         for v in paginated
     ]
 
-    return PaginatedVideoResponseDTO(
-        items=video_responses,
-        total=len(filtered),
-        page=page,
-        page_size=page_size,
-        total_pages=(len(filtered) + page_size - 1) // page_size,
+    return struct_response(
+        PaginatedVideoResponseDTO(
+            items=video_responses,
+            total=len(filtered),
+            page=page,
+            page_size=page_size,
+            total_pages=(len(filtered) + page_size - 1) // page_size,
+        )
     )
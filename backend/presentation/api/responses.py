@@ -0,0 +1,43 @@
+from decimal import Decimal
+from typing import Any
+
+import msgspec
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+_json_encoder = msgspec.json.Encoder()
+
+
+def struct_response(content: Any, status_code: int = 200) -> Response:
+    """Encode a ResponseStruct (or a list of them) into a JSON response."""
+    return Response(
+        content=_json_encoder.encode(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _orjson_default(obj: Any) -> Any:
+    # orjson handles dataclasses, enums and datetimes natively; this only
+    # covers the remaining types that show up in service payloads.
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def orjson_response(content: Any, status_code: int = 200) -> Response:
+    """Serialize a service payload with orjson, bypassing jsonable_encoder."""
+    return Response(
+        content=orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -38,7 +38,7 @@ def setup_2fa(
         )
 
     try:
-        secret, qr_code, backup_codes = two_factor_service.setup_2fa(
+        secret, qr_code, backup_codes = two_factor_service.begin_setup_2fa(
             user_id=current_user.id,
             method="totp",
             email=current_user.email,
@@ -58,7 +58,7 @@ def setup_2fa(
         return {
             "success": True,
             "secret": secret,
-            "qr_code": f"data:image/png;base64,{qr_code}",
+            "qr_code": f"data:image/png;base64,{qr_code.result()}",
             "backup_codes": backup_codes,
             "message": "Save these backup codes! They won't be shown again.",
         }
@@ -11,6 +11,7 @@ from ...application.use_cases.manage_follows import ManageFollowsUseCase
 from ...application.dtos.profile_dto import ProfileResponseDTO
 from ...application.dtos.follow_dto import FollowResponseDTO, FollowStatusDTO
 from ...infrastructure.security.jwt_adapter import JWTAdapter # For get_current_user
+from .responses import struct_response
 
 router = APIRouter(prefix="/users", tags=["users"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -49,7 +50,7 @@ def get_current_user(
 
     return {"user_id": user.id, "username": user.username} # Return dict for consistency with video_router
 
-@router.get("/{username}", response_model=ProfileResponseDTO)
+@router.get("/{username}")
 def get_user_profile(
     username: str,
     user_repo: UserRepositoryPort = Depends(get_user_repo),
@@ -57,11 +58,11 @@ def get_user_profile(
 ):
     try:
         use_case = GetUserProfileUseCase(user_repo, video_repo)
-        return use_case.execute(username)
+        return struct_response(use_case.execute(username))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
-@router.post("/{user_id}/follow", response_model=FollowResponseDTO, status_code=status.HTTP_201_CREATED)
+@router.post("/{user_id}/follow", status_code=status.HTTP_201_CREATED)
 def follow_user(
     user_id: str,
     current_user: Annotated[dict, Depends(get_current_user)],
@@ -70,7 +71,10 @@ def follow_user(
 ):
     use_case = ManageFollowsUseCase(user_repo, follow_repo)
     try:
-        return use_case.follow(current_user["user_id"], user_id)
+        return struct_response(
+            use_case.follow(current_user["user_id"], user_id),
+            status_code=status.HTTP_201_CREATED,
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -89,7 +93,7 @@ def unfollow_user(
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-@router.get("/{user_id}/follow_status", response_model=FollowStatusDTO)
+@router.get("/{user_id}/follow_status")
 def get_user_follow_status(
     user_id: str,
     current_user: Annotated[dict, Depends(get_current_user)],
@@ -97,4 +101,4 @@ def get_user_follow_status(
     follow_repo: FollowRepositoryPort = Depends(get_follow_repo)
 ):
     use_case = ManageFollowsUseCase(user_repo, follow_repo)
-    return use_case.get_follow_status(current_user["user_id"], user_id)
+    return struct_response(use_case.get_follow_status(current_user["user_id"], user_id))
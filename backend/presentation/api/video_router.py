@@ -39,6 +39,7 @@ from ...application.dtos.video_dto import (
 from ...application.dtos.tip_dto import TipCreateDTO, TipResponseDTO
 from ...application.dtos.caption_dto import CaptionResponseDTO
 from ...infrastructure.security.jwt_adapter import JWTAdapter
+from .responses import struct_response
 
 router = APIRouter(prefix="/videos", tags=["videos"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -116,17 +117,17 @@ def get_current_user(
     return {"user_id": user.id, "username": user.username}
 
 
-@router.get("/", response_model=PaginatedVideoResponseDTO)
+@router.get("/")
 def list_videos(
     page: int = 1,
     page_size: int = 20,
     repo: VideoRepositoryPort = Depends(get_video_repo),
 ):
     use_case = ListVideosUseCase(repo)
-    return use_case.execute(page=page, page_size=page_size)
+    return struct_response(use_case.execute(page=page, page_size=page_size))
 
 
-@router.get("/search", response_model=PaginatedVideoResponseDTO)
+@router.get("/search")
 def search_videos(
     q: str,
     page: int = 1,
@@ -156,15 +157,34 @@ def search_videos(
 
     total_pages = math.ceil(total / page_size) if total > 0 else 1
 
-    return PaginatedVideoResponseDTO(
-        items=video_responses,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
+    return struct_response(
+        PaginatedVideoResponseDTO(
+            items=video_responses,
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+        )
     )
 
 
+@router.get("/latest")
+def list_latest_videos(
+    cursor: str | None = None,
+    limit: int = 20,
+    repo: VideoRepositoryPort = Depends(get_video_repo),
+):
+    """Newest-first feed using keyset (cursor) pagination.
+
+    Pass the previous response's ``next_cursor`` back to fetch the next page.
+    """
+    use_case = ListVideosUseCase(repo)
+    try:
+        return struct_response(use_case.execute_cursor(cursor=cursor, limit=limit))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 # File validation constants
 ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v"}
 ALLOWED_CONTENT_TYPES = {
@@ -215,7 +235,7 @@ def validate_video_file(file: UploadFile) -> None:
         )
 
 
-@router.post("/", response_model=VideoResponseDTO)
+@router.post("/")
 def upload_video(
     title: Annotated[str, Form()],
     description: Annotated[str, Form()],
@@ -233,10 +253,10 @@ def upload_video(
     )
 
     use_case = UploadVideoUseCase(repo, storage)
-    return use_case.execute(dto, file.file, file.filename)
+    return struct_response(use_case.execute(dto, file.file, file.filename))
 
 
-@router.get("/{video_id}", response_model=VideoResponseDTO)
+@router.get("/{video_id}")
 def get_video_by_id(video_id: str, repo: VideoRepositoryPort = Depends(get_video_repo)):
     use_case = GetVideoByIdUseCase(repo)
     video = use_case.execute(video_id)
@@ -244,7 +264,7 @@ def get_video_by_id(video_id: str, repo: VideoRepositoryPort = Depends(get_video
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Video not found"
         )
-    return video
+    return struct_response(video)
 
 
 @router.post("/{video_id}/view")
@@ -349,7 +369,7 @@ def get_like_status(
     return {"has_liked": has_liked}
 
 
-@router.post("/{video_id}/comments", response_model=CommentResponseDTO)
+@router.post("/{video_id}/comments")
 def add_comment(
     video_id: str,
     comment_data: CommentRequestDTO,
@@ -386,30 +406,34 @@ def add_comment(
             "Failed to send comment notification: %s", e
         )
 
-    return CommentResponseDTO(
-        id=comment.id,
-        video_id=comment.video_id,
-        username=comment.username,
-        content=comment.content,
-        created_at=comment.created_at,
+    return struct_response(
+        CommentResponseDTO(
+            id=comment.id,
+            video_id=comment.video_id,
+            username=comment.username,
+            content=comment.content,
+            created_at=comment.created_at,
+        )
     )
 
 
-@router.get("/{video_id}/comments", response_model=List[CommentResponseDTO])
+@router.get("/{video_id}/comments")
 def list_comments(
     video_id: str, repo: SQLiteInteractionRepository = Depends(get_interaction_repo)
 ):
     comments = repo.list_comments(video_id)
-    return [
-        CommentResponseDTO(
-            id=c.id,
-            video_id=c.video_id,
-            username=c.username,
-            content=c.content,
-            created_at=c.created_at,
-        )
-        for c in comments
-    ]
+    return struct_response(
+        [
+            CommentResponseDTO(
+                id=c.id,
+                video_id=c.video_id,
+                username=c.username,
+                content=c.content,
+                created_at=c.created_at,
+            )
+            for c in comments
+        ]
+    )
 
 
 @router.post("/{video_id}/captions/generate", status_code=status.HTTP_202_ACCEPTED)
@@ -446,7 +470,7 @@ def trigger_caption_generation(
     return {"message": "Caption generation started", "video_id": video_id}
 
 
-@router.get("/{video_id}/captions", response_model=List[CaptionResponseDTO])
+@router.get("/{video_id}/captions")
 def get_video_captions(
     video_id: str,
     video_repo: VideoRepositoryPort = Depends(get_video_repo),
@@ -459,22 +483,23 @@ def get_video_captions(
         )
 
     captions = caption_repo.get_by_video_id(video_id)
-    return [
-        CaptionResponseDTO(
-            id=c.id,
-            video_id=c.video_id,
-            text=c.text,
-            start_time=c.start_time,
-            end_time=c.end_time,
-            language=c.language,
-        )
-        for c in captions
-    ]
+    return struct_response(
+        [
+            CaptionResponseDTO(
+                id=c.id,
+                video_id=c.video_id,
+                text=c.text,
+                start_time=c.start_time,
+                end_time=c.end_time,
+                language=c.language,
+            )
+            for c in captions
+        ]
+    )
 
 
 @router.post(
     "/{video_id}/tip",
-    response_model=TipResponseDTO,
     status_code=status.HTTP_201_CREATED,
 )
 def send_tip_to_video_creator(
@@ -505,7 +530,11 @@ def send_tip_to_video_creator(
 
     use_case = SendTipUseCase(user_repo, tip_repo, video_repo)
     try:
-        tip_data.video_id = video_id  # Ensure video_id is set in DTO
-        return use_case.execute(tip_data, current_user["user_id"])
+        # Request DTOs are frozen; copy with the path's video_id filled in
+        tip_data = tip_data.model_copy(update={"video_id": video_id})
+        return struct_response(
+            use_case.execute(tip_data, current_user["user_id"]),
+            status_code=status.HTTP_201_CREATED,
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
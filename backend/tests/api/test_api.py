@@ -1,4 +1,6 @@
 import pytest
+from sqlmodel import Session
+from backend.infrastructure.repositories.models import VideoDB
 
 
 class TestHealthEndpoints:
@@ -252,3 +254,52 @@ class TestUserAPI:
         )
         assert response.status_code == 200
         assert response.json()["is_following"] is False
+
+
+class TestTipAPI:
+    def _register_and_login(self, client, username, email):
+        client.post(
+            "/auth/register",
+            json={
+                "username": username,
+                "email": email,
+                "password": "password123"
+            }
+        )
+        login_response = client.post(
+            "/auth/login",
+            json={
+                "email": email,
+                "password": "password123"
+            }
+        )
+        assert login_response.status_code == 200
+        return login_response.json()["access_token"]
+
+    def test_send_tip_to_video_creator(self, client, engine):
+        token = self._register_and_login(client, "tipper", "tipper@example.com")
+        self._register_and_login(client, "creator", "creator@example.com")
+        creator_id = client.get("/users/creator").json()["user"]["id"]
+
+        with Session(engine) as session:
+            session.add(
+                VideoDB(
+                    id="video-1",
+                    title="Tip me",
+                    description="",
+                    creator_id=creator_id,
+                    status="READY",
+                )
+            )
+            session.commit()
+
+        response = client.post(
+            "/videos/video-1/tip",
+            json={"receiver_id": creator_id, "amount": 5.0},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["video_id"] == "video-1"
+        assert data["receiver_id"] == creator_id
+        assert data["amount"] == 5.0
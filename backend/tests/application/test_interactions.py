@@ -99,3 +99,26 @@ class TestInteractionRepository:
         comments = interaction_repo.list_comments(video.id)
         # Should be ordered by created_at desc (newest first)
         assert len(comments) == 3
+
+    def test_get_recent_interactions(self, session, interaction_repo):
+        from datetime import datetime, timedelta
+        from backend.infrastructure.repositories.models import LikeDB
+
+        user = self._create_user(session)
+        old_video = self._create_video(session, user.id, title="Old")
+        new_video = self._create_video(session, user.id, title="New")
+        now = datetime.now()
+        session.add(
+            LikeDB(user_id=user.id, video_id=old_video.id, created_at=now - timedelta(days=2))
+        )
+        session.commit()
+        interaction_repo.toggle_like(user.id, new_video.id)
+        interaction_repo.add_comment(user.id, user.username, new_video.id, "Nice")
+
+        recent = interaction_repo.get_recent_interactions(since=now - timedelta(hours=24))
+
+        assert {i["interaction_type"] for i in recent} == {"like", "comment"}
+        assert all(i["video_id"] == new_video.id for i in recent)
+        assert recent[0]["created_at"] >= recent[1]["created_at"]
+        assert len(interaction_repo.get_recent_interactions(since=now - timedelta(hours=24), limit=1)) == 1
+
@@ -222,3 +222,32 @@ class TestCaptionRepository:
 
         captions = caption_repo.get_by_video_id(video_id)
         assert len(captions) == 0
+
+
+class TestCursorPagination:
+    def test_cursor_pages_cover_all_videos_once(self, video_repo):
+        from backend.application.use_cases.list_videos import ListVideosUseCase
+
+        for i in range(5):
+            video_repo.save(Video(title=f"Video {i}", creator_id="user123"))
+
+        use_case = ListVideosUseCase(video_repo)
+        first = use_case.execute_cursor(limit=2)
+        assert len(first.items) == 2
+        assert first.has_more is True
+
+        seen = [v.id for v in first.items]
+        cursor = first.next_cursor
+        while cursor:
+            page = use_case.execute_cursor(cursor=cursor, limit=2)
+            seen.extend(v.id for v in page.items)
+            cursor = page.next_cursor
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    def test_invalid_cursor_rejected(self, video_repo):
+        from backend.application.use_cases.list_videos import ListVideosUseCase
+
+        with pytest.raises(ValueError):
+            ListVideosUseCase(video_repo).execute_cursor(cursor="not-a-cursor")
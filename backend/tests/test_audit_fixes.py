@@ -143,6 +143,19 @@ class TestRecommendationEngineFix:
         # Empty dicts
         assert engine._cosine_similarity({}, {}) == 0.0
 
+    def test_interest_cache_keeps_sources_apart(self):
+        """History and sampled rows with the same watermark are cached apart."""
+        from datetime import datetime
+        from backend.application.services.recommendation_engine import RecommendationEngine
+        engine = RecommendationEngine()
+        engine.calculate_user_interests = lambda rows: {r['video_id']: 1.0 for r in rows}
+        created_at = datetime(2026, 1, 1)
+        history = [{'video_id': 'history-video', 'created_at': created_at}]
+        sampled = [{'video_id': 'sampled-video', 'created_at': created_at}]
+
+        assert engine._cached_user_interests("history", "cache-user", history) == {'history-video': 1.0}
+        assert engine._cached_user_interests("sampled", "cache-user", sampled) == {'sampled-video': 1.0}
+
 
 class TestUploadVideoFix:
     """Tests for Finding #5: Duplicate video save removed."""
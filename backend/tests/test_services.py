@@ -2,6 +2,9 @@ import pytest
 import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import StaticPool
 from sqlmodel import create_engine, Session
 from backend.domain.entities.user import User
 from backend.domain.entities.video import Video, VideoStatus
@@ -14,18 +17,47 @@ from backend.domain.entities.analytics import VideoAnalytics, MetricType, TimePe
 from backend.infrastructure.repositories.database import get_session
 from backend.application.services.payment_service import PaymentService
 from backend.application.services.analytics_service import AnalyticsService
+from backend.application.services.content_moderation_service import (
+    AIModerationService,
+)
+from backend.domain.entities.content_moderation import (
+    ModerationReason,
+    ModerationSeverity,
+    ModerationStatus,
+)
+from backend.infrastructure.repositories.models import PayoutDB, VideoProjectDB
 from backend.infrastructure.repositories.sqlite_payment_repo import (
     SQLitePaymentRepository,
 )
 from backend.infrastructure.repositories.sqlite_analytics_repo import (
     SQLiteAnalyticsRepository,
 )
+from backend.domain.entities.notification import (
+    Notification,
+    NotificationStatus,
+    NotificationType,
+)
+from backend.infrastructure.repositories.sqlite_notification_repo import (
+    SQLiteNotificationRepository,
+)
+from backend.infrastructure.repositories.sqlite_hashtag_repo import (
+    SQLiteHashtagRepository,
+)
+from backend.infrastructure.repositories.sqlite_video_editor_repo import (
+    SQLiteVideoEditorRepository,
+)
+from backend.application.services.video_editor_service import VideoEditorService
 
 
 @pytest.fixture
 def db_session():
     """Create a test database session."""
-    engine = create_engine("sqlite:///:memory:")
+    # One shared connection so worker threads see the same in-memory database
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
     from backend.infrastructure.repositories.models import SQLModel
 
     SQLModel.metadata.create_all(engine)
@@ -113,6 +145,50 @@ class TestPaymentService:
         # Service processes the request (amount validation is at the API layer)
         assert "transaction_id" in result or "success" in result
 
+    def test_complete_tip_credits_receiver_wallet(
+        self, db_session, sample_user, mock_stripe_service
+    ):
+        """Test completing a tip credits the receiver in one unit of work."""
+        repository = SQLitePaymentRepository(db_session)
+        service = PaymentService(repository, mock_stripe_service)
+
+        created = asyncio.run(
+            service.create_tip_transaction(
+                sender_id=sample_user.id, receiver_id="creator_123", amount=5.0
+            )
+        )
+        result = asyncio.run(
+            service.complete_tip_transaction(created["payment_intent_id"], "ch_123")
+        )
+
+        assert result["success"] == True
+        wallet = SQLitePaymentRepository(db_session).get_wallet_by_user_id(
+            "creator_123"
+        )
+        assert wallet.pending_balance == 5.0
+
+    def test_creator_analytics_counts(self, db_session, sample_user):
+        """Test creator analytics counts subscribers and payouts in SQL."""
+        repository = SQLitePaymentRepository(db_session)
+        service = PaymentService(repository, None)
+        wallet = asyncio.run(service.create_wallet(sample_user.id))
+        db_session.add(
+            PayoutDB(
+                wallet_id=wallet.id,
+                user_id=sample_user.id,
+                amount=20.0,
+                net_amount=14.0,
+                fee_amount=6.0,
+            )
+        )
+        db_session.commit()
+
+        analytics = asyncio.run(service.get_creator_analytics(sample_user.id))
+
+        assert analytics["active_subscribers"] == 0
+        assert analytics["recent_payouts"] == 1
+        assert analytics["subscriber_growth"] == 0.0
+
 
 class TestAnalyticsService:
     """Test suite for Analytics Service."""
@@ -128,10 +204,29 @@ class TestAnalyticsService:
             )
         )
 
-        assert result["success"] == True
-        assert result["analytics"].video_id == sample_video.id
-        assert result["analytics"].views == 1
-        assert result["analytics"].watch_time == 30.0
+        assert result.success == True
+        assert result.analytics.video_id == sample_video.id
+        assert result.analytics.views == 1
+        assert result.analytics.watch_time == 30.0
+
+    def test_repeated_views_update_content_performance(
+        self, db_session, sample_video, sample_user
+    ):
+        """Later views update the existing content performance record."""
+        repository = SQLiteAnalyticsRepository(db_session)
+        service = AnalyticsService(repository)
+
+        for _ in range(2):
+            result = asyncio.run(
+                service.track_video_view(
+                    video_id=sample_video.id, user_id=sample_user.id, watch_time=10.0
+                )
+            )
+            assert result.success == True
+
+        performance = repository.get_content_performance(sample_video.id)
+        assert performance.views == 2
+        assert result.analytics.watch_time == 20.0
 
     def test_track_video_engagement(self, db_session, sample_video, sample_user):
         """Test video engagement tracking."""
@@ -145,8 +240,8 @@ class TestAnalyticsService:
             )
         )
 
-        assert result["success"] == True
-        assert result["analytics"].likes == 1
+        assert result.success == True
+        assert result.analytics.likes == 1
 
         # Test comment tracking
         result = asyncio.run(
@@ -157,8 +252,8 @@ class TestAnalyticsService:
             )
         )
 
-        assert result["success"] == True
-        assert result["analytics"].comments == 1
+        assert result.success == True
+        assert result.analytics.comments == 1
 
     def test_generate_creator_analytics(self, db_session, sample_user):
         """Test creator analytics generation."""
@@ -195,6 +290,101 @@ class TestAnalyticsService:
         assert "data_points" in result
         assert len(result["data_points"]) == 7  # 7 days in a week
 
+    def test_time_series_buckets_tracked_views(self, db_session, sample_video, sample_user):
+        """Tracked views land in today's bucket of the weekly series."""
+        repository = SQLiteAnalyticsRepository(db_session)
+        service = AnalyticsService(repository)
+
+        asyncio.run(
+            service.track_video_view(
+                video_id=sample_video.id, user_id=sample_user.id, watch_time=5.0
+            )
+        )
+        result = asyncio.run(
+            service.generate_time_series_data(
+                user_id=sample_user.id,
+                metric_type=MetricType.VIEWS,
+                time_period=TimePeriod.WEEK,
+            )
+        )
+
+        today = datetime.utcnow().date().isoformat()
+        values = {p["timestamp"][:10]: p["value"] for p in result["data_points"]}
+        assert values[today] == 1
+        assert sum(values.values()) == 1
+
+    def test_buffered_views_are_flushed_in_bulk(self, db_session, sample_video, sample_user):
+        """Buffered views are coalesced per video/day and written on flush."""
+        from contextlib import contextmanager
+        from backend.application.services.analytics_service import (
+            VideoViewAggregator,
+        )
+
+        repository = SQLiteAnalyticsRepository(db_session)
+
+        @contextmanager
+        def scope():
+            with Session(db_session.get_bind()) as session:
+                yield SQLiteAnalyticsRepository(session)
+
+        aggregator = VideoViewAggregator(scope, flush_interval=60)
+        service = AnalyticsService(repository, view_aggregator=aggregator)
+
+        async def run():
+            for _ in range(3):
+                result = await service.track_video_view(
+                    video_id=sample_video.id, user_id=sample_user.id, watch_time=10.0
+                )
+                assert result.queued is True
+            assert repository.get_video_analytics(sample_video.id) is None
+            await aggregator.close()
+
+        asyncio.run(run())
+
+        analytics = repository.get_video_analytics(sample_video.id)
+        assert analytics.views == 3
+        assert analytics.watch_time == 30.0
+        assert analytics.average_watch_time == 10.0
+        assert repository.get_content_performance(sample_video.id).views == 3
+
+    def test_failed_view_flush_keeps_buffered_views(
+        self, db_session, sample_video, sample_user
+    ):
+        """A failing bulk write neither fails the view nor loses buffered views."""
+        from contextlib import contextmanager
+        from backend.application.services.analytics_service import (
+            VideoViewAggregator,
+        )
+
+        repository = SQLiteAnalyticsRepository(db_session)
+        failures = [RuntimeError("database is locked")]
+
+        @contextmanager
+        def scope():
+            if failures:
+                raise failures.pop()
+            with Session(db_session.get_bind()) as session:
+                yield SQLiteAnalyticsRepository(session)
+
+        aggregator = VideoViewAggregator(scope, flush_interval=60, max_pending=2)
+        service = AnalyticsService(repository, view_aggregator=aggregator)
+
+        async def run():
+            for _ in range(2):
+                await service.track_video_view(
+                    video_id=sample_video.id, user_id=sample_user.id, watch_time=5.0
+                )
+            # Let the max_pending background flush run and fail
+            await asyncio.gather(*aggregator._background_flushes)
+            assert repository.get_video_analytics(sample_video.id) is None
+            await aggregator.close()
+
+        asyncio.run(run())
+
+        analytics = repository.get_video_analytics(sample_video.id)
+        assert analytics.views == 2
+        assert analytics.watch_time == 10.0
+
 
 class TestPaymentRepository:
     """Test suite for Payment Repository."""
@@ -330,6 +520,302 @@ class TestAnalyticsRepository:
         assert daily_data["active_videos"] == 3
 
 
+class TestHashtagRepository:
+    """Test suite for Hashtag Repository."""
+
+    def test_update_hashtag_usage_batch_upserts(self, db_session):
+        """Test batch usage updates create new and increment existing hashtags."""
+        repository = SQLiteHashtagRepository(db_session)
+
+        repository.update_hashtag_usage_batch(["#video", "#fun"])
+        repository.update_hashtag_usage_batch(["#video", "#new"])
+
+        counts = {h.name: h.count for h in repository.get_popular_hashtags()}
+        assert counts == {"#video": 2, "#fun": 1, "#new": 1}
+
+    @pytest.mark.parametrize("dialect_module", [sqlite, postgresql])
+    def test_usage_upsert_compiles_for_each_dialect(self, db_session, dialect_module):
+        """Test the usage upsert builds for both SQLite and PostgreSQL."""
+        repository = SQLiteHashtagRepository(db_session)
+        dialect = dialect_module.dialect()
+
+        statement = repository._usage_upsert(["#video", "#fun"], dialect.name)
+        sql = str(statement.compile(dialect=dialect))
+
+        assert "ON CONFLICT (name) DO UPDATE" in sql
+
+
+class TestNotificationRepository:
+    """Test suite for Notification Repository."""
+
+    def test_mark_as_read_batch_only_touches_own_notifications(self, db_session):
+        """Test batch mark-as-read ignores ids owned by another user."""
+        repository = SQLiteNotificationRepository(db_session)
+        own, other = (
+            repository.save(
+                Notification(
+                    user_id=user_id,
+                    type=NotificationType.LIKE,
+                    title="New like",
+                    message="Someone liked your video",
+                )
+            )
+            for user_id in ("user-1", "user-2")
+        )
+
+        updated = repository.mark_as_read_batch("user-1", [own.id, other.id])
+
+        assert updated == 1
+        assert repository.get_by_id(own.id).status == NotificationStatus.READ
+        assert repository.get_by_id(other.id).status == NotificationStatus.UNREAD
+
+
+    def test_save_many_rolls_back_failed_commit(self, db_session):
+        """Test a failed bulk insert leaves the session usable."""
+        repository = SQLiteNotificationRepository(db_session)
+        existing = repository.save(
+            Notification(
+                user_id="user-1",
+                type=NotificationType.LIKE,
+                title="New like",
+                message="Someone liked your video",
+            )
+        )
+
+        with pytest.raises(IntegrityError):
+            repository.save_many([existing])
+
+        assert repository.get_unread_count("user-1") == 1
+
+
+class TestVideoEditorRepository:
+    """Test suite for Video Editor Repository."""
+
+    def test_patch_project_updates_fields_in_place(self, db_session, sample_user):
+        """Test patching a project updates only the given fields."""
+        repository = SQLiteVideoEditorRepository(db_session)
+        project_db = VideoProjectDB(
+            user_id=sample_user.id, title="Draft", description="Original"
+        )
+        db_session.add(project_db)
+        db_session.commit()
+
+        patched = repository.patch_project(project_db.id, {"title": "Final Cut"})
+
+        assert patched.title == "Final Cut"
+        assert patched.description == "Original"
+        assert repository.get_project_by_id(project_db.id).title == "Final Cut"
+        assert repository.patch_project("missing", {"title": "x"}) is None
+
+
+class TestVideoEditorService:
+    """Test suite for Video Editor Service batch operations."""
+
+    def test_add_transitions_saves_batch(self, db_session):
+        """Test several transitions are saved in one call and read back."""
+        service = VideoEditorService(SQLiteVideoEditorRepository(db_session))
+
+        saved = service.add_transitions(
+            "project-1",
+            [
+                {
+                    "transition_type": "cut",
+                    "start_time": 4.0,
+                    "end_time": 5.0,
+                    "duration": 1.0,
+                    "parameters": {"direction": "left"},
+                },
+                {
+                    "transition_type": "filter",
+                    "start_time": 1.0,
+                    "end_time": 1.5,
+                    "duration": 0.5,
+                },
+            ],
+        )
+
+        assert len(saved) == 2
+        transitions = service.get_project_transitions("project-1")
+        assert [t.start_time for t in transitions] == [1.0, 4.0]
+        assert transitions[1].parameters == {"direction": "left"}
+        assert transitions[0].parameters is None
+
+    def test_add_tracks_saves_batch(self, db_session):
+        """Test several tracks are saved in one call and read back."""
+        service = VideoEditorService(SQLiteVideoEditorRepository(db_session))
+
+        service.add_tracks(
+            "project-1",
+            [
+                {
+                    "asset_id": "asset-1",
+                    "track_type": "video",
+                    "start_time": 0.0,
+                    "end_time": 10.0,
+                },
+                {
+                    "asset_id": "asset-2",
+                    "track_type": "audio",
+                    "start_time": 2.0,
+                    "end_time": 8.0,
+                },
+            ],
+        )
+
+        tracks = service.get_project_tracks("project-1")
+        assert [(t.asset_id, t.type) for t in tracks] == [
+            ("asset-1", "video"),
+            ("asset-2", "audio"),
+        ]
+
+    def test_add_captions_saves_batch(self, db_session):
+        """Test several captions are saved in one call and read back."""
+        service = VideoEditorService(SQLiteVideoEditorRepository(db_session))
+
+        service.add_captions(
+            "project-1",
+            [
+                {
+                    "video_asset_id": "asset-1",
+                    "text": "Second",
+                    "start_time": 3.0,
+                    "end_time": 4.0,
+                },
+                {
+                    "video_asset_id": "asset-1",
+                    "text": "First",
+                    "start_time": 0.0,
+                    "end_time": 2.0,
+                },
+            ],
+        )
+
+        captions = service.get_project_captions("project-1", "asset-1")
+        assert [c.text for c in captions] == ["First", "Second"]
+        assert service.get_project_captions("project-1", "asset-2") == []
+
+
+class TestTwoFactorService:
+    """Test suite for Two Factor Service."""
+
+    def test_disable_2fa_evicts_only_that_users_totp(self):
+        """Test disabling 2FA drops one cached secret and keeps the others."""
+        from backend.application.services import two_factor_service
+
+        two_factor_repo = MagicMock()
+        service = two_factor_service.TwoFactorService(
+            user_repo=None, two_factor_repo=two_factor_repo
+        )
+        kept, disabled = service.generate_totp_secret(), service.generate_totp_secret()
+        kept_totp = two_factor_service._totp_for(kept)
+        two_factor_service._totp_for(disabled)
+        two_factor_repo.get_active_secret.return_value = MagicMock(secret=disabled)
+
+        service.disable_2fa("user-1")
+
+        assert disabled not in two_factor_service._totp_cache
+        assert two_factor_service._totp_for(kept) is kept_totp
+        two_factor_repo.deactivate_2fa.assert_called_once_with("user-1")
+
+
+class TestAIModerationService:
+    """Test suite for AI Moderation Service."""
+
+    @pytest.fixture
+    def service(self):
+        return AIModerationService(MagicMock())
+
+    def test_analyze_video_rejects_category_hit(self, service):
+        """Test a hate-speech word rejects the video with that reason."""
+        moderation = service.analyze_video("video-1", "Nazi rally", "")
+
+        assert moderation.status == ModerationStatus.REJECTED
+        assert moderation.reason == ModerationReason.HATE_SPEECH
+        assert moderation.severity == ModerationSeverity.CRITICAL
+        assert moderation.ai_labels["violations"] == ("hate_speech",)
+
+    def test_analyze_video_spam_needs_two_phrases(self, service):
+        """Test one spam phrase is clean and two are flagged as spam."""
+        single = service.analyze_video("video-1", "All about bitcoin", "")
+        double = service.analyze_video("video-2", "Click here", "buy now")
+
+        assert single.ai_labels["clean"] is True
+        assert double.reason == ModerationReason.SPAM
+        assert double.ai_labels["violations"] == ("spam",)
+
+    def test_analyze_video_caps_check_runs_on_lowercased_text(self, service):
+        """Test the excessive-caps label is computed on the lowercased text."""
+        moderation = service.analyze_video("video-1", "NAZI RALLY", "")
+
+        assert moderation.reason == ModerationReason.HATE_SPEECH
+        assert moderation.ai_labels["has_excessive_caps"] is False
+
+    def test_analyze_video_empty_text_is_clean(self, service):
+        """Test empty title and description pass as clean."""
+        moderation = service.analyze_video("video-1", "", "")
+
+        assert moderation.status == ModerationStatus.APPROVED
+        assert moderation.ai_labels == {
+            "clean": True,
+            "text_analysis": "passed_all_checks",
+        }
+
+    def test_analyze_comment_scores_toxic_words(self, service):
+        """Test toxic_score is matched toxic words per word."""
+        moderation = service.analyze_comment("comment-1", "you are an idiot", "user-1")
+
+        assert moderation.status == ModerationStatus.REJECTED
+        assert moderation.reason == ModerationReason.HARASSMENT
+        assert moderation.ai_labels["toxic_score"] == 0.25
+
+    def test_analyze_comment_caps_ratio_runs_on_lowercased_text(self, service):
+        """Test short all-capitals comments are not treated as aggressive."""
+        for content in ("LOL", "GG", "STOP THIS NOW"):
+            moderation = service.analyze_comment("comment-1", content, "user-1")
+
+            assert moderation.status == ModerationStatus.FLAGGED
+            assert moderation.confidence_score == 0.9
+            assert moderation.ai_labels["clean"] is True
+
+    def test_analyze_comment_punctuation_only_is_flagged(self, service):
+        """Test aggressive punctuation without a policy reason goes to review."""
+        moderation = service.analyze_comment("comment-1", "great video!!!!", "user-1")
+
+        assert moderation.status == ModerationStatus.FLAGGED
+        assert moderation.reason is None
+        assert moderation.confidence_score == 0.8
+        assert moderation.ai_labels["exclamation_count"] == 4
+
+    def test_analyze_comment_empty_text(self, service):
+        """Test an empty comment is clean and never divides by zero."""
+        moderation = service.analyze_comment("comment-1", "", "user-1")
+
+        assert moderation.ai_labels == {
+            "clean": True,
+            "comment_analysis": "passed_all_checks",
+        }
+        assert moderation.status == ModerationStatus.FLAGGED
+
+    def test_analyze_user_profile_flags_username_and_bio(self, service):
+        """Test suspicious usernames and bio words are both detected."""
+        moderation = service.analyze_user_profile(
+            "user-1", {"username": "Official_Support", "bio": "Not a scam account"}
+        )
+
+        assert moderation.status == ModerationStatus.REJECTED
+        assert moderation.reason == ModerationReason.TERMS_OF_SERVICE_VIOLATION
+        assert moderation.ai_labels["username_suspicious"] is True
+        assert moderation.ai_labels["bio_suspicious"] is True
+        assert moderation.ai_labels["profile_length"] == len("Not a scam account")
+
+    def test_analyze_user_profile_empty_is_clean(self, service):
+        """Test an empty profile passes as clean."""
+        moderation = service.analyze_user_profile("user-1", {})
+
+        assert moderation.status == ModerationStatus.APPROVED
+        assert moderation.ai_labels["clean"] is True
+
+
 class TestIntegration:
     """Integration tests for the complete system."""
 
@@ -6,7 +6,7 @@ import { apiClient } from '@/lib/api/client';
 import { motion } from 'framer-motion';
 import { Loader2 } from 'lucide-react';
 
-import { VideoResponseDTO, PaginatedVideoResponse } from '@/lib/types';
+import { VideoResponseDTO, CursorPaginatedVideoResponse } from '@/lib/types';
 
 const container = {
     hidden: { opacity: 0 },
@@ -23,10 +23,10 @@ export function VideoFeed() {
     const [loading, setLoading] = useState(true);
     const [loadingMore, setLoadingMore] = useState(false);
     const [error, setError] = useState('');
-    const [page, setPage] = useState(1);
+    const [cursor, setCursor] = useState<string | null>(null);
     const [hasMore, setHasMore] = useState(true);
 
-    const fetchVideos = useCallback(async (pageNum: number = 1, append: boolean = false) => {
+    const fetchVideos = useCallback(async (after: string | null = null, append: boolean = false) => {
         try {
             if (append) {
                 setLoadingMore(true);
@@ -34,7 +34,8 @@ export function VideoFeed() {
                 setLoading(true);
             }
 
-            const data: PaginatedVideoResponse = await apiClient(`/videos/?page=${pageNum}&page_size=12`);
+            const query = after ? `&cursor=${encodeURIComponent(after)}` : '';
+            const data: CursorPaginatedVideoResponse = await apiClient(`/videos/latest?limit=12${query}`);
 
             if (append) {
                 setVideos(prev => [...prev, ...data.items]);
@@ -42,8 +43,8 @@ export function VideoFeed() {
                 setVideos(data.items);
             }
 
-            setHasMore(pageNum < data.total_pages);
-            setPage(pageNum);
+            setHasMore(data.has_more);
+            setCursor(data.next_cursor);
         } catch (err) {
             setError('Failed to load videos');
         } finally {
@@ -53,12 +54,12 @@ export function VideoFeed() {
     }, []);
 
     useEffect(() => {
-        fetchVideos(1);
+        fetchVideos();
     }, [fetchVideos]);
 
     const loadMore = () => {
-        if (!loadingMore && hasMore) {
-            fetchVideos(page + 1, true);
+        if (!loadingMore && hasMore && cursor) {
+            fetchVideos(cursor, true);
         }
     };
 
@@ -76,7 +77,7 @@ export function VideoFeed() {
         return (
             <div className="flex flex-col items-center justify-center py-20 text-center">
                 <p className="text-red-500 font-medium mb-4">{error}</p>
-                <button onClick={() => fetchVideos(1)} className="text-blue-500 hover:underline">Try again</button>
+                <button onClick={() => fetchVideos()} className="text-blue-500 hover:underline">Try again</button>
             </div>
         );
     }
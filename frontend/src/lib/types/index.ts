@@ -24,6 +24,12 @@ export interface PaginatedVideoResponse {
     total_pages: number;
 }
 
+export interface CursorPaginatedVideoResponse {
+    items: VideoResponseDTO[];
+    next_cursor: string | null;
+    has_more: boolean;
+}
+
 export interface PaginatedVideos {
     videos: VideoResponseDTO[];
     total: number;